@@ -0,0 +1,398 @@
+"""
+    Name: accuracy_harness.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: Check every fast moon path against golden ephem results
+    The golden dataset holds the MoonClass fields computed the plain
+    way (two new moon searches per instant) for random instants and
+    edge cases: around new moons, around the phase bin boundaries and
+    around century and leap day edges. golden_reading works them out
+    with its own ephem calls, not through moon_stream, so a bug in
+    the code the backends share can not move the reference with it.
+
+    The compact binary file is committed. It records the ephem version
+    that wrote it, and a different ephem is an error, not a reason to
+    quietly regenerate: look at what changed, then --regenerate.
+
+    Each backend reads the same instants. The report shows setup time,
+    time per reading and the max and percentile error of each field,
+    and the exit code is 1 if any field is outside its tolerance.
+
+    Usage:
+        python accuracy_harness.py
+        python accuracy_harness.py --regenerate --count 20000
+"""
+import argparse
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from array import array
+from multiprocessing import Pool
+from typing import Callable, Dict, List, NamedTuple, Tuple
+# pip install ephem
+import ephem
+from lunation_tables import LunationTable
+from moon_cache import MoonCache
+from moon_class import MoonClass
+from moon_stream import LunationTracker, MoonReading, get_phase_index
+
+GOLDEN_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "golden_moon.bin")
+GOLDEN_MAGIC = b"MOONGOLD"
+
+# Instants from 1900 through 2100
+FIRST = float(ephem.Date("1900/1/1"))
+LAST = float(ephem.Date("2100/12/31"))
+
+# Compared fields and the largest error allowed in each
+FIELDS = ("moon_phase", "illumination", "earth_to_moon", "moon_age")
+TOLERANCES = {
+    # Fraction of the lunation, about 0.3 ms of time
+    "moon_phase": 1e-8,
+    # Percent. ephem works out illumination and distance in single
+    # precision, so allow about one float32 step of each
+    "illumination": 1e-5,
+    # AU, about 75 m
+    "earth_to_moon": 5e-10,
+    # Days
+    "moon_age": 1e-6,
+    # Fraction of rows allowed a different phase bin
+    "phase_index": 0.0,
+}
+
+
+class Golden(NamedTuple):
+    """Parallel columns, one row per instant"""
+    instants: array
+    columns: Dict[str, array]
+    phase_index: array
+
+
+# ------------------------- GOLDEN INSTANTS ------------------------------ #
+def golden_instants(count: int = 10_000, seed: int = 42) -> List[float]:
+    """Random instants plus the edge cases, as ephem dates"""
+    rng = random.Random(seed)
+    instants = [rng.uniform(FIRST, LAST) for _ in range(count)]
+
+    second = ephem.second
+    offsets = (-ephem.hour, -ephem.minute, -second,
+               second, ephem.minute, ephem.hour)
+
+    # Around new moons, and around the 8 phase bin boundaries, which
+    # are 1/16 of a lunation either side of each named phase
+    for _ in range(200):
+        new_moon = float(ephem.next_new_moon(rng.uniform(FIRST, LAST)))
+        next_new_moon = float(ephem.next_new_moon(new_moon + 1))
+        length = next_new_moon - new_moon
+        for offset in offsets:
+            instants.append(new_moon + offset)
+        for k in range(8):
+            boundary = new_moon + (k / 8 + 1 / 16) * length
+            instants.extend((boundary - ephem.minute,
+                             boundary + ephem.minute))
+
+    # Century and leap day edges
+    for edge in ("1900/1/1", "2000/1/1", "2100/1/1", "1900/3/1",
+                 "2000/2/29", "2000/3/1", "2100/3/1"):
+        edge = float(ephem.Date(edge))
+        for offset in offsets + (-1.0, 1.0):
+            instants.append(edge + offset)
+    return instants
+
+
+# -------------------------- GOLDEN READING ------------------------------ #
+def golden_reading(dte: float) -> Tuple[float, float, float, float, int]:
+    """
+    (moon_phase, illumination, earth_to_moon, moon_age, phase_index)
+    at dte, written out step by step with ephem and nothing shared
+    with the backends under test
+    """
+    observer = ephem.Observer()
+    observer.date = dte
+    moon = ephem.Moon()
+    moon.compute(observer)
+    previous_new_moon = float(ephem.previous_new_moon(dte))
+    next_new_moon = float(ephem.next_new_moon(dte))
+    moon_phase = (dte - previous_new_moon) / \
+        (next_new_moon - previous_new_moon)
+    # Eighths of the lunation, rounded to the nearest named phase
+    phase_index = int(moon_phase * 8 + 0.5) % 8
+    return (moon_phase, float(moon.phase), float(moon.earth_distance),
+            dte - previous_new_moon, phase_index)
+
+
+# --------------------------- GOLDEN FILE -------------------------------- #
+def generate(count: int = 10_000, path: str = GOLDEN_FILE) -> Golden:
+    """Compute the reference readings and save them"""
+    instants = golden_instants(count)
+    with Pool() as pool:
+        readings = pool.map(golden_reading, instants, chunksize=256)
+
+    golden = Golden(
+        array("d", instants),
+        {field: array("d", (r[i] for r in readings))
+         for i, field in enumerate(FIELDS)},
+        array("b", (r[4] for r in readings)),
+    )
+
+    # Header: magic, ephem version, row count, then the compressed
+    # columns one after the other
+    version = ephem.__version__.encode()
+    body = golden.instants.tobytes() + b"".join(
+        golden.columns[field].tobytes() for field in FIELDS
+    ) + golden.phase_index.tobytes()
+    with open(path, "wb") as f:
+        f.write(GOLDEN_MAGIC)
+        f.write(struct.pack("<B", len(version)) + version)
+        f.write(struct.pack("<I", len(instants)))
+        f.write(zlib.compress(body, 9))
+    return golden
+
+
+def load(path: str = GOLDEN_FILE) -> Golden:
+    """
+    Read the golden file. ValueError if it is not one, or was written
+    by another ephem version.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data.startswith(GOLDEN_MAGIC):
+        raise ValueError(f"{path} is not a golden data file")
+    offset = len(GOLDEN_MAGIC)
+    size = data[offset]
+    version = data[offset + 1:offset + 1 + size].decode()
+    if version != ephem.__version__:
+        raise ValueError(
+            f"{path} was made with ephem {version}, this is ephem "
+            f"{ephem.__version__}. Check what the new ephem changes, "
+            f"then run with --regenerate and commit the new file.")
+    offset += 1 + size
+    count = struct.unpack_from("<I", data, offset)[0]
+    body = zlib.decompress(data[offset + 4:])
+
+    def column(index: int) -> array:
+        values = array("d")
+        values.frombytes(body[index * count * 8:(index + 1) * count * 8])
+        return values
+
+    phase_index = array("b")
+    phase_index.frombytes(body[(len(FIELDS) + 1) * count * 8:])
+    return Golden(
+        column(0),
+        {field: column(i) for i, field in enumerate(FIELDS, 1)},
+        phase_index,
+    )
+
+
+# ----------------------------- BACKENDS --------------------------------- #
+# name -> (setup function, tolerances). Setup gets the instants and
+# returns a function that reads them all, so setup and reading are
+# timed apart.
+Backend = Callable[[List[float]], Callable[[], List]]
+BACKENDS: Dict[str, Tuple[Backend, Dict[str, float]]] = {}
+
+
+def backend(name: str, **tolerances: float):
+    """Register a backend, tolerances override the defaults by field"""
+    def register(setup: Backend) -> Backend:
+        BACKENDS[name] = (setup, {**TOLERANCES, **tolerances})
+        return setup
+    return register
+
+
+@backend("tracker, time order")
+def _tracker_sorted(instants):
+    # A tracker is meant for stepping through time, so read in order
+    order = sorted(range(len(instants)), key=instants.__getitem__)
+    tracker = LunationTracker()
+
+    def read():
+        readings = [None] * len(instants)
+        for i in order:
+            readings[i] = tracker.reading(instants[i])
+        return readings
+    return read
+
+
+@backend("tracker, random order")
+def _tracker_random(instants):
+    tracker = LunationTracker()
+    return lambda: [tracker.reading(dte) for dte in instants]
+
+
+@backend("lunation table")
+def _table(instants):
+    table = LunationTable.build(min(instants) - 1, max(instants) + 1)
+    return lambda: [table.reading(dte) for dte in instants]
+
+
+@backend("moon cache, warm")
+def _cache(instants):
+    # Fill a throw away cache, then read back through SQLite
+    # The directory goes with the db and any -wal and -shm files
+    directory = tempfile.TemporaryDirectory()
+    path = os.path.join(directory.name, "harness_cache.db")
+    cache = MoonCache(path, max_rows=len(instants) * 2)
+    cache.readings(instants)
+    cache.flush()
+
+    def read():
+        try:
+            return cache.readings(instants)
+        finally:
+            cache.close()
+            directory.cleanup()
+    return read
+
+
+def _moon_class(precision: str):
+    """Setup for MoonClass.get_observer at one precision tier"""
+    def setup(instants):
+        moon = MoonClass(gui_mode=False, precision=precision)
+        # get_observer moves a date it is given to 12 noon
+        dates = [ephem.Date(dte - 0.5).datetime() for dte in instants]
+
+        def read():
+            readings = []
+            for dte in dates:
+                moon.get_observer(dte)
+                readings.append(MoonReading(
+                    dte, moon.moon_phase, moon.illumination,
+                    moon.earth_to_moon, moon.moon_age,
+                    get_phase_index(moon.moon_phase)
+                ))
+            return readings
+        return read
+    return setup
+
+
+backend("MoonClass standard")(_moon_class("standard"))
+# Analytic series, distance is from the earth's center where the
+# standard tier measures from ephem's default observer at 0, 0
+backend("MoonClass coarse", moon_phase=5e-5, illumination=0.5,
+        earth_to_moon=5e-5, moon_age=2e-3,
+        phase_index=0.005)(_moon_class("coarse"))
+# Observer at the MoonClass default location instead of 0, 0
+backend("MoonClass precise", earth_to_moon=1e-4)(_moon_class("precise"))
+
+
+# ------------------------------ COMPARE --------------------------------- #
+def percentile(values: List[float], fraction: float) -> float:
+    """values must be sorted"""
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def field_errors(golden: Golden, readings, field: str) -> List[float]:
+    expected = golden.columns[field]
+    phases = golden.columns["moon_phase"]
+    errors = []
+    for want, phase, reading in zip(expected, phases, readings):
+        error = abs(getattr(reading, field) - want)
+        if field == "moon_phase":
+            # 0.999999 and 0.000001 are both a new moon
+            error = min(error, 1 - error)
+        elif field == "moon_age" and error > 15:
+            # Within minutes of a new moon the two sides can put the
+            # instant in neighbouring lunations. Measure against the
+            # later end of the older lunation instead.
+            if reading.moon_phase > 0.5:
+                length = reading.moon_age / reading.moon_phase
+            else:
+                length = want / phase
+            error = abs(error - length)
+        errors.append(error)
+    errors.sort()
+    return errors
+
+
+def check(golden: Golden, name: str, setup: Backend,
+          tolerances: Dict[str, float] = TOLERANCES) -> bool:
+    """Run one backend and print its row of the report"""
+    instants = list(golden.instants)
+    t = time.perf_counter()
+    read = setup(instants)
+    setup_time = time.perf_counter() - t
+    t = time.perf_counter()
+    readings = read()
+    read_time = time.perf_counter() - t
+
+    print(f"\n{name}: setup {setup_time:.2f} s, "
+          f"{read_time / len(instants) * 1e6:.1f} us/reading")
+    passed = True
+    for field in FIELDS:
+        errors = field_errors(golden, readings, field)
+        ok = errors[-1] <= tolerances[field]
+        passed = passed and ok
+        print(
+            f"    {field:<14} max {errors[-1]:9.2e}  "
+            f"p99 {percentile(errors, 0.99):9.2e}  "
+            f"p50 {percentile(errors, 0.5):9.2e}  "
+            f"{'ok' if ok else 'FAIL'}"
+        )
+    mismatches = sum(
+        reading.phase_index != want
+        for reading, want in zip(readings, golden.phase_index)
+    )
+    ok = mismatches <= tolerances["phase_index"] * len(readings)
+    passed = passed and ok
+    print(f"    {'phase_index':<14} {mismatches} mismatches  "
+          f"{'ok' if ok else 'FAIL'}")
+    return passed
+
+
+def reference_time(golden: Golden, sample: int = 500) -> float:
+    """Seconds per reading of the plain ephem path"""
+    instants = golden.instants[:sample]
+    t = time.perf_counter()
+    for dte in instants:
+        golden_reading(dte)
+    return (time.perf_counter() - t) / len(instants)
+
+
+# ------------------------------ MAIN ------------------------------------ #
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check the fast moon paths against golden data")
+    parser.add_argument("--regenerate", action="store_true",
+                        help="compute the golden data again, after an "
+                        "ephem upgrade has been checked")
+    parser.add_argument("--count", type=int, default=10_000,
+                        help="random instants in new golden data")
+    parser.add_argument("--backend", action="append",
+                        help="only check this backend, can repeat")
+    args = parser.parse_args()
+
+    if args.regenerate:
+        t = time.perf_counter()
+        golden = generate(args.count)
+        print(f"Generated {len(golden.instants)} golden readings in "
+              f"{time.perf_counter() - t:.1f} s, "
+              f"{os.path.getsize(GOLDEN_FILE):,} bytes")
+    else:
+        try:
+            golden = load()
+        except (OSError, ValueError) as e:
+            sys.exit(f"accuracy_harness: {e}")
+
+    # The golden phase index must agree with its own moon phase
+    assert all(get_phase_index(phase) == index for phase, index in
+               zip(golden.columns["moon_phase"], golden.phase_index))
+
+    print(f"{len(golden.instants)} instants, ephem {ephem.__version__}, "
+          f"reference {reference_time(golden) * 1e6:.1f} us/reading")
+    passed = True
+    for name, (setup, tolerances) in BACKENDS.items():
+        if args.backend and name not in args.backend:
+            continue
+        passed = check(golden, name, setup, tolerances) and passed
+    print("\nAll backends within tolerance" if passed
+          else "\nSome backends are outside tolerance")
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+"""
+    Name: apsides.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: Every perigee and apogee of the moon, with supermoons
+    The earth to moon distance is sampled every 3 days, far apart
+    next to the 27.55 day anomalistic month but close enough that each
+    perigee and apogee lands between two samples. Brent's method
+    (parabola steps, golden section steps when a parabola is not
+    trusted) then finds it to within ten minutes or so, the distance is
+    flat there, and its distance to the kilometer.
+
+    Every perigee and apogee is matched to the new or full moon
+    nearest to it. A new or full moon closer than 360,000 km is a
+    supermoon, one farther than 405,000 km a micromoon.
+
+    Distances are from the earth's center. MoonClass.earth_to_moon is
+    seen from ephem's default observer at 0, 0, up to an earth radius
+    different.
+
+    Results are kept in arrays, 35 bytes an apsis.
+
+    Usage:
+        python apsides.py 2024 2026
+        python apsides.py 1900 2100 --super
+"""
+import argparse
+import datetime
+import math
+import time
+from array import array
+from typing import Callable, Dict, Iterator, NamedTuple, Tuple
+# pip install ephem
+import ephem
+import moon_meeus
+from lunation_tables import EVENT_NAMES, FULL, NEW
+
+PERIGEE, APOGEE = 0, 1
+APSIS_NAMES = ("Perigee", "Apogee")
+# Values of the moon_class column
+ORDINARY, SUPERMOON, MICROMOON = 0, 1, 2
+MOON_CLASS_NAMES = ("", "Supermoon", "Micromoon")
+
+SUPERMOON_KM = 360000
+MICROMOON_KM = 405000
+
+# Days between distance samples. Perigee and apogee are at least
+# 12 days apart, so no two land between the same three samples.
+STEP = 3.0
+# The search stops when the bracket is this small, in days. The
+# distance is flat around an extremum and ephem gives it in single
+# precision, so the time of an apsis is only good to about 10 minutes.
+TOLERANCE = 5 * ephem.minute
+
+# Column name -> array type code
+COLUMNS = {
+    # ephem dates
+    "date": "d",
+    "distance_km": "d",
+    "kind": "b",
+    # The new or full moon nearest the apsis
+    "moon_date": "d",
+    "moon_phase": "b",
+    "moon_distance_km": "d",
+    "moon_class": "b",
+}
+
+# Golden section step, as a fraction of the larger part of the bracket
+_GOLDEN_STEP = (3 - math.sqrt(5)) / 2
+
+
+class Apsis(NamedTuple):
+    """One row of an ApsisTable"""
+    date: datetime.datetime
+    distance_km: float
+    # PERIGEE or APOGEE
+    kind: int
+    moon_date: datetime.datetime
+    # lunation_tables.NEW or FULL
+    moon_phase: int
+    moon_distance_km: float
+    # ORDINARY, SUPERMOON or MICROMOON
+    moon_class: int
+
+    def __str__(self) -> str:
+        label = MOON_CLASS_NAMES[self.moon_class]
+        return (
+            f"{self.date:%Y-%m-%d %H:%M}  {APSIS_NAMES[self.kind]:<8}"
+            f"{self.distance_km:>10,.0f} km   "
+            f"{EVENT_NAMES[self.moon_phase]:<9} "
+            f"{self.moon_date:%Y-%m-%d %H:%M} "
+            f"{self.moon_distance_km:>10,.0f} km  {label}"
+        ).rstrip()
+
+
+def brent_minimum(f: Callable[[float], float], low: Tuple[float, float],
+                  best: Tuple[float, float], high: Tuple[float, float],
+                  tolerance: float = TOLERANCE) -> Tuple[float, float]:
+    """
+    (x, f(x)) where f is least, Brent's method. Steps to the vertex of
+    a parabola through the best three points so far, and falls back to
+    a golden section step when the parabola is not trusted. f must
+    have one minimum in the bracket.
+
+    Args:
+        low, best, high: (x, f(x)) of the bracket's ends and of a point
+            between them lower than both
+    """
+    (a, fa), (x, fx), (b, fb) = low, best, high
+    # The first step is the parabola through the three given points
+    w, fw, v, fv = (a, fa, b, fb) if fa < fb else (b, fb, a, fa)
+    # The last two steps, a parabola step must be under half of the
+    # one before the last or the search could stall
+    d, e = 0.0, b - a
+    half_tol = tolerance / 2
+    while abs(x - (a + b) / 2) > tolerance - (b - a) / 2:
+        middle = (a + b) / 2
+        parabola = False
+        if abs(e) > half_tol:
+            r = (x - w) * (fx - fv)
+            q = (x - v) * (fx - fw)
+            p = (x - v) * q - (x - w) * r
+            q = 2 * (q - r)
+            if q > 0:
+                p = -p
+            q = abs(q)
+            if abs(p) < abs(q * e / 2) and q * (a - x) < p < q * (b - x):
+                e, d = d, p / q
+                parabola = True
+                # Never evaluate right next to an end of the bracket
+                if (x + d) - a < tolerance or b - (x + d) < tolerance:
+                    d = half_tol if middle > x else -half_tol
+        if not parabola:
+            e = (a - x) if x >= middle else (b - x)
+            d = _GOLDEN_STEP * e
+        u = x + (d if abs(d) >= half_tol else
+                 (half_tol if d > 0 else -half_tol))
+        fu = f(u)
+        if fu <= fx:
+            if u >= x:
+                a = x
+            else:
+                b = x
+            v, fv, w, fw, x, fx = w, fw, x, fx, u, fu
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if fu <= fw or w == x:
+                v, fv, w, fw = w, fw, u, fu
+            elif fu <= fv or v == x or v == w:
+                v, fv = u, fu
+    return x, fx
+
+
+# ---------------------------- APSIS TABLE ------------------------------- #
+class ApsisTable:
+    """
+    Example Usage:
+        table = ApsisTable.find("2024/1/1", "2025/1/1")
+        for apsis in table.supermoons():
+            print(apsis.moon_date, apsis.moon_distance_km)
+    """
+
+    def __init__(self) -> None:
+        self._columns: Dict[str, array] = {
+            name: array(code) for name, code in COLUMNS.items()}
+        # Distance computations, for benchmarks
+        self.computations = 0
+        self._moon = ephem.Moon()
+
+    def _distance(self, dte: float) -> float:
+        """Geocentric distance in km"""
+        self.computations += 1
+        self._moon.compute(dte)
+        return self._moon.earth_distance * moon_meeus.KM_PER_AU
+
+# ------------------------------- FIND ----------------------------------- #
+    @classmethod
+    def find(cls, start, end) -> "ApsisTable":
+        """Every perigee and apogee from start up to end"""
+        table = cls()
+        start = float(ephem.Date(start))
+        end = float(ephem.Date(end))
+        # Samples before, at and after the middle one
+        t0, t1 = start - STEP, start
+        d0, d1 = table._distance(t0), table._distance(t1)
+        while t1 < end + STEP:
+            t2 = t1 + STEP
+            d2 = table._distance(t2)
+            if d1 < d0 and d1 <= d2:
+                table._add((t0, d0), (t1, d1), (t2, d2), kind=PERIGEE,
+                           start=start, end=end)
+            elif d1 > d0 and d1 >= d2:
+                table._add((t0, d0), (t1, d1), (t2, d2), kind=APOGEE,
+                           start=start, end=end)
+            t0, d0, t1, d1 = t1, d1, t2, d2
+        return table
+
+    def _add(self, *samples: Tuple[float, float], kind: int,
+             start: float, end: float):
+        # Apogee is the least of minus the distance
+        sign = 1 if kind == PERIGEE else -1
+        dte, distance = brent_minimum(
+            lambda t: sign * self._distance(t),
+            *((t, sign * d) for t, d in samples))
+        if not start <= dte < end:
+            return
+        moon_date, moon_phase = nearest_syzygy(dte)
+        moon_distance = self._distance(moon_date)
+        if kind == PERIGEE and moon_distance < SUPERMOON_KM:
+            moon_class = SUPERMOON
+        elif kind == APOGEE and moon_distance > MICROMOON_KM:
+            moon_class = MICROMOON
+        else:
+            moon_class = ORDINARY
+        row = (dte, sign * distance, kind, moon_date, moon_phase,
+               moon_distance, moon_class)
+        for column, value in zip(self._columns.values(), row):
+            column.append(value)
+
+# ------------------------------- ROWS ----------------------------------- #
+    def __len__(self) -> int:
+        return len(self._columns["date"])
+
+    def __getitem__(self, index: int) -> Apsis:
+        values = [column[index] for column in self._columns.values()]
+        values[0] = ephem.Date(values[0]).datetime()
+        values[3] = ephem.Date(values[3]).datetime()
+        return Apsis(*values)
+
+    def __iter__(self) -> Iterator[Apsis]:
+        for i in range(len(self)):
+            yield self[i]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.itemsize * len(column)
+                   for column in self._columns.values())
+
+    def column(self, name: str) -> memoryview:
+        """Read only view of a column, no copy"""
+        return memoryview(self._columns[name]).toreadonly()
+
+    def supermoons(self) -> Iterator[Apsis]:
+        return self._with_class(SUPERMOON)
+
+    def micromoons(self) -> Iterator[Apsis]:
+        return self._with_class(MICROMOON)
+
+    def _with_class(self, moon_class: int) -> Iterator[Apsis]:
+        for i, value in enumerate(self._columns["moon_class"]):
+            if value == moon_class:
+                yield self[i]
+
+
+# -------------------------- NEAREST SYZYGY ------------------------------ #
+def nearest_syzygy(dte: float):
+    """
+    (ephem date, NEW or FULL) of the new or full moon nearest dte.
+    The analytic new moons pick which one, then ephem's search,
+    started a day early, finds its time.
+    """
+    jd = dte + moon_meeus.DUBLIN_JD
+    previous, following = moon_meeus.lunation_bounds(jd)
+    # The full moon is within a day of half way
+    guesses = ((previous, NEW), ((previous + following) / 2, FULL),
+               (following, NEW))
+    guess, phase = min(guesses, key=lambda g: abs(g[0] - jd))
+    search = ephem.next_new_moon if phase == NEW else ephem.next_full_moon
+    return float(search(guess - moon_meeus.DUBLIN_JD - 1)), phase
+
+
+# ------------------------------ MAIN ------------------------------------ #
+def main():
+    parser = argparse.ArgumentParser(
+        description="Perigees and apogees, with supermoons and micromoons")
+    parser.add_argument("first", type=int, help="first year")
+    parser.add_argument("last", type=int, help="last year")
+    parser.add_argument("--super", action="store_true",
+                        help="only supermoons and micromoons")
+    args = parser.parse_args()
+    if args.last < args.first:
+        parser.error("last must not be before first")
+
+    t = time.perf_counter()
+    table = ApsisTable.find(datetime.datetime(args.first, 1, 1),
+                            datetime.datetime(args.last + 1, 1, 1))
+    seconds = time.perf_counter() - t
+    for apsis in table:
+        if not args.super or apsis.moon_class != ORDINARY:
+            print(apsis)
+    supermoons = sum(1 for _ in table.supermoons())
+    micromoons = sum(1 for _ in table.micromoons())
+    print(f"\n{len(table)} perigees and apogees, {supermoons} supermoons, "
+          f"{micromoons} micromoons in {seconds:.2f} s, "
+          f"{table.computations / len(table):.0f} distances an apsis, "
+          f"{table.nbytes:,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+    Name: build_assets.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: Headless build of moon_icon.py from the images in assets/
+    Replaces copying one image at a time to the clipboard with
+    image_encoder_gui.py and pasting it into moon_icon.py by hand.
+    Each image is hashed, and only images that changed since the last
+    build are encoded again. With nothing changed the build does not
+    write anything.
+
+    Usage:
+        python build_assets.py               # build moon_icon.py
+        python build_assets.py --size 57     # resize to 57 x 57 pixels
+        python build_assets.py --optimize    # recompress the PNGs
+        python build_assets.py --force       # encode every image
+
+    --size and --optimize need Pillow: pip install pillow
+"""
+import argparse
+import ast
+import hashlib
+import io
+import json
+import os
+import sys
+from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(BASE_DIR, "assets")
+OUTPUT = os.path.join(BASE_DIR, "moon_icon.py")
+MANIFEST = os.path.join(ASSETS_DIR, "build_manifest.json")
+IMAGE_TYPES = (".png", ".gif")
+
+HEADER = """\
+# For including program icons with Nuitka. Nuitka onefile doesn't work quite right with ico files.
+# Got to https://pythonassets.com/posts/window-icon-in-tk-tkinter, about in the middle where the paragraph starts out with "A second less elegant, but . . .""
+# Another resource: https://reshmaharidhas.medium.com/how-to-pack-images-in-python-tkinter-file-to-an-exe-file-c867637d7e80
+# Images from assets/ are generated by build_assets.py, do not edit them by hand
+"""
+
+
+# --------------------------- FILE HASH ---------------------------------- #
+def file_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+# --------------------------- ENCODE IMAGE ------------------------------- #
+def encode_image(path: str, size: Optional[int] = None,
+                 optimize: bool = False) -> str:
+    """Base64 text of an image, resized and recompressed if asked"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if size or optimize:
+        # Pillow is only needed for these options
+        from PIL import Image
+        image = Image.open(io.BytesIO(data))
+        if size:
+            image = image.resize((size, size), Image.LANCZOS)
+        out = io.BytesIO()
+        image.save(out, format=image.format or "PNG", optimize=optimize)
+        data = out.getvalue()
+    return b64encode(data).decode("ascii")
+
+
+# --------------------------- READ MODULE -------------------------------- #
+def read_module(path: str) -> Dict[str, str]:
+    """Name -> string for every string assignment in an existing module"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    values = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and \
+                isinstance(node.value, ast.Constant) and \
+                isinstance(node.value.value, str):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    values[target.id] = node.value.value
+    return values
+
+
+def write_module(path: str, values: Dict[str, str]) -> str:
+    text = HEADER + "".join(
+        f'{name} = """{value}"""\n' for name, value in values.items())
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(text)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# ------------------------------ BUILD ----------------------------------- #
+def build(size: Optional[int] = None, optimize: bool = False,
+          force: bool = False, output: str = OUTPUT,
+          manifest_path: str = MANIFEST) -> bool:
+    """
+    Build output from the images in assets/.
+    Returns True if output was written, False if it was up to date.
+    """
+    options = {"size": size, "optimize": optimize}
+    manifest = {}
+    if os.path.exists(manifest_path) and not force:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    old_files = manifest.get("files", {})
+    old_values = read_module(output)
+
+    # Each image becomes a variable named after the file
+    images = {}
+    for filename in sorted(os.listdir(ASSETS_DIR)):
+        name, extension = os.path.splitext(filename)
+        if extension.lower() not in IMAGE_TYPES:
+            continue
+        if not name.isidentifier():
+            print(f"Skipped {filename}: not a valid Python name")
+            continue
+        images[name] = os.path.join(ASSETS_DIR, filename)
+
+    with ThreadPoolExecutor() as pool:
+        hashes = dict(zip(images, pool.map(file_hash, images.values())))
+
+    # Unchanged images with the same options keep their encoded text
+    changed = [
+        name for name, digest in hashes.items()
+        if force or name not in old_values
+        or old_files.get(name) != {"sha256": digest, **options}
+    ]
+
+    output_current = os.path.exists(output) and \
+        file_hash(output) == manifest.get("output_sha256")
+    if not changed and output_current and \
+            set(old_files) == set(images):
+        print(f"{os.path.basename(output)} is up to date")
+        return False
+
+    with ThreadPoolExecutor() as pool:
+        encoded = dict(zip(changed, pool.map(
+            lambda name: encode_image(images[name], size, optimize),
+            changed)))
+
+    # Values that do not come from assets/, like the window icons,
+    # are carried over first, then the images in name order
+    values = {
+        name: value for name, value in old_values.items()
+        if name not in images and name not in old_files
+    }
+    for name in images:
+        values[name] = encoded.get(name, old_values.get(name))
+
+    output_sha256 = write_module(output, values)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "files": {name: {"sha256": hashes[name], **options}
+                      for name in images},
+            "output_sha256": output_sha256,
+        }, f, indent=4)
+
+    # Report
+    for name in changed:
+        print(f"Encoded {name:<18} {len(encoded[name]):>8,} bytes")
+    print(f"Wrote {os.path.basename(output)}: "
+          f"{os.path.getsize(output):,} bytes, "
+          f"{len(values)} images, {len(changed)} encoded")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build moon_icon.py from the images in assets/")
+    parser.add_argument("--size", type=int,
+                        help="resize images to size x size pixels")
+    parser.add_argument("--optimize", action="store_true",
+                        help="recompress images")
+    parser.add_argument("--force", action="store_true",
+                        help="encode every image even if unchanged")
+    parser.add_argument("--output", default=OUTPUT,
+                        help="module to write, default moon_icon.py")
+    args = parser.parse_args()
+    try:
+        build(args.size, args.optimize, args.force, args.output)
+    except ImportError:
+        sys.exit("--size and --optimize need Pillow: pip install pillow")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""
+    Name: date_picker.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: Minimal month date picker drawn on a single canvas
+    A light replacement for tkcalendar.Calendar. All 42 day cells are
+    canvas items created once and reconfigured when the month changes.
+    One click binding and one hover binding on the canvas find the day
+    from the mouse position, hovering a day shows its calevent text in
+    a tooltip drawn on the same canvas. It supports the parts of the
+    Calendar API the moon phase GUI uses: selection, displayed month,
+    calevents and tag colors.
+"""
+import calendar
+import datetime
+import tkinter as tk
+from typing import Dict, List, Optional
+
+CELL_WIDTH = 40
+CELL_HEIGHT = 24
+HEADER = 28
+WEEKDAYS = 20
+
+
+class DatePicker(tk.Canvas):
+    """
+    Virtual events, same names as tkcalendar:
+        <<CalendarSelected>>      a day was clicked
+        <<CalendarMonthChanged>>  another month is displayed
+    """
+
+    def __init__(self, master, date: Optional[datetime.date] = None,
+                 **kw) -> None:
+        kw.setdefault("width", CELL_WIDTH * 7)
+        kw.setdefault("height", HEADER + WEEKDAYS + CELL_HEIGHT * 6)
+        kw.setdefault("background", "white")
+        kw.setdefault("highlightthickness", 0)
+        super().__init__(master, **kw)
+
+        self._selected = date or datetime.date.today()
+        self._year = self._selected.year
+        self._month = self._selected.month
+        # Weeks start on Sunday like the tkcalendar setup it replaces
+        self._calendar = calendar.Calendar(firstweekday=6)
+
+        # date -> list of events, each a dict of text and tags
+        self._events: Dict[datetime.date, List[dict]] = {}
+        # tag -> {"background": ..., "foreground": ...}
+        self._tags: Dict[str, dict] = {}
+
+        self._create_items()
+        self.bind("<Button-1>", self._click)
+        self.bind("<Motion>", self._hover)
+        self.bind("<Leave>", lambda event: self._hide_tooltip())
+        self._draw_month()
+
+# ------------------------- CREATE ITEMS --------------------------------- #
+    def _create_items(self):
+        width = CELL_WIDTH * 7
+        self._title = self.create_text(
+            width // 2, HEADER // 2, font=("TkDefaultFont", 10, "bold"))
+        self.create_text(12, HEADER // 2, text="◀")
+        self.create_text(width - 12, HEADER // 2, text="▶")
+
+        for column, name in enumerate(
+                calendar.day_abbr[(6 + i) % 7] for i in range(7)):
+            self.create_text(
+                column * CELL_WIDTH + CELL_WIDTH // 2,
+                HEADER + WEEKDAYS // 2,
+                text=name[:2], fill="gray40"
+            )
+
+        # Rectangle and number for each of the 6 x 7 day cells
+        self._cells = []
+        for row in range(6):
+            for column in range(7):
+                x = column * CELL_WIDTH
+                y = HEADER + WEEKDAYS + row * CELL_HEIGHT
+                box = self.create_rectangle(
+                    x + 1, y + 1, x + CELL_WIDTH - 1, y + CELL_HEIGHT - 1,
+                    width=0
+                )
+                text = self.create_text(
+                    x + CELL_WIDTH // 2, y + CELL_HEIGHT // 2)
+                self._cells.append((box, text))
+
+        self._selection = self.create_rectangle(
+            0, 0, 0, 0, outline="royal blue", width=2)
+
+        # Tooltip, created last so it is drawn over the day cells
+        self._tip_box = self.create_rectangle(
+            0, 0, 0, 0, fill="light yellow", outline="gray40",
+            state=tk.HIDDEN)
+        self._tip_text = self.create_text(
+            0, 0, anchor=tk.NW, width=width - 8, state=tk.HIDDEN)
+        self._tip_date = None
+
+# --------------------------- DRAW MONTH --------------------------------- #
+    def _draw_month(self):
+        self.itemconfigure(
+            self._title,
+            text=f"{calendar.month_name[self._month]} {self._year}"
+        )
+        self._days = list(
+            self._calendar.itermonthdates(self._year, self._month))
+        # Always 6 rows, pad short months with the following days
+        while len(self._days) < 42:
+            self._days.append(self._days[-1] + datetime.timedelta(days=1))
+
+        for date, (box, text) in zip(self._days, self._cells):
+            self._draw_day(date, box, text)
+        self._draw_selection()
+        self._hide_tooltip()
+
+    def _draw_day(self, date, box, text):
+        in_month = date.month == self._month
+        background = ""
+        foreground = "black" if in_month else "gray60"
+        # The last event with tags decides the colors, like tkcalendar
+        for event in reversed(self._events.get(date, ())):
+            if event["tags"] and in_month:
+                props = self._tags.get(event["tags"][-1], {})
+                background = props.get("background", "royal blue")
+                foreground = props.get("foreground", "white")
+                break
+        self.itemconfigure(box, fill=background)
+        self.itemconfigure(text, text=str(date.day), fill=foreground)
+
+    def _draw_selection(self):
+        if self._selected in self._days:
+            i = self._days.index(self._selected)
+            x = (i % 7) * CELL_WIDTH
+            y = HEADER + WEEKDAYS + (i // 7) * CELL_HEIGHT
+            self.coords(self._selection, x + 1, y + 1,
+                        x + CELL_WIDTH - 1, y + CELL_HEIGHT - 1)
+            self.itemconfigure(self._selection, state=tk.NORMAL)
+        else:
+            self.itemconfigure(self._selection, state=tk.HIDDEN)
+
+    def _redraw_date(self, date):
+        if date in self._days:
+            box, text = self._cells[self._days.index(date)]
+            self._draw_day(date, box, text)
+
+# ----------------------------- CLICK ------------------------------------ #
+    def _day_at(self, x: int, y: int) -> Optional[datetime.date]:
+        """The day cell under canvas position x, y"""
+        if y < HEADER + WEEKDAYS:
+            return None
+        row = (y - HEADER - WEEKDAYS) // CELL_HEIGHT
+        column = x // CELL_WIDTH
+        if not (0 <= row < 6 and 0 <= column < 7):
+            return None
+        return self._days[row * 7 + column]
+
+    def _click(self, event):
+        """The one click binding, works out what was clicked from x and y"""
+        if event.y < HEADER:
+            if event.x < CELL_WIDTH:
+                self.show_month(self._year, self._month - 1)
+            elif event.x > CELL_WIDTH * 6:
+                self.show_month(self._year, self._month + 1)
+            return
+        date = self._day_at(event.x, event.y)
+        if date is None:
+            return
+        self.selection_set(date)
+        if date.month != self._month:
+            self.see(date)
+        self.event_generate("<<CalendarSelected>>")
+
+# ----------------------------- HOVER ------------------------------------ #
+    def _hover(self, event):
+        """Show the calevent text of the day under the mouse"""
+        date = self._day_at(event.x, event.y)
+        texts = self.get_calevent_text(date) if date else []
+        if not texts:
+            self._hide_tooltip()
+            return
+        if date != self._tip_date:
+            self._tip_date = date
+            self.itemconfigure(self._tip_text, text="\n".join(texts),
+                               state=tk.NORMAL)
+        # Below and right of the pointer, kept inside the canvas
+        self.coords(self._tip_text, 0, 0)
+        _, _, width, height = self.bbox(self._tip_text)
+        x = min(event.x + 12, int(self["width"]) - width - 4)
+        y = event.y + 16
+        if y + height > int(self["height"]) - 4:
+            y = event.y - height - 8
+        self.coords(self._tip_text, max(x, 4), y)
+        x0, y0, x1, y1 = self.bbox(self._tip_text)
+        self.coords(self._tip_box, x0 - 3, y0 - 2, x1 + 3, y1 + 2)
+        self.itemconfigure(self._tip_box, state=tk.NORMAL)
+
+    def _hide_tooltip(self):
+        self._tip_date = None
+        self.itemconfigure(self._tip_box, state=tk.HIDDEN)
+        self.itemconfigure(self._tip_text, state=tk.HIDDEN)
+
+# ---------------------------- PUBLIC API -------------------------------- #
+    def show_month(self, year: int, month: int):
+        """Display a month, month may run past 1 - 12"""
+        year, month = year + (month - 1) // 12, (month - 1) % 12 + 1
+        if (year, month) == (self._year, self._month):
+            return
+        self._year, self._month = year, month
+        self._draw_month()
+        self.event_generate("<<CalendarMonthChanged>>")
+
+    def see(self, date: datetime.date):
+        self.show_month(date.year, date.month)
+
+    def selection_get(self) -> datetime.date:
+        return self._selected
+
+    def selection_set(self, date: datetime.date):
+        if isinstance(date, datetime.datetime):
+            date = date.date()
+        self._selected = date
+        self._draw_selection()
+
+    def get_displayed_month(self):
+        """(month, year) like tkcalendar"""
+        return self._month, self._year
+
+    def calevent_create(self, date, text: str, tags=()) -> None:
+        if isinstance(date, datetime.datetime):
+            date = date.date()
+        tags = [tags] if isinstance(tags, str) else list(tags)
+        self._events.setdefault(date, []).append(
+            {"text": text, "tags": tags})
+        self._redraw_date(date)
+
+    def calevent_remove(self, tag: str = None, date=None):
+        """Remove events with tag and/or on date, all if neither given"""
+        dates = [date] if date is not None else list(self._events)
+        for day in dates:
+            events = [e for e in self._events.get(day, ())
+                      if tag is not None and tag not in e["tags"]]
+            if events:
+                self._events[day] = events
+            else:
+                self._events.pop(day, None)
+            self._redraw_date(day)
+
+    def get_calevent_text(self, date) -> List[str]:
+        return [event["text"] for event in self._events.get(date, ())]
+
+    def tag_config(self, tag: str, **kw):
+        """Day colors for a tag, background and foreground"""
+        self._tags.setdefault(tag, {}).update(kw)
@@ -0,0 +1,286 @@
+"""
+    Name: eclipses.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: Find solar and lunar eclipses over any span of years
+    An eclipse needs a new or full moon close to one of the moon's
+    nodes. Every new and full moon is numbered with the analytic
+    series in moon_meeus.py, and its argument of latitude F says how
+    far it is from a node. Only the ones with |sin F| under 0.36 are
+    candidates (Meeus chapter 54), about one in four. For those, ephem
+    positions of the sun and moon find greatest eclipse and the type.
+
+    Greatest eclipse is where the moon is closest to the sun (solar)
+    or to the center of the earth's shadow (lunar), as seen from the
+    earth's center. Near that time the square of the distance is a
+    parabola in time, so a few parabola fits find it.
+
+    Shadow sizes use Danjon's rule (1.01 times the moon's parallax),
+    the same as the NASA eclipse canons. The earth is a sphere here,
+    so eclipses within a few arc seconds of a type limit can be given
+    the neighbouring type.
+
+    Usage:
+        python eclipses.py 2024 2030
+        python eclipses.py 2001 2100 --solar
+        python eclipses.py --benchmark
+"""
+import argparse
+import datetime
+import math
+import time
+from typing import Iterator, NamedTuple, Optional
+# pip install ephem
+import ephem
+import moon_meeus
+
+EARTH_RADIUS_KM = 6378.14
+# Beyond this the new or full moon is too far from a node to eclipse
+NODE_LIMIT = 0.36
+
+# Type names, from the most to the least central
+SOLAR_TYPES = ("total", "hybrid", "annular", "partial")
+LUNAR_TYPES = ("total", "partial", "penumbral")
+
+
+class Eclipse(NamedTuple):
+    # Greatest eclipse, UTC
+    date: datetime.datetime
+    # "solar" or "lunar"
+    body: str
+    # One of SOLAR_TYPES or LUNAR_TYPES
+    type: str
+    # Degrees from the moon's center to the sun's center (solar) or
+    # the shadow's center (lunar), seen from the earth's center
+    separation: float
+    # Lunar only: fraction of the moon's diameter inside the umbra,
+    # or the penumbra for a penumbral eclipse
+    magnitude: Optional[float]
+
+
+class EclipseFinder:
+    """
+    Example Usage:
+        finder = EclipseFinder()
+        for eclipse in finder.find("2024/1/1", "2031/1/1"):
+            print(eclipse.date, eclipse.body, eclipse.type)
+    """
+
+    def __init__(self, node_limit: float = NODE_LIMIT) -> None:
+        """
+        Args:
+            node_limit: new and full moons with |sin F| over this are
+                skipped, 1.0 looks at every one
+        """
+        self._node_limit = node_limit
+        self._sun = ephem.Sun()
+        self._moon = ephem.Moon()
+        # New and full moons looked at, and the ones near a node, for
+        # benchmarks
+        self.syzygies = 0
+        self.candidates = 0
+
+# ------------------------------- FIND ----------------------------------- #
+    def find(self, start, end, solar: bool = True,
+             lunar: bool = True) -> Iterator[Eclipse]:
+        """Eclipses with greatest eclipse from start up to end"""
+        start = float(ephem.Date(start))
+        end = float(ephem.Date(end))
+        dublin = moon_meeus.DUBLIN_JD
+        # Start a lunation early, a full moon's lunation starts before
+        k = moon_meeus.new_moon_number(start + dublin) - 1
+        while True:
+            new_moon = moon_meeus.new_moon(k) - dublin
+            if new_moon - 1 > end:
+                return
+            next_new_moon = moon_meeus.new_moon(k + 1) - dublin
+            for half, wanted in ((0.0, solar), (0.5, lunar)):
+                if not wanted:
+                    continue
+                self.syzygies += 1
+                f = moon_meeus.argument_of_latitude(k + half)
+                # Node pruning, no ephem work for most of them
+                if abs(math.sin(math.radians(f))) > self._node_limit:
+                    continue
+                self.candidates += 1
+                if half:
+                    # Half way is within a day of the full moon
+                    eclipse = self._lunar((new_moon + next_new_moon) / 2)
+                else:
+                    eclipse = self._solar(new_moon)
+                if eclipse is not None and \
+                        start <= ephem.Date(eclipse.date) < end:
+                    yield eclipse
+            k += 1
+
+# ---------------------------- GEOMETRY ---------------------------------- #
+    def _compute(self, dte: float):
+        self._sun.compute(dte)
+        self._moon.compute(dte)
+
+    def _separation(self, dte: float, lunar: bool) -> float:
+        """Radians from the moon to the sun or to the shadow's center"""
+        self._compute(dte)
+        sun = self._sun
+        if lunar:
+            # The shadow's center is opposite the sun
+            return float(ephem.separation(
+                self._moon, (float(sun.ra) + math.pi, -float(sun.dec))))
+        return float(ephem.separation(self._moon, sun))
+
+    def _greatest(self, dte: float, lunar: bool) -> float:
+        """
+        Time of least separation near dte. Separation squared is a
+        parabola near the minimum, fit one through 3 points and
+        move to its vertex, with closer points each time.
+        """
+        for step in (0.4, 0.04, 0.002):
+            before = self._separation(dte - step, lunar) ** 2
+            middle = self._separation(dte, lunar) ** 2
+            after = self._separation(dte + step, lunar) ** 2
+            curve = before - 2 * middle + after
+            if curve <= 0:
+                # Too far out for a parabola, not near an eclipse
+                break
+            offset = step * (before - after) / (2 * curve)
+            # A wild move means the points were not near a minimum
+            dte += max(-3 * step, min(3 * step, offset))
+        return dte
+
+    def _parallaxes(self):
+        """Horizontal parallax of the moon and sun, radians"""
+        moon_km = self._moon.earth_distance * moon_meeus.KM_PER_AU
+        sun_km = self._sun.earth_distance * moon_meeus.KM_PER_AU
+        return (math.asin(EARTH_RADIUS_KM / moon_km),
+                math.asin(EARTH_RADIUS_KM / sun_km))
+
+# ------------------------------ SOLAR ----------------------------------- #
+    def _solar(self, new_moon: float) -> Optional[Eclipse]:
+        dte = self._greatest(new_moon, lunar=False)
+        separation = self._separation(dte, lunar=False)
+        moon_parallax, sun_parallax = self._parallaxes()
+        moon_radius = float(self._moon.radius)
+        sun_radius = float(self._sun.radius)
+
+        # The moon's penumbra misses the earth
+        if separation > (moon_parallax - sun_parallax
+                         + moon_radius + sun_radius):
+            return None
+
+        # The moon looks larger from where the shadow's axis meets the
+        # earth, up to an earth radius closer than the earth's center.
+        # gamma is the axis' distance from the center in earth radii.
+        moon_km = self._moon.earth_distance * moon_meeus.KM_PER_AU
+        gamma = min(1.0, separation / (moon_parallax - sun_parallax))
+        near_km = moon_km - EARTH_RADIUS_KM * math.sqrt(1 - gamma * gamma)
+        near_radius = moon_radius * moon_km / near_km
+        if separation > (moon_parallax - sun_parallax
+                         + abs(near_radius - sun_radius)):
+            # Neither the umbra nor the antumbra reaches the earth
+            kind = "partial"
+        elif moon_radius >= sun_radius:
+            kind = "total"
+        elif near_radius > sun_radius:
+            # Total near the middle of the track, annular at the ends
+            kind = "hybrid"
+        else:
+            kind = "annular"
+        return Eclipse(ephem.Date(dte).datetime(), "solar", kind,
+                       math.degrees(separation), None)
+
+# ------------------------------ LUNAR ----------------------------------- #
+    def _lunar(self, full_moon: float) -> Optional[Eclipse]:
+        dte = self._greatest(full_moon, lunar=True)
+        separation = self._separation(dte, lunar=True)
+        moon_parallax, sun_parallax = self._parallaxes()
+        moon_radius = float(self._moon.radius)
+        sun_radius = float(self._sun.radius)
+
+        # Shadow radii at the moon's distance, Danjon's rule
+        umbra = 1.01 * moon_parallax + sun_parallax - sun_radius
+        penumbra = 1.01 * moon_parallax + sun_parallax + sun_radius
+
+        if separation + moon_radius <= umbra:
+            kind = "total"
+        elif separation - moon_radius < umbra:
+            kind = "partial"
+        elif separation - moon_radius < penumbra:
+            kind = "penumbral"
+        else:
+            return None
+        shadow = penumbra if kind == "penumbral" else umbra
+        magnitude = (shadow + moon_radius - separation) / (2 * moon_radius)
+        return Eclipse(ephem.Date(dte).datetime(), "lunar", kind,
+                       math.degrees(separation), magnitude)
+
+
+def find_eclipses(start, end, solar: bool = True,
+                  lunar: bool = True) -> Iterator[Eclipse]:
+    """Eclipses from start up to end, see EclipseFinder.find"""
+    return EclipseFinder().find(start, end, solar, lunar)
+
+
+# ---------------------------- BENCHMARK --------------------------------- #
+def benchmark():
+    """A millennium with node pruning, a century without it"""
+    finder = EclipseFinder()
+    t = time.perf_counter()
+    eclipses = list(finder.find("2000/1/1", "3000/1/1"))
+    pruned = time.perf_counter() - t
+    print(f"2000-2999: {len(eclipses)} eclipses in {pruned:.2f} s, "
+          f"{finder.candidates} of {finder.syzygies} new and full moons "
+          f"near a node")
+
+    # Every new and full moon of a century through the geometry
+    finder = EclipseFinder(node_limit=1.0)
+    t = time.perf_counter()
+    unpruned = list(finder.find("2000/1/1", "2100/1/1"))
+    century = time.perf_counter() - t
+    same = [e for e in eclipses if e.date.year < 2100] == unpruned
+    print(f"2000-2099 without pruning: {century:.2f} s, about "
+          f"{century * 10:.0f} s a millennium, same eclipses: {same}")
+
+
+# ------------------------------ MAIN ------------------------------------ #
+def main():
+    parser = argparse.ArgumentParser(
+        description="Solar and lunar eclipses, greatest eclipse in UTC")
+    parser.add_argument("first", type=int, nargs="?",
+                        default=datetime.date.today().year,
+                        help="first year")
+    parser.add_argument("last", type=int, nargs="?", help="last year")
+    parser.add_argument("--solar", action="store_true",
+                        help="solar eclipses only")
+    parser.add_argument("--lunar", action="store_true",
+                        help="lunar eclipses only")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="time a millennium, with and without pruning")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark()
+        return
+
+    last = args.first if args.last is None else args.last
+    solar = args.solar or not args.lunar
+    lunar = args.lunar or not args.solar
+    counts = {}
+    for eclipse in find_eclipses(datetime.datetime(args.first, 1, 1),
+                                 datetime.datetime(last + 1, 1, 1),
+                                 solar, lunar):
+        magnitude = "" if eclipse.magnitude is None \
+            else f"  magnitude {eclipse.magnitude:.3f}"
+        print(f"{eclipse.date:%Y-%m-%d %H:%M} UTC  {eclipse.body:<5}  "
+              f"{eclipse.type:<9}{magnitude}")
+        key = (eclipse.body, eclipse.type)
+        counts[key] = counts.get(key, 0) + 1
+    print()
+    for body, types in (("solar", SOLAR_TYPES), ("lunar", LUNAR_TYPES)):
+        total = sum(counts.get((body, kind), 0) for kind in types)
+        if total:
+            print(f"{total} {body}: " + ", ".join(
+                f"{counts.get((body, kind), 0)} {kind}" for kind in types))
+
+
+if __name__ == "__main__":
+    main()
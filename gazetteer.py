@@ -0,0 +1,466 @@
+"""
+    Name: gazetteer.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: Offline city lookup, replaces the network geocoder
+    assets/gazetteer.dat holds the GeoNames cities of 5000 people or
+    more (about 69,000, geonames.org, CC BY 4.0) with their state or
+    province and country names. It is built once by --build from the
+    GeoNames dump files and read the first time a lookup is made.
+
+    The file is zlib compressed text in three parts: country names,
+    cities (largest first, so the first match of a name is the
+    biggest place) and the prebuilt index, normalized names in sorted
+    order with the cities that have each name. Loading does no
+    normalizing or sorting. The index is a dictionary for exact
+    matches and the sorted names for prefix matches. When neither
+    finds the city, a fuzzy match catches typos.
+    Reverse lookup (nearest city to a lat/lng) uses a k-d tree over
+    the cities as points on the unit sphere.
+
+    Usage:
+        python gazetteer.py --build cities5000.txt admin1CodesASCII.txt
+            countryInfo.txt
+"""
+import argparse
+import os
+import math
+import difflib
+import unicodedata
+import zlib
+from bisect import bisect_left
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+CITIES_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "assets", "gazetteer.dat"
+)
+# First line of a gazetteer file, bump when the layout changes
+FILE_HEADER = "# moon gazetteer 1"
+# Cities at least this big are also indexed by their ASCII alternate
+# names, e.g. "New York" for New York City
+ALTERNATE_POPULATION = 100000
+
+# Country code -> name, filled from the gazetteer file on first load
+COUNTRY_NAMES: Dict[str, str] = {}
+
+# Other ways people type a country
+COUNTRY_ALIASES = {
+    "usa": "US", "united states of america": "US", "america": "US",
+    "uk": "GB", "england": "GB", "great britain": "GB",
+    "britain": "GB", "scotland": "GB", "wales": "GB",
+    "holland": "NL", "czech republic": "CZ", "korea": "KR",
+    "russian federation": "RU", "uae": "AE", "drc": "CD",
+}
+
+US_STATES = {
+    "AL": "Alabama", "AK": "Alaska", "AZ": "Arizona", "AR": "Arkansas",
+    "CA": "California", "CO": "Colorado", "CT": "Connecticut",
+    "DE": "Delaware", "DC": "District of Columbia", "FL": "Florida",
+    "GA": "Georgia", "HI": "Hawaii", "ID": "Idaho", "IL": "Illinois",
+    "IN": "Indiana", "IA": "Iowa", "KS": "Kansas", "KY": "Kentucky",
+    "LA": "Louisiana", "ME": "Maine", "MD": "Maryland",
+    "MA": "Massachusetts", "MI": "Michigan", "MN": "Minnesota",
+    "MS": "Mississippi", "MO": "Missouri", "MT": "Montana",
+    "NE": "Nebraska", "NV": "Nevada", "NH": "New Hampshire",
+    "NJ": "New Jersey", "NM": "New Mexico", "NY": "New York",
+    "NC": "North Carolina", "ND": "North Dakota", "OH": "Ohio",
+    "OK": "Oklahoma", "OR": "Oregon", "PA": "Pennsylvania",
+    "PR": "Puerto Rico", "RI": "Rhode Island", "SC": "South Carolina",
+    "SD": "South Dakota", "TN": "Tennessee", "TX": "Texas", "UT": "Utah",
+    "VT": "Vermont", "VA": "Virginia", "WA": "Washington",
+    "WV": "West Virginia", "WI": "Wisconsin", "WY": "Wyoming",
+}
+
+
+class City(NamedTuple):
+    name: str
+    admin: str
+    country: str
+    lat: float
+    lng: float
+
+    @property
+    def address(self) -> str:
+        """City, state or province, country"""
+        return ", ".join(
+            part for part in (
+                self.name, self.admin,
+                COUNTRY_NAMES.get(self.country, self.country)
+            ) if part
+        )
+
+
+# --------------------------- NORMALIZE ---------------------------------- #
+def normalize(text: str) -> str:
+    """
+    Lower case, strip accents and punctuation, and spell saint the
+    same way, so "St. John's" and "saint johns" are the same key.
+    """
+    text = unicodedata.normalize("NFKD", text or "")
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    text = "".join(
+        c if c.isalnum() else " " for c in text.lower().replace("'", "")
+    )
+    words = ["st" if word == "saint" else word for word in text.split()]
+    return " ".join(words)
+
+
+class Gazetteer:
+    def __init__(self, path: str = CITIES_FILE) -> None:
+        self._path = path
+        # Built on the first lookup
+        self._cities: Optional[List[City]] = None
+        # Normalized name -> city indexes as text, "12 40", parsed on use
+        self._index: Dict[str, str] = {}
+        self._keys: List[str] = []
+        # k-d tree for nearest city, built on the first reverse lookup
+        self._tree = None
+
+# ------------------------------ LOAD ------------------------------------ #
+    def _load(self):
+        with open(self._path, "rb") as f:
+            text = zlib.decompress(f.read()).decode("utf-8")
+        header, countries, cities, keys = text.split("\n\n")
+        if header != FILE_HEADER:
+            raise ValueError(f"{self._path} is not a gazetteer file")
+
+        for line in countries.split("\n"):
+            code, name = line.split("\t")
+            COUNTRY_NAMES.setdefault(code, name)
+
+        city_list = []
+        for line in cities.split("\n"):
+            name, admin, country, lat, lng = line.split("\t")
+            city_list.append(City(name, admin, country, float(lat),
+                                  float(lng)))
+
+        # Already sorted by key
+        index = dict(line.split("\t") for line in keys.split("\n"))
+        self._index = index
+        self._keys = list(index)
+        self._cities = city_list
+
+    def _matches(self, key: str) -> List[City]:
+        indexes = self._index.get(key)
+        if indexes is None:
+            return []
+        return [self._cities[int(i)] for i in indexes.split()]
+
+    @property
+    def cities(self) -> List[City]:
+        if self._cities is None:
+            self._load()
+        return self._cities
+
+# ------------------------------ LOOKUP ---------------------------------- #
+    def lookup(self, name: str, state: str = "",
+               country: str = "") -> List[City]:
+        """
+        Cities with exactly this name, optionally narrowed by state
+        (name or US abbreviation) and country (name, alias or code).
+        """
+        if self._cities is None:
+            self._load()
+        return self._filter(self._matches(normalize(name)), state,
+                            country)
+
+    def prefix(self, text: str, limit: int = 10) -> List[City]:
+        """Cities whose name starts with text, in name order"""
+        if self._cities is None:
+            self._load()
+        key = normalize(text)
+        results = []
+        i = bisect_left(self._keys, key)
+        while i < len(self._keys) and self._keys[i].startswith(key):
+            results.extend(self._matches(self._keys[i]))
+            if len(results) >= limit:
+                break
+            i += 1
+        return results[:limit]
+
+    def fuzzy(self, name: str, state: str = "", country: str = "",
+              limit: int = 5) -> List[City]:
+        """
+        Closest spelled names, for typos like 'Scotsbluf'. Only names
+        with the same first letter are compared, a typo there is rare
+        and difflib over every name takes most of a second.
+        """
+        if self._cities is None:
+            self._load()
+        key = normalize(name)
+        if not key:
+            return []
+        first = bisect_left(self._keys, key[0])
+        last = bisect_left(self._keys, chr(ord(key[0]) + 1))
+        keys = difflib.get_close_matches(
+            key, self._keys[first:last], n=limit, cutoff=0.75)
+        matches = [city for close in keys for city in self._matches(close)]
+        return self._filter(matches, state, country)
+
+# ------------------------------ GEOCODE --------------------------------- #
+    def geocode(self, city: str, state: str = "",
+                country: str = "") -> Optional[Tuple[str, str, str]]:
+        """
+        Same return values as the old geopy geocode: lat and lng as
+        strings for MoonClass, and the address. None if not found.
+        """
+        matches = self.lookup(city, state, country) or \
+            self.fuzzy(city, state, country)
+        if not matches:
+            return None
+        best = matches[0]
+        return str(best.lat), str(best.lng), best.address
+
+# ------------------------------ NEAREST --------------------------------- #
+    def nearest(self, lat: float, lng: float) -> Tuple[City, float]:
+        """
+        Closest city to lat, lng and its great circle distance in km.
+
+        Example Usage:
+            city, km = gazetteer.nearest(41.86, -103.66)
+            print(f"{km:.0f} km from {city.address}")
+        """
+        if self._tree is None:
+            self._tree = _KDTree(self.cities)
+        i, chord = self._tree.nearest(_unit_vector(lat, lng))
+        return self._cities[i], _chord_to_km(chord)
+
+    def nearest_many(self, points):
+        """
+        Yield (City, km) for each (lat, lng) in points. Runs lazily,
+        so millions of points never sit in memory at once. The answer
+        for one point seeds the search for the next, which prunes most
+        of the tree when neighbouring points are close together.
+        """
+        if self._tree is None:
+            self._tree = _KDTree(self.cities)
+        tree = self._tree
+        cities = self._cities
+        best = None
+        for lat, lng in points:
+            point = _unit_vector(lat, lng)
+            i, chord = tree.nearest(point, best)
+            best = i
+            yield cities[i], _chord_to_km(chord)
+
+# ------------------------------ FILTER ---------------------------------- #
+    @staticmethod
+    def _filter(cities: List[City], state: str,
+                country: str) -> List[City]:
+        if state:
+            wanted = normalize(US_STATES.get(state.strip().upper(), state))
+            cities = [c for c in cities if normalize(c.admin) == wanted]
+        if country:
+            code = country.strip().upper()
+            if code not in COUNTRY_NAMES:
+                wanted = normalize(country)
+                code = COUNTRY_ALIASES.get(wanted) or next(
+                    (key for key, value in COUNTRY_NAMES.items()
+                     if normalize(value) == wanted), None)
+            cities = [c for c in cities if c.country == code]
+        return cities
+
+
+# --------------------------- K-D TREE ----------------------------------- #
+EARTH_RADIUS_KM = 6371.0
+
+
+def _unit_vector(lat: float, lng: float) -> Tuple[float, float, float]:
+    """Point on the unit sphere, so the dateline and poles need no care"""
+    lat = math.radians(float(lat))
+    lng = math.radians(float(lng))
+    cos_lat = math.cos(lat)
+    return (cos_lat * math.cos(lng), cos_lat * math.sin(lng), math.sin(lat))
+
+
+def _chord_to_km(chord: float) -> float:
+    """Straight line distance on the unit sphere to km along the surface"""
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, chord / 2))
+
+
+class _KDTree:
+    """
+    Static 3d tree. Each node is a tuple of
+    (city index, point, split axis, left subtree, right subtree).
+    Nearest neighbour by straight line distance is also nearest by
+    great circle distance.
+    """
+
+    def __init__(self, cities: List[City]) -> None:
+        self._points = [_unit_vector(c.lat, c.lng) for c in cities]
+        self._root = self._build(list(range(len(cities))), 0)
+
+    def _build(self, indexes: List[int], depth: int):
+        if not indexes:
+            return None
+        axis = depth % 3
+        indexes.sort(key=lambda i: self._points[i][axis])
+        middle = len(indexes) // 2
+        i = indexes[middle]
+        return (
+            i, self._points[i], axis,
+            self._build(indexes[:middle], depth + 1),
+            self._build(indexes[middle + 1:], depth + 1)
+        )
+
+    def nearest(self, point, hint: int = None) -> Tuple[int, float]:
+        """Index of the closest point and its chord length"""
+        best = [None, math.inf]
+        if hint is not None:
+            # Start from a known candidate to prune early
+            best = [hint, _distance2(point, self._points[hint])]
+
+        # Iterative search, children nearer the point first
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            i, node_point, axis, left, right = node
+            d2 = _distance2(point, node_point)
+            if d2 < best[1]:
+                best = [i, d2]
+            diff = point[axis] - node_point[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            # Far side only if the splitting plane is closer than the best
+            if diff * diff < best[1]:
+                stack.append(far)
+            stack.append(near)
+        return best[0], math.sqrt(best[1])
+
+
+def _distance2(a, b) -> float:
+    dx = a[0] - b[0]
+    dy = a[1] - b[1]
+    dz = a[2] - b[2]
+    return dx * dx + dy * dy + dz * dz
+
+
+# One shared gazetteer, loaded on the first lookup
+_gazetteer = Gazetteer()
+
+
+def geocode(city: str, state: str = "",
+            country: str = "") -> Optional[Tuple[str, str, str]]:
+    """Module level shortcut, same call as geocode_geopy.geocode"""
+    return _gazetteer.geocode(city, state, country)
+
+
+def lookup(name: str, state: str = "", country: str = "") -> List[City]:
+    return _gazetteer.lookup(name, state, country)
+
+
+def fuzzy(name: str, state: str = "", country: str = "") -> List[City]:
+    return _gazetteer.fuzzy(name, state, country)
+
+
+def prefix(text: str, limit: int = 10) -> List[City]:
+    return _gazetteer.prefix(text, limit)
+
+
+def nearest(lat: float, lng: float) -> Tuple[City, float]:
+    return _gazetteer.nearest(lat, lng)
+
+
+def nearest_many(points):
+    return _gazetteer.nearest_many(points)
+
+
+# ------------------------------ BUILD ----------------------------------- #
+def build(cities_path: str, admin1_path: str, countries_path: str,
+          out: str = CITIES_FILE) -> int:
+    """
+    Write a gazetteer file from the GeoNames dump files, see
+    download.geonames.org/export/dump: cities5000.txt (or any of the
+    citiesN files), admin1CodesASCII.txt and countryInfo.txt.
+    Returns the number of cities.
+    """
+    countries = {}
+    with open(countries_path, encoding="utf-8") as f:
+        for line in f:
+            if not line.startswith("#"):
+                fields = line.rstrip("\n").split("\t")
+                countries[fields[0]] = fields[4]
+
+    # "US.NE" -> "Nebraska"
+    admin1 = {}
+    with open(admin1_path, encoding="utf-8") as f:
+        for line in f:
+            code, name = line.split("\t")[:2]
+            admin1[code] = name
+
+    rows = []
+    with open(cities_path, encoding="utf-8") as f:
+        for line in f:
+            fields = line.rstrip("\n").split("\t")
+            country = fields[8]
+            rows.append((
+                int(fields[14] or 0), fields[1],
+                admin1.get(f"{country}.{fields[10]}", ""), country,
+                fields[4], fields[5], fields[2], fields[3]
+            ))
+    # Largest first, so the first match of a name is the biggest place
+    rows.sort(key=lambda row: -row[0])
+
+    lines = []
+    index: Dict[str, List[int]] = {}
+    for i, (population, name, admin, country, lat, lng, ascii_name,
+            alternates) in enumerate(rows):
+        lines.append("\t".join((name, admin, country, lat, lng)))
+        names = {name, ascii_name}
+        if population >= ALTERNATE_POPULATION:
+            # Spellings people type, not scripts, codes or postcodes
+            names.update(
+                alternate for alternate in alternates.split(",")
+                if alternate.isascii()
+                and not any(c.isdigit() for c in alternate))
+        for key in {normalize(name) for name in names}:
+            if key:
+                index.setdefault(key, []).append(i)
+
+    text = "\n\n".join((
+        FILE_HEADER,
+        "\n".join(f"{code}\t{name}"
+                  for code, name in sorted(countries.items())),
+        "\n".join(lines),
+        "\n".join(f"{key}\t{' '.join(map(str, index[key]))}"
+                  for key in sorted(index)),
+    ))
+    with open(out, "wb") as f:
+        f.write(zlib.compress(text.encode("utf-8"), 9))
+    return len(rows)
+
+
+# ------------------------------ MAIN ------------------------------------ #
+def main():
+    parser = argparse.ArgumentParser(
+        description="Offline city lookup, or build its data file")
+    parser.add_argument("city", nargs="?", help="city to look up")
+    parser.add_argument("--state", default="")
+    parser.add_argument("--country", default="")
+    parser.add_argument("--build", nargs=3,
+                        metavar=("CITIES", "ADMIN1", "COUNTRIES"),
+                        help="GeoNames citiesN.txt, admin1CodesASCII.txt "
+                        "and countryInfo.txt")
+    args = parser.parse_args()
+
+    if args.build:
+        count = build(*args.build)
+        print(f"Wrote {count:,} cities to {CITIES_FILE}, "
+              f"{os.path.getsize(CITIES_FILE):,} bytes")
+    elif args.city:
+        matches = lookup(args.city, args.state, args.country)
+        if not matches:
+            matches = fuzzy(args.city, args.state, args.country)
+            if matches:
+                print("No exact match, closest names:")
+        if not matches:
+            print(f"{args.city} not found")
+        for city in matches[:10]:
+            print(f"{city.address}  {city.lat}, {city.lng}")
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+    Name: geocode_client.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: Cached, rate limited geocoding over one reused connection
+    Talks to a Nominatim style /search endpoint. Answers, including
+    "not found", are kept in a SQLite cache so a place is only ever
+    asked for once. Cache hits never touch the network.
+"""
+import json
+import sqlite3
+import time
+import http.client
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode, urlparse
+
+DEFAULT_URL = "https://nominatim.openstreetmap.org"
+
+
+class GeocodeClient:
+    def __init__(
+        self,
+        base_url: str = DEFAULT_URL,
+        cache_path: str = "geocode_cache.db",
+        min_interval: float = 1.0,
+        timeout: float = 5.0,
+        user_agent: str = "MoonPhase/1.0"
+    ) -> None:
+        """
+        Args:
+            base_url: server with a /search endpoint
+            cache_path: SQLite file, ":memory:" for no persistence
+            min_interval: seconds between requests, Nominatim asks for 1
+            timeout: seconds to wait for the server
+            user_agent: Nominatim requires an identifying user agent
+        """
+        url = urlparse(base_url)
+        self._scheme = url.scheme
+        self._host = url.netloc
+        self._path = url.path.rstrip("/") + "/search"
+        self._min_interval = min_interval
+        self._timeout = timeout
+        self._headers = {"User-Agent": user_agent,
+                         "Connection": "keep-alive"}
+        self._conn: Optional[http.client.HTTPConnection] = None
+        self._last_request = 0.0
+        # Number of requests sent, for benchmarks
+        self.requests = 0
+
+        self._cache = sqlite3.connect(cache_path)
+        self._cache.execute("PRAGMA journal_mode=WAL")
+        with self._cache:
+            self._cache.execute(
+                "CREATE TABLE IF NOT EXISTS places (query TEXT PRIMARY KEY, "
+                "lat TEXT, lng TEXT, address TEXT)"
+            )
+
+# ------------------------------ GEOCODE --------------------------------- #
+    def geocode(self, city: str, state: str = "",
+                country: str = "") -> Optional[Tuple[str, str, str]]:
+        """
+        Same call and return as gazetteer.geocode:
+        (lat, lng, address), or None if the place is unknown.
+        """
+        return self.geocode_many([(city, state, country)])[0]
+
+    def geocode_many(
+        self, places: Iterable[Tuple[str, str, str]]
+    ) -> List[Optional[Tuple[str, str, str]]]:
+        """
+        Resolve many (city, state, country) places. Duplicates and
+        cached places are answered locally, the rest are sent one
+        after another over the same connection.
+        """
+        queries = [self._query(*place) for place in places]
+        answers = self._cached(set(queries))
+
+        new_rows = []
+        try:
+            for query in dict.fromkeys(queries):
+                if query in answers:
+                    continue
+                answer = self._fetch(query)
+                answers[query] = answer
+                new_rows.append((query, *(answer or (None, None, None))))
+        finally:
+            # Keep the answers already paid for when a fetch fails
+            # part way, the next run does not ask for them again
+            if new_rows:
+                with self._cache:
+                    self._cache.executemany(
+                        "INSERT OR REPLACE INTO places VALUES (?,?,?,?)",
+                        new_rows
+                    )
+        return [answers[query] for query in queries]
+
+# ------------------------------- CACHE ---------------------------------- #
+    @staticmethod
+    def _query(city: str, state: str = "", country: str = "") -> str:
+        """Cache key and search text, 'city, state, country'"""
+        return ", ".join(
+            " ".join(part.split()).lower() for part in (city, state, country)
+        )
+
+    def _cached(self, queries) -> Dict[str, Optional[Tuple[str, str, str]]]:
+        answers = {}
+        queries = list(queries)
+        for i in range(0, len(queries), 500):
+            chunk = queries[i:i + 500]
+            marks = ",".join("?" * len(chunk))
+            for query, lat, lng, address in self._cache.execute(
+                f"SELECT * FROM places WHERE query IN ({marks})", chunk
+            ):
+                # A row with no lat is a cached "not found"
+                answers[query] = None if lat is None else (lat, lng, address)
+        return answers
+
+# ------------------------------- FETCH ---------------------------------- #
+    def _fetch(self, query: str) -> Optional[Tuple[str, str, str]]:
+        # Client side rate limit
+        wait = self._last_request + self._min_interval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+
+        params = urlencode({"q": query, "format": "json", "limit": 1})
+        body = self._get(f"{self._path}?{params}")
+        self._last_request = time.monotonic()
+        self.requests += 1
+
+        results = json.loads(body)
+        if not results:
+            return None
+        best = results[0]
+        return best["lat"], best["lon"], best["display_name"]
+
+    def _get(self, path: str) -> bytes:
+        """GET over the kept open connection, reconnect once if dropped"""
+        for attempt in range(2):
+            if self._conn is None:
+                connection = http.client.HTTPSConnection \
+                    if self._scheme == "https" else http.client.HTTPConnection
+                self._conn = connection(self._host, timeout=self._timeout)
+            try:
+                self._conn.request("GET", path, headers=self._headers)
+                response = self._conn.getresponse()
+                body = response.read()
+                if response.status != 200:
+                    raise ConnectionError(
+                        f"Geocoding failed: HTTP {response.status}")
+                return body
+            except (http.client.HTTPException, ConnectionResetError,
+                    BrokenPipeError):
+                # Server closed the idle connection, try a fresh one
+                self._conn.close()
+                self._conn = None
+                if attempt:
+                    raise
+
+# ------------------------------- CLOSE ---------------------------------- #
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self._cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+# ------------------------------ MAIN ------------------------------------ #
+def main():
+    """Benchmark against the local stub server, no internet needed"""
+    from geocode_stub_server import start_stub_server
+    import gazetteer
+
+    server, url = start_stub_server()
+    places = [(city.name, city.admin, city.country)
+              for city in gazetteer.Gazetteer().cities[:200]]
+    with GeocodeClient(url, cache_path=":memory:", min_interval=0) as client:
+        for run in ("cold", "warm"):
+            t = time.perf_counter()
+            client.geocode_many(places)
+            elapsed = time.perf_counter() - t
+            print(
+                f"{run}: {len(places)} places in {elapsed * 1000:8.2f} ms, "
+                f"{client.requests} requests, "
+                f"{server.connections} connections"
+            )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
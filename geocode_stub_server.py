@@ -0,0 +1,92 @@
+"""
+    Name: geocode_stub_server.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: Local stand in for a Nominatim style geocoding server
+    Answers /search?q=city,state,country&format=json from the offline
+    gazetteer, so the network geocoding path can be tested and
+    benchmarked with no internet.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import gazetteer
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    # Keep alive, so clients can reuse one connection
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out separately, do not wait on delayed ACKs
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        # One handler per connection, count them for benchmarks
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != "/search":
+            self._send(404, {"error": "not found"})
+            return
+        with self.server.lock:
+            self.server.requests += 1
+
+        query = parse_qs(url.query).get("q", [""])[0]
+        # "city, state, country", state and country are optional
+        parts = [part.strip() for part in query.split(",")] + ["", ""]
+        location = gazetteer.geocode(parts[0], parts[1], parts[2])
+        results = []
+        if location is not None:
+            lat, lng, address = location
+            results.append({"lat": lat, "lon": lng, "display_name": address})
+        self._send(200, results)
+
+    def _send(self, status: int, body):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        # Keep test and benchmark output quiet
+        pass
+
+
+# ------------------------- START STUB SERVER ---------------------------- #
+def start_stub_server(port: int = 0):
+    """
+    Start the stub server on a background thread.
+
+    Args:
+        port: 0 picks a free port
+
+    Returns:
+        (server, base_url), call server.shutdown() when done
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = 0
+    server.requests = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    return server, f"http://{host}:{port}"
+
+
+def main():
+    server, url = start_stub_server(8088)
+    print(f"Geocoding stub server on {url}/search?q=Denver,CO,US")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+    Name: lunar_calendar_report.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: Printable lunar calendar for a span of years, HTML and text
+    Every day of every year shows a phase glyph, and each year lists
+    the times of the principal phases with their lunation numbers.
+    The phase events for the whole span are found once in the parent
+    and shared with the worker processes, which render one year each.
+    Years are written to disk in order as they finish.
+
+    Usage:
+        python lunar_calendar_report.py 2000 2099
+        python lunar_calendar_report.py 2027 2027 --out moon_2027
+"""
+import argparse
+import calendar
+import datetime
+import html
+import time
+from bisect import bisect_left
+from multiprocessing import Pool
+from typing import List, Tuple
+# pip install ephem
+import ephem
+from lunation_tables import (EVENT_NAMES, SharedLunationTable,
+                             init_worker, worker_table)
+from moon_class import MoonClass
+from moon_stream import get_phase_index
+
+# Phase glyphs in the same order as MoonClass.moon_phase_descriptions
+PHASE_GLYPHS = "🌑🌒🌓🌔🌕🌖🌗🌘"
+EVENT_GLYPHS = "🌑🌓🌕🌗"
+
+# New moon of Brown's lunation 953, lunation 0 in Meeus
+LUNATION_953 = ephem.Date("2000/1/6 18:14")
+SYNODIC_MONTH = 29.530588853
+
+
+def lunation_number(new_moon: float) -> int:
+    """Brown lunation number of the lunation starting at new_moon"""
+    return round((new_moon - LUNATION_953) / SYNODIC_MONTH) + 953
+
+
+# --------------------------- YEAR DATA ---------------------------------- #
+def year_phases(table, year: int) -> List[List[int]]:
+    """Phase index of each day at noon, one list per month"""
+    months = []
+    for month in range(1, 13):
+        days = calendar.monthrange(year, month)[1]
+        months.append([
+            get_phase_index(table.phase(
+                ephem.Date(datetime.date(year, month, day)) + 0.5))
+            for day in range(1, days + 1)
+        ])
+    return months
+
+
+def year_events(table, year: int) -> List[Tuple[float, int, int]]:
+    """(ephem date, kind, lunation number) of the events in year"""
+    times = table.times
+    start = bisect_left(times, ephem.Date(datetime.date(year, 1, 1)))
+    end = bisect_left(times, ephem.Date(datetime.date(year + 1, 1, 1)))
+    # The table starts on a new moon, so event i is of kind i % 4
+    # and its lunation starts at event i - i % 4
+    return [
+        (times[i], i % 4, lunation_number(times[i - i % 4]))
+        for i in range(start, end)
+    ]
+
+
+# ---------------------------- RENDER ------------------------------------ #
+def render_text(year: int, phases, events) -> str:
+    lines = [f"{year:^100}".rstrip(), "", "     " + "".join(
+        f"{day:>2} " for day in range(1, 32))]
+    for month, days in enumerate(phases, 1):
+        lines.append(f"{calendar.month_abbr[month]:<5}" +
+                     "".join(PHASE_GLYPHS[i] + " " for i in days))
+    lines.append("")
+    previous = None
+    for dte, kind, lunation in events:
+        # The year can start part way through a lunation
+        if lunation != previous:
+            lines.append(f"Lunation {lunation}")
+            previous = lunation
+        lines.append(
+            f"    {EVENT_GLYPHS[kind]} {EVENT_NAMES[kind]:<14}"
+            f"{ephem.Date(dte).datetime():%Y-%m-%d %H:%M} UTC"
+        )
+    lines.append("\f")
+    return "\n".join(lines) + "\n"
+
+
+def render_html(year: int, phases, events) -> str:
+    descriptions = MoonClass.moon_phase_descriptions
+    rows = ["<tr><th></th>" + "".join(
+        f"<th>{day}</th>" for day in range(1, 32)) + "</tr>"]
+    for month, days in enumerate(phases, 1):
+        cells = "".join(
+            f'<td title="{html.escape(descriptions[i])}">'
+            f"{PHASE_GLYPHS[i]}</td>"
+            for i in days
+        )
+        rows.append(
+            f"<tr><th>{calendar.month_abbr[month]}</th>{cells}</tr>")
+
+    items = []
+    for dte, kind, lunation in events:
+        when = f"{ephem.Date(dte).datetime():%Y-%m-%d %H:%M}"
+        items.append(
+            f"<li>{EVENT_GLYPHS[kind]} {EVENT_NAMES[kind]} {when} UTC"
+            f" <small>(lunation {lunation})</small></li>"
+        )
+    return (
+        f'<section class="year">\n<h2>{year}</h2>\n'
+        f"<table>\n" + "\n".join(rows) + "\n</table>\n"
+        f'<ul class="events">\n' + "\n".join(items) + "\n</ul>\n"
+        "</section>\n"
+    )
+
+
+def render_year(year: int) -> Tuple[int, str, str]:
+    """Worker: (year, text, html), phase data from the shared table"""
+    table = worker_table()
+    phases = year_phases(table, year)
+    events = year_events(table, year)
+    return (year, render_text(year, phases, events),
+            render_html(year, phases, events))
+
+
+HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Lunar Calendar {first} - {last}</title>
+<style>
+body {{ font-family: sans-serif; }}
+table {{ border-collapse: collapse; }}
+th, td {{ padding: 1px 2px; text-align: center; font-size: 11px; }}
+.events {{ columns: 3; font-size: 11px; }}
+@media print {{ .year {{ page-break-after: always; }} }}
+</style>
+</head>
+<body>
+<h1>Lunar Calendar {first} - {last}</h1>
+<p>Phase at 12 noon UTC each day, phase times in UTC.</p>
+"""
+
+
+# --------------------------- WRITE REPORT ------------------------------- #
+def write_report(first: int, last: int, out: str = "lunar_calendar",
+                 workers: int = None):
+    """Write out.html and out.txt for the years first to last"""
+    with SharedLunationTable.publish(
+            datetime.datetime(first, 1, 1),
+            datetime.datetime(last + 1, 1, 1)) as table, \
+            open(out + ".txt", "w", encoding="utf-8") as text_file, \
+            open(out + ".html", "w", encoding="utf-8") as html_file, \
+            Pool(workers, initializer=init_worker,
+                 initargs=(table.name,)) as pool:
+        html_file.write(HTML_HEAD.format(first=first, last=last))
+        # imap hands back the years in order as soon as each is ready
+        for year, text, page in pool.imap(
+                render_year, range(first, last + 1)):
+            text_file.write(text)
+            html_file.write(page)
+        html_file.write("</body>\n</html>\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Lunar calendar for a span of years, HTML and text")
+    parser.add_argument("first", type=int, help="first year")
+    parser.add_argument("last", type=int, help="last year")
+    parser.add_argument("--out", default="lunar_calendar",
+                        help="file name without extension")
+    parser.add_argument("--workers", type=int,
+                        help="worker processes, default one per CPU")
+    args = parser.parse_args()
+
+    t = time.perf_counter()
+    write_report(args.first, args.last, args.out, args.workers)
+    print(f"Wrote {args.out}.html and {args.out}.txt, "
+          f"{args.last - args.first + 1} years in "
+          f"{time.perf_counter() - t:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+"""
+    Name: lunation_tables.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: Precomputed new moon and principal phase event tables
+    A table is built once with a single sweep through the phase events
+    and answers lunation questions with a binary search instead of
+    ephem's new moon searches. For worker pools the parent publishes
+    the table through multiprocessing.shared_memory and the workers
+    attach to it read only, without copying it.
+"""
+import atexit
+import datetime
+import sys
+import time
+from array import array
+from bisect import bisect_right
+from multiprocessing import Pool, resource_tracker, shared_memory
+from typing import Iterator, Optional, Tuple
+# pip install ephem
+import ephem
+from moon_stream import MoonReading, make_reading
+
+# Event kinds, in the order they happen in a lunation
+NEW, FIRST_QUARTER, FULL, LAST_QUARTER = range(4)
+EVENT_NAMES = ("New Moon", "First Quarter", "Full Moon", "Last Quarter")
+
+# ephem search for each kind, starting from the event before it
+_NEXT_EVENT = (
+    ephem.next_new_moon,
+    ephem.next_first_quarter_moon,
+    ephem.next_full_moon,
+    ephem.next_last_quarter_moon,
+)
+
+
+# ------------------------- ITER PHASE EVENTS ---------------------------- #
+def iter_phase_events(start, end=None) -> Iterator[Tuple[float, int]]:
+    """
+    Yield (ephem date, kind) for every principal phase, in time order,
+    starting with the new moon on or before start. Each search starts
+    from the previous event, so the sweep finds every event once.
+
+    Args:
+        start: datetime or ephem.Date
+        end (optional): stop after the first event past end
+    """
+    dte = float(ephem.previous_new_moon(ephem.Date(start)))
+    stop = None if end is None else float(ephem.Date(end))
+    kind = NEW
+    while True:
+        yield dte, kind
+        if stop is not None and dte > stop:
+            return
+        kind = (kind + 1) % 4
+        dte = float(_NEXT_EVENT[kind](dte))
+
+
+# ------------------------- LUNATION TABLE ------------------------------- #
+class LunationTable:
+    """
+    Principal phase event times covering a range. The table always
+    starts with a new moon, so event i is of kind i % 4 and the new
+    moons are every fourth event.
+
+    Example Usage:
+        table = LunationTable.build(datetime.datetime(2000, 1, 1),
+                                    datetime.datetime(2030, 1, 1))
+        previous_new_moon, next_new_moon = table.bounds(ephem.now())
+    """
+
+    def __init__(self, times) -> None:
+        # Any sequence of floats: array, memoryview or list
+        self._times = times
+        self._moon = ephem.Moon()
+        self._observer = ephem.Observer()
+
+    @classmethod
+    def build(cls, start, end) -> "LunationTable":
+        """Sweep the events from start to end into a new table"""
+        times = array(
+            "d", (dte for dte, kind in iter_phase_events(start, end)))
+        # End on a new moon so every date in range has both bounds
+        while (len(times) - 1) % 4:
+            times.append(float(_NEXT_EVENT[len(times) % 4](times[-1])))
+        return cls(times)
+
+    @property
+    def times(self):
+        return self._times
+
+    @property
+    def start(self) -> ephem.Date:
+        return ephem.Date(self._times[0])
+
+    @property
+    def end(self) -> ephem.Date:
+        return ephem.Date(self._times[-1])
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    def covers(self, dte) -> bool:
+        return self._times[0] <= float(dte) < self._times[-1]
+
+# ---------------------------- LOOKUPS ----------------------------------- #
+    def lunation(self, dte) -> int:
+        """Index of the lunation containing dte, counted from the start"""
+        dte = float(dte)
+        if not self.covers(dte):
+            raise ValueError(
+                f"{ephem.Date(dte)} is outside the table "
+                f"({self.start} to {self.end})"
+            )
+        return (bisect_right(self._times, dte) - 1) // 4
+
+    def bounds(self, dte) -> Tuple[float, float]:
+        """Previous and next new moon around dte"""
+        i = self.lunation(dte) * 4
+        return self._times[i], self._times[i + 4]
+
+    def events(self, dte) -> Tuple[float, float, float, float, float]:
+        """New, first quarter, full, last quarter and next new moon"""
+        i = self.lunation(dte) * 4
+        return tuple(self._times[i:i + 5])
+
+    def phase(self, dte) -> float:
+        """Fraction of the lunation, same as MoonClass.moon_phase"""
+        previous_new_moon, next_new_moon = self.bounds(dte)
+        return (float(dte) - previous_new_moon) / \
+            (next_new_moon - previous_new_moon)
+
+    def reading(self, dte) -> MoonReading:
+        """Moon reading with no new moon searches"""
+        dte = float(ephem.Date(dte))
+        previous_new_moon, next_new_moon = self.bounds(dte)
+        return make_reading(
+            self._moon, self._observer, dte, previous_new_moon, next_new_moon
+        )
+
+
+# ----------------------- SHARED LUNATION TABLE -------------------------- #
+class SharedLunationTable(LunationTable):
+    """
+    LunationTable stored in shared memory. The block holds the event
+    count as a double followed by the event times.
+
+    Parent:
+        with SharedLunationTable.publish(start, end) as table:
+            with Pool(initializer=init_worker,
+                      initargs=(table.name,)) as pool:
+                ...
+    Worker:
+        table = worker_table()
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        self._shm = shm
+        self._owner = owner
+        view = shm.buf.cast("d")
+        count = int(view[0])
+        # Workers get a read only view, nobody copies the times
+        self._view = view
+        times = view[1:count + 1]
+        super().__init__(times if owner else times.toreadonly())
+        if owner:
+            # Unlink even if the parent forgets to, the resource
+            # tracker covers a parent that is killed outright
+            atexit.register(self.close)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @classmethod
+    def publish(cls, start, end) -> "SharedLunationTable":
+        """Build a table and copy it into a new shared memory block"""
+        times = LunationTable.build(start, end).times
+        shm = shared_memory.SharedMemory(
+            create=True, size=8 * (len(times) + 1))
+        view = shm.buf.cast("d")
+        view[0] = len(times)
+        view[1:len(times) + 1] = times
+        view.release()
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedLunationTable":
+        """Map an existing table read only"""
+        return cls(_attach_untracked(name), owner=False)
+
+    def close(self):
+        """Detach, and remove the block if this process published it"""
+        if self._shm is None:
+            return
+        # Views must be released before the block can be closed
+        self._times.release()
+        self._view.release()
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+            atexit.unregister(self.close)
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _attach_untracked(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach without registering with the resource tracker. Otherwise a
+    worker exiting would unlink the parent's block (or warn about a
+    leak), see https://github.com/python/cpython/issues/82300
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+# ------------------------------ WORKERS --------------------------------- #
+_worker_table: Optional[SharedLunationTable] = None
+
+
+def init_worker(name: str):
+    """Pool initializer, attach to the parent's table"""
+    global _worker_table
+    _worker_table = SharedLunationTable.attach(name)
+    atexit.register(_worker_table.close)
+
+
+def worker_table() -> SharedLunationTable:
+    """The table this worker attached to in init_worker"""
+    if _worker_table is None:
+        raise RuntimeError("init_worker was not run in this process")
+    return _worker_table
+
+
+def _shared_reading(dte: float) -> MoonReading:
+    return worker_table().reading(dte)
+
+
+def _own_table_reading(args) -> MoonReading:
+    # What each worker does without a shared table
+    dte, start, end = args
+    global _worker_table
+    if _worker_table is None:
+        _worker_table = LunationTable.build(start, end)
+    return _worker_table.reading(dte)
+
+
+# ------------------------------ MAIN ------------------------------------ #
+def main(workers: int = 4):
+    """Time to first answer from a pool, shared table vs one per worker"""
+    start = datetime.datetime(1990, 1, 1)
+    end = datetime.datetime(2040, 1, 1)
+    dates = [float(ephem.Date(start)) + i * 7.3 for i in range(workers * 50)]
+
+    t = time.perf_counter()
+    with SharedLunationTable.publish(start, end) as table:
+        build_time = time.perf_counter() - t
+        print(f"Parent built {len(table)} events in {build_time:.2f} s")
+
+        t = time.perf_counter()
+        with Pool(workers, initializer=init_worker,
+                  initargs=(table.name,)) as pool:
+            pool.map(_shared_reading, dates, chunksize=1)
+        print(f"{workers} workers, shared table:   "
+              f"{time.perf_counter() - t:6.2f} s")
+
+    t = time.perf_counter()
+    with Pool(workers) as pool:
+        pool.map(_own_table_reading,
+                 [(dte, start, end) for dte in dates], chunksize=1)
+    print(f"{workers} workers, own tables:     "
+          f"{time.perf_counter() - t:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+    Name: month_phases.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: Moon phase of every day in a calendar month
+    A month is computed in one batch: the days share the lunation
+    bounds, so a month costs about two new moon searches instead of
+    two per day. Computed months are kept in a bounded cache and the
+    neighbouring months can be prefetched on a background thread.
+"""
+import calendar
+import datetime
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
+# pip install ephem
+import ephem
+from moon_stream import LunationTracker, get_phase_index
+
+MonthKey = Tuple[int, int]
+
+
+# ------------------------- MONTH PHASE BINS ----------------------------- #
+def month_phase_bins(year: int, month: int,
+                     tracker: LunationTracker = None
+                     ) -> Dict[datetime.date, int]:
+    """
+    Phase index (into MoonClass.moon_phase_descriptions) for each day
+    of the month. Like MoonClass, each day is taken at 12 noon.
+    """
+    if tracker is None:
+        tracker = LunationTracker()
+    days = calendar.monthrange(year, month)[1]
+    bins = {}
+    for day in range(1, days + 1):
+        dte = datetime.date(year, month, day)
+        noon = ephem.Date(dte) + 12 * ephem.hour
+        bins[dte] = get_phase_index(tracker.phase(noon))
+    return bins
+
+
+def year_phase_bins(year: int) -> Dict[int, Dict[datetime.date, int]]:
+    """Phase bins for every month of a year, month number -> bins"""
+    tracker = LunationTracker()
+    return {
+        month: month_phase_bins(year, month, tracker)
+        for month in range(1, 13)
+    }
+
+
+def adjacent_months(year: int, month: int) -> Tuple[MonthKey, MonthKey]:
+    """(year, month) of the months before and after"""
+    previous = (year - 1, 12) if month == 1 else (year, month - 1)
+    following = (year + 1, 1) if month == 12 else (year, month + 1)
+    return previous, following
+
+
+class MonthPhaseCache:
+    def __init__(self, max_months: int = 24) -> None:
+        """
+        Args:
+            max_months: least recently used months past this are dropped
+        """
+        self._max_months = max_months
+        self._months: "OrderedDict[MonthKey, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        # One background thread, prefetches queue up behind each other
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = set()
+
+# ------------------------------- GET ------------------------------------ #
+    def get(self, year: int, month: int) -> Dict[datetime.date, int]:
+        """Phase bins for a month, computed now if not cached"""
+        key = (year, month)
+        with self._lock:
+            if key in self._months:
+                self._months.move_to_end(key)
+                return self._months[key]
+        bins = month_phase_bins(year, month)
+        self._store(key, bins)
+        return bins
+
+# ----------------------------- PREFETCH --------------------------------- #
+    def prefetch(self, year: int, month: int):
+        """Compute the months around year, month in the background"""
+        for key in adjacent_months(year, month):
+            with self._lock:
+                if key in self._months or key in self._pending:
+                    continue
+                self._pending.add(key)
+            self._executor.submit(self._prefetch, key)
+
+    def _prefetch(self, key: MonthKey):
+        try:
+            self._store(key, month_phase_bins(*key))
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    def _store(self, key: MonthKey, bins: Dict):
+        with self._lock:
+            self._months[key] = bins
+            self._months.move_to_end(key)
+            while len(self._months) > self._max_months:
+                self._months.popitem(last=False)
+
+    def __contains__(self, key: MonthKey) -> bool:
+        with self._lock:
+            return key in self._months
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
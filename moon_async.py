@@ -0,0 +1,204 @@
+"""
+    Name: moon_async.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: Asyncio API for moon readings
+    ephem work runs in an executor so coroutines never block the
+    event loop. Identical requests that are in flight at the same time
+    (same instant and location) share one computation.
+
+    ephem computes in C but holds the GIL while it does, so a thread
+    pool only moves the work off the loop's thread, the loop still
+    waits for it. The default executor is a process pool, each worker
+    has its own GIL. Pass a ThreadPoolExecutor to trade loop latency
+    for no worker start up, see the benchmark.
+"""
+import asyncio
+import datetime
+import functools
+import time
+from concurrent.futures import (Executor, ProcessPoolExecutor,
+                                ThreadPoolExecutor)
+from typing import Dict, Iterable, List, Optional, Tuple
+# pip install ephem
+import ephem
+from moon_stream import MoonReading, get_reading
+
+
+class AsyncMoon:
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        max_concurrency: int = 8,
+        coalesce: bool = True,
+        lat: str = None,
+        lng: str = None
+    ) -> None:
+        """
+        Args:
+            executor (optional): where ephem work runs. Defaults to a
+                ProcessPoolExecutor made on first use and shut down by
+                close(). A thread pool does not keep the loop free,
+                ephem holds the GIL.
+            max_concurrency: most computations submitted at once
+            coalesce: share in flight computations for identical requests
+            lat, lng (optional): default observer location
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._executor = executor
+        # The process pool made here, close() shuts it down
+        self._own_executor = None
+        self._max_concurrency = max_concurrency
+        self._coalesce = coalesce
+        self._lat = lat
+        self._lng = lng
+
+        # Created on first use so they bind to the running loop
+        self._semaphore = None
+        # (instant, lat, lng) -> future of the running computation
+        self._in_flight: Dict[Tuple, asyncio.Future] = {}
+
+# ----------------------- GET OBSERVER ----------------------------------- #
+    async def get_observer(self, dte=None, lat: str = None,
+                           lng: str = None) -> MoonReading:
+        """
+        Async version of MoonClass.get_observer, returns a MoonReading.
+        Like MoonClass, a date passed in is read at 12 noon after it,
+        calendar dates come in at 12 am.
+
+        Args:
+            dte (optional): datetime or ephem.Date, defaults to now
+            lat, lng (optional): observer location, each defaults to
+                the one given to the constructor
+        """
+        if dte is None:
+            dte = ephem.Date(datetime.datetime.now())
+        else:
+            # Set time to 12 noon, the same as MoonClass.get_observer
+            dte = ephem.Date(ephem.Date(dte) + 12 * ephem.hour)
+        if lat is None:
+            lat = self._lat
+        if lng is None:
+            lng = self._lng
+        key = (float(dte), lat, lng)
+
+        if not self._coalesce:
+            return await self._compute(key)
+
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._compute(key))
+            self._in_flight[key] = future
+            future.add_done_callback(
+                lambda f: self._in_flight.pop(key, None))
+        # Shield so one cancelled caller does not cancel the others
+        return await asyncio.shield(future)
+
+# -------------------------- GATHER -------------------------------------- #
+    async def gather(self, dates: Iterable, lat: str = None,
+                     lng: str = None) -> List[MoonReading]:
+        """
+        Readings for many dates, in the same order as dates.
+        No more than max_concurrency computations run at once.
+        """
+        return await asyncio.gather(
+            *(self.get_observer(dte, lat, lng) for dte in dates)
+        )
+
+# -------------------------- COMPUTE ------------------------------------- #
+    async def _compute(self, key: Tuple) -> MoonReading:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        dte, lat, lng = key
+        if self._executor is None:
+            self._own_executor = ProcessPoolExecutor()
+            self._executor = self._own_executor
+        loop = asyncio.get_running_loop()
+        async with self._semaphore:
+            return await loop.run_in_executor(
+                self._executor,
+                functools.partial(get_reading, dte, lat, lng)
+            )
+
+# --------------------------- CLOSE -------------------------------------- #
+    def close(self):
+        """Shut down the process pool, if this AsyncMoon made one"""
+        if self._own_executor is not None:
+            self._own_executor.shutdown()
+            self._own_executor = None
+            self._executor = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self.close()
+
+
+# ------------------------- BENCHMARK ------------------------------------ #
+async def _heartbeat(lags: List[float], stop: asyncio.Event,
+                     interval: float = 0.001):
+    """Record how late the event loop wakes this task up"""
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - expected)
+
+
+async def _run_benchmark(name: str, work) -> None:
+    lags: List[float] = []
+    stop = asyncio.Event()
+    heartbeat = asyncio.ensure_future(_heartbeat(lags, stop))
+    start = time.perf_counter()
+    await work()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await heartbeat
+
+    lags.sort()
+    p99 = lags[int(len(lags) * 0.99)] if lags else 0.0
+    worst = lags[-1] if lags else 0.0
+    print(
+        f"{name:<14} total {elapsed:7.3f} s   "
+        f"loop lag p99 {p99 * 1000:7.2f} ms   max {worst * 1000:7.2f} ms"
+    )
+
+
+async def benchmark(requests: int = 2000, distinct: int = 200) -> None:
+    """
+    Event loop latency while serving requests readings, where
+    only distinct of the instants are different.
+    """
+    base = datetime.datetime(2024, 1, 1)
+    dates = [base + datetime.timedelta(hours=i % distinct)
+             for i in range(requests)]
+    print(f"{requests} requests, {distinct} distinct instants")
+
+    async def blocking():
+        # What a coroutine calling ephem directly does to the loop
+        for dte in dates:
+            get_reading(dte)
+            await asyncio.sleep(0)
+
+    async def threads():
+        # ephem holds the GIL, the loop waits on the workers anyway
+        with ThreadPoolExecutor() as executor:
+            await AsyncMoon(executor, coalesce=False).gather(dates)
+
+    async def uncoalesced():
+        async with AsyncMoon(coalesce=False) as moon:
+            await moon.gather(dates)
+
+    async def coalesced():
+        async with AsyncMoon() as moon:
+            await moon.gather(dates)
+
+    await _run_benchmark("blocking", blocking)
+    await _run_benchmark("threads", threads)
+    await _run_benchmark("uncoalesced", uncoalesced)
+    await _run_benchmark("coalesced", coalesced)
+
+
+if __name__ == "__main__":
+    asyncio.run(benchmark())
@@ -0,0 +1,279 @@
+"""
+    Name: moon_cache.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: Persistent SQLite cache of computed moon readings
+    Readings are keyed by instant and location. The cache remembers
+    which schema and ephem version wrote it, and starts over when
+    either one changes, so stale numbers are never served.
+"""
+import sqlite3
+import weakref
+import datetime
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+# pip install ephem
+import ephem
+from moon_stream import MoonReading, get_reading
+
+# Bump when the stored columns or their meaning change
+SCHEMA_VERSION = 1
+CACHE_VERSION = f"{SCHEMA_VERSION}:ephem-{ephem.__version__}"
+
+
+# ------------------------------ WRITE ----------------------------------- #
+def _write(conn: sqlite3.Connection, pending: Dict[Tuple, MoonReading]):
+    """Write and clear the pending readings in one transaction"""
+    if not pending:
+        return
+    rows = [
+        (*key, reading.moon_phase, reading.illumination,
+         reading.earth_to_moon, reading.moon_age, reading.phase_index)
+        for key, reading in pending.items()
+    ]
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO readings VALUES (?,?,?,?,?,?,?,?)",
+            rows
+        )
+    pending.clear()
+
+
+def _close(conn: sqlite3.Connection, pending: Dict[Tuple, MoonReading]):
+    _write(conn, pending)
+    conn.close()
+
+
+class MoonCache:
+    def __init__(
+        self,
+        path: str = "moon_cache.db",
+        max_rows: int = 1_000_000,
+        batch_size: int = 500
+    ) -> None:
+        """
+        Args:
+            path: SQLite database file, ":memory:" for a throw away cache
+            max_rows: oldest rows are pruned past this many readings
+            batch_size: new readings are written in batches this size
+
+        Example Usage:
+            with MoonCache() as cache:
+                reading = cache.get_reading(datetime.datetime(2024, 1, 1))
+                print(reading.phase_description)
+        """
+        self._max_rows = max_rows
+        self._batch_size = batch_size
+        # Readings computed but not written yet
+        self._pending: Dict[Tuple, MoonReading] = {}
+
+        self._conn = sqlite3.connect(path)
+        # WAL lets readers keep going while a batch is written
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_tables()
+
+        # Do not lose the last partial batch. Runs when the cache is
+        # garbage collected or at exit, without keeping it alive.
+        self._finalizer = weakref.finalize(
+            self, _close, self._conn, self._pending)
+
+# ----------------------- CREATE TABLES ---------------------------------- #
+    def _create_tables(self):
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta "
+                "(key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS readings ("
+                "lat TEXT NOT NULL, lng TEXT NOT NULL, "
+                "instant REAL NOT NULL, moon_phase REAL, "
+                "illumination REAL, earth_to_moon REAL, "
+                "moon_age REAL, phase_index INTEGER)"
+            )
+            self._conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS readings_key "
+                "ON readings (lat, lng, instant)"
+            )
+
+            # A new schema or ephem version invalidates every reading
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'version'"
+            ).fetchone()
+            if row is None or row[0] != CACHE_VERSION:
+                self._conn.execute("DELETE FROM readings")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('version', ?)",
+                    (CACHE_VERSION,)
+                )
+
+# ------------------------------ KEY ------------------------------------- #
+    @staticmethod
+    def _key(dte, lat, lng) -> Tuple:
+        # Round to about a millisecond so equal instants match
+        instant = round(float(ephem.Date(dte)), 8)
+        return (
+            "" if lat is None else str(lat),
+            "" if lng is None else str(lng),
+            instant
+        )
+
+    @staticmethod
+    def _row_to_reading(row) -> MoonReading:
+        instant, moon_phase, illumination, earth_to_moon, moon_age, \
+            phase_index = row
+        return MoonReading(
+            ephem.Date(instant).datetime(), moon_phase, illumination,
+            earth_to_moon, moon_age, phase_index
+        )
+
+# ------------------------------- GET ------------------------------------ #
+    def get(self, dte, lat: str = None,
+            lng: str = None) -> Optional[MoonReading]:
+        """Return the cached reading, or None if it was never computed"""
+        key = self._key(dte, lat, lng)
+        if key in self._pending:
+            return self._pending[key]
+        row = self._conn.execute(
+            "SELECT instant, moon_phase, illumination, earth_to_moon, "
+            "moon_age, phase_index FROM readings "
+            "WHERE lat = ? AND lng = ? AND instant = ?",
+            key
+        ).fetchone()
+        return None if row is None else self._row_to_reading(row)
+
+# ------------------------------- PUT ------------------------------------ #
+    def put(self, reading: MoonReading, lat: str = None, lng: str = None):
+        """Queue a reading, it is written with the next batch"""
+        self._put(self._key(reading.date, lat, lng), reading)
+
+    def _put(self, key: Tuple, reading: MoonReading):
+        self._pending[key] = reading
+        if len(self._pending) >= self._batch_size:
+            self.flush()
+
+# ---------------------------- GET READING ------------------------------- #
+    def get_reading(self, dte, lat: str = None,
+                    lng: str = None) -> MoonReading:
+        """Cached reading, computed with ephem only on a miss"""
+        reading = self.get(dte, lat, lng)
+        if reading is None:
+            reading = get_reading(dte, lat, lng)
+            self._put(self._key(dte, lat, lng), reading)
+        return reading
+
+# ----------------------------- READINGS --------------------------------- #
+    def readings(self, dates: Iterable, lat: str = None,
+                 lng: str = None) -> List[MoonReading]:
+        """
+        Readings for many dates in one pass. Hits are looked up in
+        chunks, and only the misses are computed.
+        """
+        keys = [self._key(dte, lat, lng) for dte in dates]
+        found: Dict[float, MoonReading] = {}
+        instants = [key[2] for key in keys]
+        # SQLite limits the number of ? in one statement
+        for i in range(0, len(instants), 500):
+            chunk = instants[i:i + 500]
+            marks = ",".join("?" * len(chunk))
+            for row in self._conn.execute(
+                "SELECT instant, moon_phase, illumination, earth_to_moon, "
+                "moon_age, phase_index FROM readings "
+                f"WHERE lat = ? AND lng = ? AND instant IN ({marks})",
+                (keys[0][0], keys[0][1], *chunk)
+            ):
+                found[row[0]] = self._row_to_reading(row)
+
+        results = []
+        for key in keys:
+            reading = found.get(key[2]) or self._pending.get(key)
+            if reading is None:
+                reading = get_reading(key[2], lat, lng)
+                self._put(key, reading)
+                found[key[2]] = reading
+            results.append(reading)
+        return results
+
+# ----------------------------- GET RANGE -------------------------------- #
+    def get_range(self, start, end, lat: str = None,
+                  lng: str = None) -> List[MoonReading]:
+        """All cached readings with start <= instant < end, in order"""
+        self.flush()
+        lat_key, lng_key, first = self._key(start, lat, lng)
+        last = self._key(end, lat, lng)[2]
+        rows = self._conn.execute(
+            "SELECT instant, moon_phase, illumination, earth_to_moon, "
+            "moon_age, phase_index FROM readings "
+            "WHERE lat = ? AND lng = ? AND instant >= ? AND instant < ? "
+            "ORDER BY instant",
+            (lat_key, lng_key, first, last)
+        )
+        return [self._row_to_reading(row) for row in rows]
+
+# ------------------------------ FLUSH ----------------------------------- #
+    def flush(self):
+        """Write pending readings in one transaction, then prune"""
+        if not self._pending:
+            return
+        _write(self._conn, self._pending)
+        self.prune()
+
+# ------------------------------ PRUNE ----------------------------------- #
+    def prune(self):
+        """
+        Delete the oldest rows once the cache holds more than max_rows.
+        rowid grows with insertion order, so the oldest rows are the
+        lowest rowids. The rowid span is a cheap pre-check, it is never
+        less than the number of rows. Replaced readings leave gaps in
+        the rowids, so only when the span is over max_rows are the rows
+        counted, and exactly the overflow is deleted.
+        """
+        # One MIN or MAX per SELECT, SQLite only reads the ends of the
+        # b-tree for a lone MIN or MAX
+        first, last = self._conn.execute(
+            "SELECT (SELECT MIN(rowid) FROM readings), "
+            "(SELECT MAX(rowid) FROM readings)").fetchone()
+        if last is None or last - first + 1 <= self._max_rows:
+            return
+        count = self._conn.execute(
+            "SELECT COUNT(*) FROM readings").fetchone()[0]
+        if count > self._max_rows:
+            with self._conn:
+                self._conn.execute(
+                    "DELETE FROM readings WHERE rowid IN "
+                    "(SELECT rowid FROM readings ORDER BY rowid LIMIT ?)",
+                    (count - self._max_rows,)
+                )
+
+# ------------------------------ CLOSE ----------------------------------- #
+    def close(self):
+        if self._conn is None:
+            return
+        self.flush()
+        # Closes the connection, and the finalizer does not run again
+        self._finalizer()
+        self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+# ------------------------------ MAIN ------------------------------------ #
+def main():
+    """Cold and warm run over one year of daily readings"""
+    start = datetime.datetime(2024, 1, 1, 12)
+    dates = [start + datetime.timedelta(days=i) for i in range(366)]
+    with MoonCache(":memory:") as cache:
+        for run in ("cold", "warm"):
+            t = time.perf_counter()
+            cache.readings(dates)
+            cache.flush()
+            print(f"{run}: {(time.perf_counter() - t) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,16 +4,79 @@
     Created: 07-08-23
     Purpose: Python moon phase methods class
     06/21/24: Use new method of calculating moon phase
+    10/19/26: Precision tiers, coarse, standard and precise
+    10/19/26: Values are calculated when first read
 """
 # pip install epmem
 import ephem
+import math
 import os
 import datetime
+import tkinter
+import weakref
 from base64 import b64decode
 from tkinter import PhotoImage
 import moon_icon
+import moon_meeus
 import moon_phases_ascii
 
+# Precision tiers for MoonClass, cheapest first. Errors are against
+# the standard tier from 1900 to 2100, see accuracy_harness.py.
+#   coarse    analytic series (moon_meeus.py), about 40 us a reading.
+#             moon_phase within 5e-5 of a lunation (about 2 minutes),
+#             illumination within 0.5%. Distance is from the earth's
+#             center, so it differs from standard by up to an earth
+#             radius. Within minutes of a phase bin boundary the
+#             description can differ.
+#   standard  ephem with its default observer at 0, 0, and two new
+#             moon searches, about 1 ms a reading.
+#   precise   standard, plus the observer at lat, lng: distance as
+#             seen from there, and altitude and azimuth to the arc
+#             second. Phase and illumination are the same as standard.
+PRECISIONS = ("coarse", "standard", "precise")
+
+# Phase images in the same order as MoonClass.moon_phase_descriptions
+PHASE_ICONS = [
+    moon_icon.new,
+    moon_icon.waxing_crescent,
+    moon_icon.first_quarter,
+    moon_icon.waxing_gibbous,
+    moon_icon.full,
+    moon_icon.waning_gibbous,
+    moon_icon.last_quarter,
+    moon_icon.waning_crescent,
+]
+
+# Decoded images for each Tk root, an image only shows in the root it
+# was made for. root -> {(phase index, subsample): PhotoImage}
+_phase_images = weakref.WeakKeyDictionary()
+
+
+def get_phase_image(phase_index: int, subsample: int = 1,
+                    master=None) -> PhotoImage:
+    """
+    Decode a phase image once for each Tk root and share it.
+    subsample shrinks the image, 3 gives a 19 pixel moon.
+    master (optional): any widget of the root, defaults to the
+    default root.
+    """
+    if master is None:
+        root = tkinter._default_root
+        if root is None:
+            raise RuntimeError("phase images need a Tk root window")
+    else:
+        root = master.nametowidget(".")
+    images = _phase_images.setdefault(root, {})
+    key = (phase_index, subsample)
+    if key not in images:
+        if subsample == 1:
+            images[key] = PhotoImage(
+                master=root, data=b64decode(PHASE_ICONS[phase_index]))
+        else:
+            images[key] = get_phase_image(
+                phase_index, master=root).subsample(subsample)
+    return images[key]
+
 
 class MoonClass:
     moon_phase_descriptions = [
@@ -27,7 +90,7 @@ class MoonClass:
         "Waning Crescent (decreasing from full)"
     ]
 
-    def __init__(self,  gui_mode=True, lat: str = '41.862302', lng: str = '-103.6627088') -> None:
+    def __init__(self,  gui_mode=True, lat: str = '41.862302', lng: str = '-103.6627088', cache=None, precision: str = "standard") -> None:
         # Set latitude and longitude properties
         # Default argument lat lng: Scottsbluff, NE, US
         self._lat = lat
@@ -35,52 +98,103 @@ class MoonClass:
 
         self._gui_mode = gui_mode
 
+        # Optional moon_cache.MoonCache, reuses readings across runs
+        self._cache = cache
+
+        # One of PRECISIONS, how much work each reading does
+        if precision not in PRECISIONS:
+            raise ValueError(
+                f"precision must be one of {PRECISIONS}, not {precision!r}")
+        self._precision = precision
+
+        # Instant of the last get_observer and the values worked out
+        # for it so far
+        self._dte = None
+        self._values = {}
+
 # ----------------------- MOON CLASS PROPERTIES ---------------------------#
+    # Moon values are worked out the first time they are read after
+    # get_observer and kept until the next get_observer. Reading only
+    # the distance never searches for new moons or decodes an image.
+    @property
+    def lat(self) -> str:
+        return self._lat
+
+    @property
+    def lng(self) -> str:
+        return self._lng
+
+    @property
+    def precision(self) -> str:
+        return self._precision
+
+    @property
+    def altitude(self) -> float:
+        """Degrees above the horizon at lat, lng, precise tier only"""
+        return self._value("altitude")
+
+    @property
+    def azimuth(self) -> float:
+        """Degrees east of north at lat, lng, precise tier only"""
+        return self._value("azimuth")
+
     @property
     def moon_phase(self) -> float:
-        # print(f"Moon Phase: {self._moon_phase}")
-        return self._moon_phase
+        return self._value("moon_phase")
 
     @property
     def illumination(self) -> float:
-        return self._illumination
+        return self._value("illumination")
+
+    @property
+    def phase_index(self) -> int:
+        """
+        Index into moon_phase_descriptions. The phase of the moon is
+        a fraction, 0.0 being a New Moon, 0.125 waxing crescent,
+        0.25 First Quarter, 0.375 waxing gibbous, 0.5 Full Moon,
+        0.625 waning gibbous, 0.75 Last Quarter, 0.875 waning
+        crescent and 1.0 a New Moon again. Each named phase covers
+        0.0625 either side of its value.
+        """
+        if "phase_index" not in self._values:
+            self._values["phase_index"] = \
+                int((self.moon_phase + 0.0625) / 0.125) % 8
+        return self._values["phase_index"]
 
     @property
     def phase_description(self) -> str:
         """Return phase description"""
-        return self._phase_description
+        return MoonClass.moon_phase_descriptions[self.phase_index]
 
     @property
     def phase_img(self) -> PhotoImage:
         if self._gui_mode == True:
-            """Return moon phase image"""
-            return self._phase_img
+            """Return moon phase image, decoded once and shared"""
+            return get_phase_image(self.phase_index)
 
     @property
     def phase_ascii(self) -> str:
         """Return moon phase image in ascii"""
-        return self._phase_ascii
-    
+        return moon_phases_ascii.moon_phases[self.phase_index]
+
     @property
     def moon_age(self) -> float:
-        return self._moon_age
+        return self._value("moon_age")
 
     @property
     def earth_to_moon(self) -> float:
         """Distance in AU"""
-        return self._earth_to_moon
+        return self._value("earth_to_moon")
 
     @property
     def miles_to_moon(self) -> float:
         """Convert from AU to Miles"""
-        self._miles_to_moon = self._earth_to_moon * 92955807.273
-        return self._miles_to_moon
+        return self.earth_to_moon * 92955807.273
 
     @property
     def km_to_moon(self) -> float:
         """Convert from AU to KM"""
-        self._km_to_moon = 149597870.7 * self._earth_to_moon
-        return self._km_to_moon
+        return 149597870.7 * self.earth_to_moon
 
     @property
     def current_time(self):
@@ -95,8 +209,9 @@ class MoonClass:
 # ----------------------- GET EPHEM OBSERVER ----------------------------- #
     def get_observer(self, dte=None):
         """
-        Calculate and retrieve information about the moon based
-        on a given time and observer location.
+        Set the time for the moon information. Each value is
+        calculated when it is first read, so reading only some of
+        the properties only pays for those.
 
         Args:
             time (str, optional): A string representing the date
@@ -133,12 +248,61 @@ class MoonClass:
             # Set time to 12 noon
             dte = ephem.Date(dte + 12 * ephem.hour)
 
+        # New instant, forget the values of the last one
+        self._dte = dte
+        self._values = {}
+
+# --------------------------- LAZY VALUES -------------------------------- #
+    def _value(self, name: str):
+        """A value for the current instant, calculated on first use"""
+        if name not in self._values:
+            if self._dte is None:
+                raise AttributeError(f"{name}: call get_observer first")
+            if self._cache is not None and self._precision == "standard":
+                self._read_cache()
+            elif name in ("moon_phase", "moon_age"):
+                self._calculate_lunation()
+            else:
+                self._calculate_moon()
+        return self._values[name]
+
+    def _read_cache(self):
+        """Persistent cache skips ephem for instants already computed"""
+        reading = self._cache.get_reading(self._dte)
+        self._values.update(
+            moon_phase=reading.moon_phase,
+            moon_age=reading.moon_age,
+            earth_to_moon=reading.earth_to_moon,
+            illumination=reading.illumination,
+            altitude=None,
+            azimuth=None,
+        )
+
+# ------------------------- CALCULATE MOON ------------------------------- #
+    def _calculate_moon(self):
+        """Distance and illumination from one moon position"""
+        dte = self._dte
+
+        # Coarse tier, analytic series instead of ephem
+        if self._precision == "coarse":
+            jd = dte + moon_meeus.DUBLIN_JD
+            self._values.update(
+                illumination=moon_meeus.illumination(jd),
+                earth_to_moon=moon_meeus.distance_km(jd) /
+                moon_meeus.KM_PER_AU,
+                altitude=None,
+                azimuth=None,
+            )
+            return
+
         # Create observer object with the time of observation
         observer = ephem.Observer()
         observer.date = dte
 
-        # self.observer.lat = self._lat
-        # self.observer.long = self._lng
+        # Precise tier puts the observer where the user is
+        if self._precision == "precise":
+            observer.lat = self._lat
+            observer.lon = self._lng
 
         # Create moon object from time parameter
         moon = ephem.Moon(dte)
@@ -146,15 +310,41 @@ class MoonClass:
         # Calculate moon information based on observer information
         moon.compute(observer)
 
-    # --------------------- CALCULATE LUNATION --------------------------- #
-        # Find the date of the previous new moon relative to the input date
-        previous_new_moon = ephem.previous_new_moon(dte)
+        # Distance from earth to the moon
+        self._values["earth_to_moon"] = moon.earth_distance
+
+        # Surface illumination of the moon in percent
+        self._values["illumination"] = moon.phase
+
+        if self._precision == "precise":
+            self._values["altitude"] = math.degrees(moon.alt)
+            self._values["azimuth"] = math.degrees(moon.az)
+        else:
+            self._values["altitude"] = None
+            self._values["azimuth"] = None
+
+# ----------------------- CALCULATE LUNATION ----------------------------- #
+    def _calculate_lunation(self):
+        """Moon phase and age from the new moons either side"""
+        dte = self._dte
+
+        if self._precision == "coarse":
+            # Analytic new moons, no searches
+            previous_new_moon, next_new_moon = (
+                jd - moon_meeus.DUBLIN_JD for jd in
+                moon_meeus.lunation_bounds(dte + moon_meeus.DUBLIN_JD)
+            )
+        else:
+            # Find the date of the previous new moon relative to the
+            # input date
+            previous_new_moon = ephem.previous_new_moon(dte)
 
-        # Tind the date of the next new moon relative to the input date (dte)
-        next_new_moon = ephem.next_new_moon(dte)
+            # Find the date of the next new moon relative to the input
+            # date (dte)
+            next_new_moon = ephem.next_new_moon(dte)
 
         # Calculate moon age (days since last new moon)
-        self._moon_age = ephem.Date(dte) - ephem.Date(previous_new_moon)
+        self._values["moon_age"] = dte - previous_new_moon
 
         # Calculate the lunation which is the fractional position of the
         # moon in its cycle. It does this by subtracting the date of the
@@ -170,139 +360,25 @@ class MoonClass:
         # cycle that has passed. 0 represents a new moon, 0.5 represents
         # a full moon, and values in between represent waxing or
         # waning crescent, gibbous, or quarter moons.
-        self._moon_phase = lunation % 1
-
-        # Distance from earth to the moon
-        self._earth_to_moon = moon.earth_distance
+        self._values["moon_phase"] = lunation % 1
 
-        # Surface illumination of the moon in decimal
-        self._illumination = moon.phase
-        # print(self._illumination)
+    # The values are worked out when read. These are kept for callers
+    # of the old methods and return the description.
+    def get_phase_description(self) -> str:
+        """Description for the current mode"""
         if self._gui_mode == True:
-            self.get_phase_description_gui()
-        else:
-            self.get_phase_description_cli()
+            return self.get_phase_description_gui()
+        return self.get_phase_description_cli()
 
 # --------------- MOON PHASE GUI DESCRIPTION AND IMAGE ------------------- #
-    def get_phase_description_gui(self):
-        """ Convert moon phase to description
-        from 0 (the new moon) to 0.5 (the full moon)
-        and back to 1 (the next new moon)
-
-        The phase of the moon is returned as a fraction,
-        0.0 being a New Moon, 0.125 waxing crescent
-        0.25 being a First Quarter, 0.325 waxing gibbous
-        0.5 being a Full Moon, .625 waning gibbous
-        0.75 being a Last Quarter, 0.825 waning cresent
-        and 1.0 being a New Moon again.
-        """
-        # print(self._moon_phase)
-
-        if (abs(self._moon_phase - 0) < 0.0625):
-            # Moon phase description
-            self._phase_description = MoonClass.moon_phase_descriptions[0]
-            # photo = Image.open(r"./assets/new.png")
-            self._phase_img = PhotoImage(data=b64decode(moon_icon.new))
-
-        elif (abs(self._moon_phase - 0.125) < 0.0625):
-            self._phase_description = MoonClass.moon_phase_descriptions[1]
-            # photo = Image.open(r"./assets/waxing_crescent.png")
-            self._phase_img = PhotoImage(
-                data=b64decode(moon_icon.waxing_crescent))
-
-        elif (abs(self._moon_phase - 0.25) < 0.0625):
-            self._phase_description = MoonClass.moon_phase_descriptions[2]
-            # photo = Image.open(r"./assets/first_quarter.png")
-            self._phase_img = PhotoImage(
-                data=b64decode(moon_icon.first_quarter))
-
-        elif (abs(self._moon_phase - 0.375) < 0.0625):
-            self._phase_description = MoonClass.moon_phase_descriptions[3]
-            # photo = Image.open(r"./assets/waxing_gibbous.png")
-            self._phase_img = PhotoImage(
-                data=b64decode(moon_icon.waxing_gibbous))
-
-        elif (abs(self._moon_phase - 0.5) < 0.0625):
-            self._phase_description = MoonClass.moon_phase_descriptions[4]
-            self._phase_img = PhotoImage(data=b64decode(moon_icon.full))
-
-        elif (abs(self._moon_phase - 0.625) < 0.0625):
-            self._phase_description = MoonClass.moon_phase_descriptions[5]
-            self._phase_img = PhotoImage(
-                data=b64decode(moon_icon.waning_gibbous))
-
-        elif (abs(self._moon_phase - 0.75) < 0.0625):
-            self._phase_description = MoonClass.moon_phase_descriptions[6]
-            self._phase_img = PhotoImage(
-                data=b64decode(moon_icon.last_quarter))
-
-        elif (abs(self._moon_phase - 0.875) < 0.0625):
-            self._phase_description = MoonClass.moon_phase_descriptions[7]
-            self._phase_img = PhotoImage(
-                data=b64decode(moon_icon.waning_crescent))
-
-        elif (abs(self._moon_phase - 1.0) < 0.0625):
-            self._phase_description = MoonClass.moon_phase_descriptions[0]
-            self._phase_img = PhotoImage(data=b64decode(moon_icon.new))
+    def get_phase_description_gui(self) -> str:
+        """Description, the image is the phase_img property"""
+        return MoonClass.moon_phase_descriptions[self.phase_index]
 
 # -------------- MOON PHASE CLI DESCRIPTION AND ASCII IMAGE -------------- #
-    def get_phase_description_cli(self):
-        """ Convert moon phase to description
-        from 0 (the new moon) to 0.5 (the full moon)
-        and back to 1 (the next new moon)
-
-        The phase of the moon is returned as a fraction,
-        0.0 being a New Moon, 0.125 waxing crescent
-        0.25 being a First Quarter, 0.325 waxing gibbous
-        0.5 being a Full Moon, .625 waning gibbous
-        0.75 being a Last Quarter, 0.825 waning cresent
-        and 1.0 being a New Moon again.
-        """
-
-        if (abs(self._moon_phase - 0) < 0.0625):
-            self._phase_description = MoonClass.moon_phase_descriptions[0]
-            # New moon
-            self._phase_ascii = moon_phases_ascii.moon_phases[0]
-
-        elif (abs(self._moon_phase - 0.125) < 0.0625):
-            self._phase_description = MoonClass.moon_phase_descriptions[1]
-            # Waxing crescent
-            self._phase_ascii = moon_phases_ascii.moon_phases[1]
-
-        elif (abs(self._moon_phase - 0.25) < 0.0625):
-            self._phase_description = MoonClass.moon_phase_descriptions[2]
-            # First quarter
-            self._phase_ascii = moon_phases_ascii.moon_phases[2]
-
-        elif (abs(self._moon_phase - 0.375) < 0.0625):
-            self._phase_description = MoonClass.moon_phase_descriptions[3]
-            # Waxing gibbous
-            self._phase_ascii = moon_phases_ascii.moon_phases[3]
-
-        elif (abs(self._moon_phase - 0.5) < 0.0625):
-            self._phase_description = MoonClass.moon_phase_descriptions[4]
-            # Full moon
-            self._phase_ascii = moon_phases_ascii.moon_phases[4]
-
-        elif (abs(self._moon_phase - 0.625) < 0.0625):
-            self._phase_description = MoonClass.moon_phase_descriptions[5]
-            # Waning gibbous
-            self._phase_ascii = moon_phases_ascii.moon_phases[5]
-
-        elif (abs(self._moon_phase - 0.75) < 0.0625):
-            # Last Quarter
-            self._phase_description = MoonClass.moon_phase_descriptions[6]
-            self._phase_ascii = moon_phases_ascii.moon_phases[6]
-
-        elif (abs(self._moon_phase - 0.875) < 0.0625):
-            # Waning crescent
-            self._phase_description = MoonClass.moon_phase_descriptions[7]
-            self._phase_ascii = moon_phases_ascii.moon_phases[7]
-
-        elif (abs(self._moon_phase - 1.0) < 0.0625):
-            # New moon
-            self._phase_description = MoonClass.moon_phase_descriptions[0]
-            self._phase_ascii = moon_phases_ascii.moon_phases[0]
+    def get_phase_description_cli(self) -> str:
+        """Description, the ascii art is the phase_ascii property"""
+        return MoonClass.moon_phase_descriptions[self.phase_index]
 
 # -------------------- GET FORMATTED TIME -------------------------------- #
     def get_formatted_time(self, dte):
@@ -326,3 +402,33 @@ class MoonClass:
             self._formatted_time = dte.strftime(
                 " %-m/%-d/%Y"
             )
+
+
+# ---------------------------- BENCHMARK --------------------------------- #
+def benchmark(days: int = 500):
+    """Time get_observer plus reading only some of the properties"""
+    import time
+    start = datetime.datetime(2024, 1, 1)
+    dates = [start + datetime.timedelta(days=i) for i in range(days)]
+    patterns = {
+        "earth_to_moon": ("earth_to_moon",),
+        "illumination": ("illumination",),
+        "phase_description": ("phase_description",),
+        "every value": ("earth_to_moon", "illumination", "moon_age",
+                        "phase_description"),
+    }
+    for precision in PRECISIONS:
+        print(precision)
+        moon = MoonClass(gui_mode=False, precision=precision)
+        for name, fields in patterns.items():
+            t = time.perf_counter()
+            for dte in dates:
+                moon.get_observer(dte)
+                for field in fields:
+                    getattr(moon, field)
+            elapsed = time.perf_counter() - t
+            print(f"    {name:<18} {elapsed / days * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,129 @@
+"""
+    Name: moon_client.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: Thin client for moon_daemon.py
+    Takes the same arguments as moon_phase_calculator_cli.py and prints
+    the same output. The query goes to the daemon over a Unix domain
+    socket when one is running, otherwise the answer is computed here.
+    Startup is most of an invocation's time, so only os, sys and the
+    C socket module are imported until the fallback needs ephem. No
+    json (it pulls in re), no typing and not the socket module (enum
+    and selectors, about 10 ms): the messages are plain text.
+
+    The socket lives in a directory only this user can open,
+    XDG_RUNTIME_DIR or moon_daemon_<uid> in the temp folder. Before
+    connecting the client also checks the path is a socket owned by
+    this user that nobody else may use. Anything else, say a file
+    another user put there first, is ignored and the answer is worked
+    out in process.
+
+    Protocol, one query per connection:
+        client: command and arguments joined by NUL, then EOF.
+                command is "run" or "stop".
+        daemon: exit code, a newline, the output text, then EOF.
+
+    Usage:
+        python moon_client.py 2024-05-01
+"""
+# Annotations stay strings, so typing is never imported
+from __future__ import annotations
+import os
+# Already imported by os, free
+import stat
+import sys
+# The C half of the socket module, socket.py adds nothing used here
+import _socket
+
+
+def socket_path() -> str:
+    """
+    MOON_DAEMON_SOCKET, or moon_daemon.sock in XDG_RUNTIME_DIR (mode
+    0700, per user), or in a moon_daemon_<uid> folder in the temp
+    folder that moon_daemon.py creates with mode 0700
+    """
+    path = os.environ.get("MOON_DAEMON_SOCKET")
+    if path:
+        return path
+    directory = os.environ.get("XDG_RUNTIME_DIR")
+    if not directory:
+        # tempfile.gettempdir() costs several ms of imports, and
+        # AF_UNIX sockets only exist where TMPDIR or /tmp is the temp
+        # folder
+        directory = os.path.join(os.environ.get("TMPDIR", "/tmp"),
+                                 f"moon_daemon_{os.getuid()}")
+    return os.path.join(directory, "moon_daemon.sock")
+
+
+def is_private(path: str, kind: int = stat.S_IFSOCK) -> bool:
+    """
+    True if path is a socket (or kind, e.g. stat.S_IFDIR) owned by
+    this user, not a symlink, with no group or other permissions
+    """
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return (stat.S_IFMT(st.st_mode) == kind
+            and st.st_uid == os.getuid()
+            and not st.st_mode & 0o077)
+
+
+# ------------------------------ QUERY ----------------------------------- #
+def send(command: str, args: list[str] = (), path: str = None,
+         timeout: float = 5.0) -> tuple[int, str] | None:
+    """
+    Send one command to the daemon.
+
+    Returns:
+        (exit code, output text), None if no daemon is listening
+    """
+    if not hasattr(_socket, "AF_UNIX"):
+        return None
+    path = path or socket_path()
+    # No socket, no daemon, do not even try. A socket someone else
+    # could have made or could listen on is not trusted either.
+    if not is_private(path):
+        return None
+    sock = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        sock.sendall("\0".join([command, *args]).encode())
+        sock.shutdown(_socket.SHUT_WR)
+        chunks = []
+        while chunk := sock.recv(65536):
+            chunks.append(chunk)
+        code, output = b"".join(chunks).decode().split("\n", 1)
+        return int(code), output
+    except (OSError, ValueError):
+        # Nobody listening, or a daemon that went away part way
+        # through, work it out here instead
+        return None
+    finally:
+        sock.close()
+
+
+def query(args: list[str], path: str = None) -> tuple[int, str] | None:
+    """The daemon's answer for moon_phase_calculator_cli.py args"""
+    return send("run", args, path)
+
+
+def run(args: list[str]) -> tuple[int, str]:
+    """Daemon answer, or the in process answer without one"""
+    answer = query(args)
+    if answer is None:
+        # Only now pay for ephem
+        import moon_phase_calculator_cli
+        answer = moon_phase_calculator_cli.run(args)
+    return answer
+
+
+def main():
+    code, output = run(sys.argv[1:])
+    print(output)
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
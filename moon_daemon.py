@@ -0,0 +1,284 @@
+"""
+    Name: moon_daemon.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: Keep the moon phase calculator warm between invocations
+    Every run of moon_phase_calculator_cli.py starts Python, imports
+    ephem and works the moon out from nothing. The daemon does the
+    imports once, listens on a Unix domain socket and answers
+    moon_client.py with the exact output the CLI would print.
+
+    The daemon keeps lunation tables (lunation_tables.py) a decade at
+    a time, built when a date in that decade is first asked for, so a
+    new date costs one moon position and no new moon search. Answers
+    for a date are kept too, so a script asking about the same days
+    again gets them without any ephem work.
+
+    The socket is made with no group or other permissions, in a folder
+    only this user can open (see moon_client.socket_path).
+
+    Only moon_phase_calculator_cli.py is served. moon_phase_cli.py
+    prompts for a city, so scripts cannot call it.
+
+    Usage:
+        python moon_daemon.py &
+        python moon_client.py 2024-05-01
+        python moon_daemon.py --stop
+        python moon_daemon.py --benchmark
+"""
+import argparse
+import datetime
+import os
+import socketserver
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, List, Tuple
+# pip install ephem
+import ephem
+import moon_phase_calculator_cli
+from lunation_tables import LunationTable
+from moon_client import is_private, query, send, socket_path
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Answers for dated queries, about 300 bytes each
+CACHE_SIZE = 65536
+# Years covered by one lunation table, about 0.2 s to build
+DECADE = 10
+
+
+class DecadeTables:
+    """
+    Lunation tables a decade at a time, built on first use. Has the
+    covers and bounds of a LunationTable, for MoonCalculator.
+    """
+
+    def __init__(self) -> None:
+        self._tables: Dict[int, LunationTable] = {}
+
+    def _table(self, dte: float) -> LunationTable:
+        first = ephem.Date(dte).datetime().year // DECADE * DECADE
+        table = self._tables.get(first)
+        if table is None:
+            table = LunationTable.build(
+                datetime.datetime(first, 1, 1),
+                datetime.datetime(first + DECADE, 1, 1))
+            self._tables[first] = table
+        return table
+
+    def covers(self, dte) -> bool:
+        # Years datetime can not hold are searched for
+        return _FIRST <= float(dte) < _LAST
+
+    def bounds(self, dte) -> Tuple[float, float]:
+        return self._table(float(dte)).bounds(dte)
+
+
+_FIRST = float(ephem.Date("1/1/1"))
+_LAST = float(ephem.Date(f"{9999 - DECADE}/1/1"))
+lunations = DecadeTables()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _dated_answer(args: Tuple[str, ...]) -> Tuple[int, str]:
+    return moon_phase_calculator_cli.run(list(args), lunations)
+
+
+def answer(args: List[str]) -> Tuple[int, str]:
+    """Same (exit code, output) as moon_phase_calculator_cli.run"""
+    if not args:
+        # "Now" changes, never cache it
+        return moon_phase_calculator_cli.run(args, lunations)
+    return _dated_answer(tuple(args))
+
+
+# ----------------------------- HANDLER ---------------------------------- #
+class MoonHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        # The whole request arrives before the client's EOF, see
+        # moon_client.py for the protocol
+        try:
+            command, *args = self.rfile.read().decode().split("\0")
+        except UnicodeDecodeError:
+            return
+        if command == "stop":
+            self._send(0, "stopping")
+            # shutdown waits for serve_forever, so not on this thread
+            threading.Thread(target=self.server.shutdown).start()
+            return
+        if command != "run":
+            self._send(1, f"moon_daemon: unknown command {command!r}")
+            return
+        # ephem is not thread safe, one calculation at a time
+        with self.server.lock:
+            try:
+                code, output = answer(args)
+            except Exception as e:
+                code, output = 1, f"moon_daemon: {e}"
+        self._send(code, output)
+
+    def _send(self, code: int, output: str):
+        self.wfile.write(f"{code}\n{output}".encode())
+
+
+class MoonServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str) -> None:
+        self.lock = threading.Lock()
+        super().__init__(path, MoonHandler)
+
+
+# ------------------------------ SERVE ----------------------------------- #
+def _private_directory(directory: str):
+    """Make directory with mode 0700, or check an existing one is"""
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    if not is_private(directory, stat.S_IFDIR):
+        sys.exit(f"moon_daemon: {directory} is not a folder only this "
+                 f"user can open")
+
+
+def serve(path: str = None):
+    """Answer queries on path until stopped"""
+    if path is None:
+        path = socket_path()
+        if not os.environ.get("MOON_DAEMON_SOCKET"):
+            _private_directory(os.path.dirname(path))
+    if os.path.lexists(path):
+        # Never remove what is not our own socket
+        if not is_private(path):
+            sys.exit(f"moon_daemon: {path} exists and is not this "
+                     f"user's private socket, not removing it")
+        if query([], path) is not None:
+            sys.exit(f"moon_daemon is already running on {path}")
+        # Left over from a daemon that was killed
+        os.remove(path)
+
+    # Warm up: the first calculation loads ephem's data, and the
+    # lunation table of this decade is built
+    answer([])
+    # No group or other permissions from the moment bind makes it,
+    # nobody else can connect before a chmod
+    umask = os.umask(0o177)
+    try:
+        server = MoonServer(path)
+    finally:
+        os.umask(umask)
+    print(f"moon_daemon listening on {path}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if is_private(path):
+            os.remove(path)
+
+
+def stop(path: str = None) -> bool:
+    """Ask a running daemon to exit, False if none is running"""
+    return send("stop", path=path) is not None
+
+
+# ---------------------------- BENCHMARK --------------------------------- #
+def _days(runs: int) -> List[str]:
+    """A different day each run, in the 2020s"""
+    first = datetime.date(2020, 1, 1)
+    return [str(first + datetime.timedelta(days=i * 7)) for i in range(runs)]
+
+
+def _latency(command: List[str], runs: int, env: dict) -> float:
+    """Average seconds for a new process to run command to the end"""
+    t = time.perf_counter()
+    for day in _days(runs):
+        subprocess.run(command + [day], env=env, check=True,
+                       stdout=subprocess.DEVNULL)
+    return (time.perf_counter() - t) / runs
+
+
+def _answer_time(runs: int, tables) -> float:
+    """Average seconds to work out one new date in this process"""
+    days = [[day] for day in _days(runs)]
+    t = time.perf_counter()
+    for day in days:
+        moon_phase_calculator_cli.run(day, tables)
+    return (time.perf_counter() - t) / runs
+
+
+def benchmark(runs: int = 20):
+    """End to end latency per invocation, with and without the daemon"""
+    directory = tempfile.TemporaryDirectory()
+    path = os.path.join(directory.name, "moon_daemon.sock")
+    env = {**os.environ, "MOON_DAEMON_SOCKET": path}
+    python = sys.executable
+    cli = [python, os.path.join(HERE, "moon_phase_calculator_cli.py")]
+    client = [python, os.path.join(HERE, "moon_client.py")]
+
+    # Python starting and exiting, the least any invocation costs
+    bare = _latency([python, "-c", "pass"], runs, env)
+    direct = _latency(cli, runs, env)
+    fallback = _latency(client, runs, env)
+
+    daemon = subprocess.Popen([python, os.path.abspath(__file__)],
+                              env=env, stdout=subprocess.PIPE, text=True)
+    try:
+        daemon.stdout.readline()
+        # New days, worked out from the daemon's lunation table
+        miss = _latency(client, runs, env)
+        # Same days again, answered from the daemon's cache
+        hit = _latency(client, runs, env)
+    finally:
+        stop(path)
+        daemon.wait()
+        directory.cleanup()
+
+    # The work a cache miss does inside the daemon, with the decade's
+    # table already built, against a new moon search
+    tables = DecadeTables()
+    _answer_time(1, tables)
+    searched = _answer_time(runs, None)
+    looked_up = _answer_time(runs, tables)
+
+    print(f"{runs} invocations each, end to end")
+    print(f"python -c pass                   {bare * 1000:7.1f} ms")
+    print(f"moon_phase_calculator_cli.py     {direct * 1000:7.1f} ms")
+    print(f"moon_client.py, no daemon        {fallback * 1000:7.1f} ms")
+    print(f"moon_client.py, daemon cache miss {miss * 1000:6.1f} ms")
+    print(f"moon_client.py, daemon cache hit  {hit * 1000:6.1f} ms")
+    print("One new date inside the daemon")
+    print(f"new moon searched                {searched * 1000:7.2f} ms")
+    print(f"new moon from the lunation table {looked_up * 1000:7.2f} ms")
+
+
+# ------------------------------ MAIN ------------------------------------ #
+def main():
+    parser = argparse.ArgumentParser(
+        description="Answer moon_client.py queries from a warm process")
+    parser.add_argument("--socket", help="socket path, default "
+                        "MOON_DAEMON_SOCKET or one in the temp folder")
+    parser.add_argument("--stop", action="store_true",
+                        help="stop the running daemon")
+    parser.add_argument("--benchmark", type=int, nargs="?", const=20,
+                        metavar="RUNS",
+                        help="time invocations with and without a daemon")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+    elif args.stop:
+        if not stop(args.socket):
+            sys.exit("moon_daemon is not running")
+    else:
+        serve(args.socket)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""
+    Name: moon_ical.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: iCalendar (.ics) feed of moon phase events
+    Principal phases, and optionally the moon entering each named
+    phase, for any span of years. Events come from one sweep through
+    the phase events (lunation_tables.iter_phase_events), each search
+    starting from the event before it. Named phase changes are worked
+    out from the new moons either side, with no searches at all.
+
+    The span is swept in 10 year chunks by worker processes and the
+    chunks are written in order as they finish, so memory stays the
+    same for any span. Each event's UID is its lunation number and
+    kind, and nothing in an event depends on the span or on when the
+    feed was made. A feed for a longer span is the shorter feed with
+    events added, and --append adds only the new ones to a file.
+
+    Usage:
+        python moon_ical.py 2000 2499 --out moon.ics
+        python moon_ical.py 2027 2027 --tz America/Denver --bins
+        python moon_ical.py 2000 2599 --out moon.ics --append
+"""
+import argparse
+import datetime
+import os
+import time
+from multiprocessing import Pool
+from typing import Iterator, List, NamedTuple, Tuple
+from zoneinfo import ZoneInfo
+# pip install ephem
+import ephem
+from lunar_calendar_report import EVENT_GLYPHS, PHASE_GLYPHS, lunation_number
+from lunation_tables import EVENT_NAMES, NEW, iter_phase_events
+from moon_class import MoonClass
+
+# Days swept by one worker task, about 500 events
+CHUNK_DAYS = 3652.5
+
+PRODID = "-//William A Loring//MoonPhase//EN"
+UID_DOMAIN = "moonphase"
+KIND_SLUGS = ("new-moon", "first-quarter", "full-moon", "last-quarter")
+# DTSTAMP of every event. RFC 5545 wants the time the event was made,
+# but a feed made now and the same feed made next year must be the same
+# bytes, or --append and a regenerated feed would differ. This is when
+# the event text last changed. Change it when event_text changes, so
+# calendar apps take the new events.
+FEED_STAMP = "20261019T000000Z"
+
+
+class FeedEvent(NamedTuple):
+    # ephem date
+    date: float
+    # Lunation number and kind, e.g. 1283-full-moon
+    uid: str
+    summary: str
+    lunation: int
+
+
+# ----------------------------- EVENTS ----------------------------------- #
+def chunk_events(span: Tuple[float, float, bool]) -> List[FeedEvent]:
+    """
+    Worker: events from start up to end in time order.
+
+    Args:
+        span: (start, end, bins), ephem dates, bins adds the named
+            phase changes
+    """
+    start, end, bins = span
+    events = []
+    new_moon = None
+    # One lunation past end, so the last lunation's phase changes
+    # have its closing new moon
+    for dte, kind in iter_phase_events(start, end + 30):
+        if kind == NEW:
+            if bins and new_moon is not None:
+                events.extend(bin_events(new_moon, dte))
+            new_moon = dte
+        lunation = lunation_number(new_moon)
+        events.append(FeedEvent(
+            dte, f"{lunation}-{KIND_SLUGS[kind]}",
+            f"{EVENT_GLYPHS[kind]} {EVENT_NAMES[kind]}", lunation))
+    events.sort()
+    return [event for event in events if start <= event.date < end]
+
+
+def bin_events(new_moon: float, next_new_moon: float) -> List[FeedEvent]:
+    """The moon entering each named phase, same bins as MoonClass"""
+    lunation = lunation_number(new_moon)
+    length = next_new_moon - new_moon
+    events = []
+    for k in range(8):
+        index = (k + 1) % 8
+        events.append(FeedEvent(
+            new_moon + (k / 8 + 1 / 16) * length,
+            f"{lunation}-phase-{index}",
+            f"{PHASE_GLYPHS[index]} "
+            f"{MoonClass.moon_phase_descriptions[index]}",
+            lunation))
+    return events
+
+
+def iter_events(start, end, bins: bool = False,
+                workers: int = None) -> Iterator[FeedEvent]:
+    """Events from start up to end, chunks swept in parallel"""
+    start = float(ephem.Date(start))
+    end = float(ephem.Date(end))
+    spans = []
+    while start < end:
+        spans.append((start, min(start + CHUNK_DAYS, end), bins))
+        start += CHUNK_DAYS
+    if workers == 1 or len(spans) == 1:
+        chunks = map(chunk_events, spans)
+        for chunk in chunks:
+            yield from chunk
+        return
+    with Pool(workers) as pool:
+        # imap hands back the chunks in order as soon as each is ready
+        for chunk in pool.imap(chunk_events, spans):
+            yield from chunk
+
+
+# ---------------------------- ICALENDAR --------------------------------- #
+def escape(text: str) -> str:
+    """RFC 5545 TEXT value"""
+    return (text.replace("\\", "\\\\").replace(";", "\\;")
+            .replace(",", "\\,").replace("\n", "\\n"))
+
+
+def fold(line: str) -> str:
+    """Fold a content line at 75 octets, never inside a UTF-8 character"""
+    data = line.encode("utf-8")
+    if len(data) <= 75:
+        return line
+    parts = []
+    limit = 75
+    while len(data) > limit:
+        cut = limit
+        # Continuation bytes are 10xxxxxx, back up to a character start
+        while data[cut] & 0xC0 == 0x80:
+            cut -= 1
+        parts.append(data[:cut].decode("utf-8"))
+        data = data[cut:]
+        # Continuation lines start with a space, which counts
+        limit = 74
+    parts.append(data.decode("utf-8"))
+    return "\r\n ".join(parts)
+
+
+def utc_stamp(dte: float) -> str:
+    """ephem date as an iCalendar UTC date-time, to the second"""
+    when = ephem.Date(dte).datetime() + datetime.timedelta(seconds=0.5)
+    return f"{when:%Y%m%dT%H%M%S}Z"
+
+
+def calendar_header(zone: str, bins: bool) -> str:
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "X-WR-CALNAME:Moon Phases",
+        # Times are UTC, this asks calendar apps to show them in zone
+        f"X-WR-TIMEZONE:{zone}",
+        # --append adds the same kinds of events as the feed holds
+        f"X-MOONPHASE-BINS:{'TRUE' if bins else 'FALSE'}",
+    ]
+    return "".join(fold(line) + "\r\n" for line in lines)
+
+
+CALENDAR_FOOTER = "END:VCALENDAR\r\n"
+
+
+def event_text(event: FeedEvent, zone: ZoneInfo) -> str:
+    stamp = utc_stamp(event.date)
+    local = ephem.Date(event.date).datetime().replace(
+        tzinfo=datetime.timezone.utc).astimezone(zone)
+    name = event.summary.split(" ", 1)[1]
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{event.uid}@{UID_DOMAIN}",
+        f"DTSTAMP:{FEED_STAMP}",
+        f"DTSTART:{stamp}",
+        f"SUMMARY:{escape(event.summary)}",
+        "DESCRIPTION:" + escape(
+            f"{name}, {local:%Y-%m-%d %H:%M %Z}, "
+            f"lunation {event.lunation}"),
+        "TRANSP:TRANSPARENT",
+        "END:VEVENT",
+    ]
+    return "".join(fold(line) + "\r\n" for line in lines)
+
+
+# ----------------------------- WRITE FEED ------------------------------- #
+def write_feed(path: str, start, end, tz: str = "UTC", bins: bool = False,
+               workers: int = None) -> int:
+    """Write the events from start up to end to path, returns the count"""
+    zone = ZoneInfo(tz)
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(calendar_header(tz, bins))
+        for event in iter_events(start, end, bins, workers):
+            f.write(event_text(event, zone))
+            count += 1
+        f.write(CALENDAR_FOOTER)
+    return count
+
+
+def append_feed(path: str, end, bins: bool = False,
+                workers: int = None) -> int:
+    """
+    Add the events after the last one in the feed at path, up to end.
+    The feed's own time zone is kept. Returns the number added. Raises
+    ValueError when bins is not what the feed was made with.
+    """
+    with open(path, encoding="utf-8", newline="") as f:
+        text = f.read()
+    footer = text.rfind(CALENDAR_FOOTER)
+    if footer < 0:
+        raise ValueError(f"{path} is not a complete iCalendar file")
+    tz = "UTC"
+    feed_bins = None
+    last = None
+    for line in text.splitlines():
+        if line.startswith("X-WR-TIMEZONE:"):
+            tz = line.split(":", 1)[1]
+        elif line.startswith("X-MOONPHASE-BINS:"):
+            feed_bins = line.split(":", 1)[1] == "TRUE"
+        elif line.startswith("DTSTART:"):
+            last = line.split(":", 1)[1]
+    if last is None:
+        raise ValueError(f"{path} has no events to continue from")
+    if feed_bins is None:
+        raise ValueError(f"{path} does not say if it has named phase "
+                         "changes, make it again without --append")
+    if feed_bins != bins:
+        raise ValueError(
+            f"{path} was made {'with' if feed_bins else 'without'} "
+            f"--bins, append {'with' if feed_bins else 'without'} it too")
+
+    zone = ZoneInfo(tz)
+    last_date = float(ephem.Date(
+        datetime.datetime.strptime(last, "%Y%m%dT%H%M%SZ")))
+    count = 0
+    # Cut the footer off and carry on where the feed stopped
+    with open(path, "r+", encoding="utf-8", newline="") as f:
+        f.seek(len(text[:footer].encode("utf-8")))
+        f.truncate()
+        for event in iter_events(last_date, end, bins, workers):
+            # Events are written to the second, the last one may be
+            # just after last_date
+            if utc_stamp(event.date) > last:
+                f.write(event_text(event, zone))
+                count += 1
+        f.write(CALENDAR_FOOTER)
+    return count
+
+
+# ------------------------------ MAIN ------------------------------------ #
+def main():
+    parser = argparse.ArgumentParser(
+        description="iCalendar feed of moon phase events")
+    parser.add_argument("first", type=int, help="first year")
+    parser.add_argument("last", type=int, help="last year")
+    parser.add_argument("--out", default="moon_phases.ics",
+                        help="feed file name")
+    parser.add_argument("--tz", default="UTC",
+                        help="time zone for descriptions and calendar "
+                        "apps, e.g. America/Denver")
+    parser.add_argument("--bins", action="store_true",
+                        help="also the moon entering each named phase")
+    parser.add_argument("--append", action="store_true",
+                        help="add events after the end of an existing "
+                        "--out file up to the end of last")
+    parser.add_argument("--workers", type=int,
+                        help="worker processes, default one per CPU")
+    args = parser.parse_args()
+
+    end = datetime.datetime(args.last + 1, 1, 1)
+    t = time.perf_counter()
+    if args.append and os.path.exists(args.out):
+        try:
+            count = append_feed(args.out, end, args.bins, args.workers)
+        except ValueError as e:
+            parser.error(str(e))
+        action = "Added"
+    else:
+        count = write_feed(args.out, datetime.datetime(args.first, 1, 1),
+                           end, args.tz, args.bins, args.workers)
+        action = "Wrote"
+    print(f"{action} {count:,} events to {args.out} in "
+          f"{time.perf_counter() - t:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
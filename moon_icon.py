@@ -1,6 +1,7 @@
 # For including program icons with Nuitka. Nuitka onefile doesn't work quite right with ico files.
 # Got to https://pythonassets.com/posts/window-icon-in-tk-tkinter, about in the middle where the paragraph starts out with "A second less elegant, but . . .""
 # Another resource: https://reshmaharidhas.medium.com/how-to-pack-images-in-python-tkinter-file-to-an-exe-file-c867637d7e80
+# Images from assets/ are generated by build_assets.py, do not edit them by hand
 moon_16 = """iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAIGNIUk0AAHomAACAhAAA+gAAAIDoAAB1MAAA6mAAADqYAAAXcJy6UTwAAAEUUExURQAAAP++Vf++VP+8Uf+7Vf+8VP+9Vf+9U/++Vv+9VP+/Vf+/Vv++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf///7WSCFUAAABadFJOUwAAAAAAAAAAAAAAAAIDATRPBQgLfaEgJn+qLRsu2fl2PU4EPOO5DT8Og5karAl4qCccKCvoYiNFR4FG+MsZ5f6YEgwGpfy9YTlAijPc8+1Dzt5aHW6rwLJ8Kdlgt0UAAAABYktHRFt0vJU0AAAAB3RJTUUH6AUfFDcP7c5N/wAAAMhJREFUGNNNj2tXgmAQhN/BJE1EQCOzRCnvXSw0LVFRsfJuZWnt//8hCmE0n/Y8Z3ZnljFPEKJg/wQxJsl/hOOUaDxxrHoAgZPkaQpn594WDqS0lpERhJDVL8B4XOYoX4BaPCyVK1dgUK6JMri5rd7h3sAO1OpEDwg1ml4sHjWiJwDiPqNlErU7fikYXSKr10eYFweOC/aQiJ5fXkfj5MTeAR7TGTlobi50uMWOlm+Wg94/hN9LXGT1+bXefP+I/nMReWCHOXfeAsdjGr9iL91MAAAAJXRFWHRkYXRlOmNyZWF0ZQAyMDI0LTA1LTMxVDIwOjU1OjE1KzAwOjAwe8c+zwAAACV0RVh0ZGF0ZTptb2RpZnkAMjAyNC0wNS0zMVQyMDo1NToxNSswMDowMAqahnMAAAAodEVYdGRhdGU6dGltZXN0YW1wADIwMjQtMDUtMzFUMjA6NTU6MTUrMDA6MDBdj6esAAAAAElFTkSuQmCC"""
 moon_32 = """iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAMAAABEpIrGAAAAIGNIUk0AAHomAACAhAAA+gAAAIDoAAB1MAAA6mAAADqYAAAXcJy6UTwAAAHpUExURQAAAP++Vf/AVf+9Vf++VP+/Vv+9VP+/Vf+8Vf+8Uf+5Vf+9Uv+7U/+7VP+8U//AVv++V/++U/++Vf++Vf++Vf++Vf++Vf++Vf++Vf++VP++Vf++Vf++Vf++Vf++Vf++Vf++U/++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf+9Vf++Vf++Vf++Vf++Vf++Vf+8Vf++Vf++Vf+8Vf++Vf++Vf++Vf++Vf++VP++Vf++Vf++Vf++VP++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf+9Vf++Vf++Vf++Vf++Vf++VP++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf+8U/++Vf++Vf+9Vf+9VP++Vf++Vf++Vf++Vf++Vf++Vf++Vf+9VP++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++VP++VP++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf++Vf+9Vf++Vf++Vf++Vf++Vf++Vf///xWeIVoAAAChdFJOUwAAAAAAAAAAAAAAAAAAAAAAACZlBQRSvhUDFp/Q7b9nAQg/hNFYKQ09dVWjCQtZvPLuXBgBJKX36lcCOGMBLsf6bwJssBIFH8S4Dzeu2cEGmftbNBU6jcJGHUfx3yGd4lABUZACBcAKc6znXSUENbMRRQbMh4aDcS9L+LHb/agHCJf+ywc5pn/pyYthebLschPaHthEibQxoeT8EAUnmo5rQ2e0IAAAAAFiS0dEorDd34wAAAAHdElNRQfoBR8UOAdkjdkCAAABxElEQVQ4y2NgoAFgFBIWYcQjzSgqJi4hiVsFo5S0jKycPBMzVkkFFhZGRSVlFVU1VjZ0STZ2dQ1NaS12ZgZGJW0dDBs4GHX19A0WGhoxAhUoGpswM3BwmHAgaWc0NTNfuNDC0gpuNaO1jS2Cw2hnv3DhQgdHE5jRjE46zi6ubnCuuwdQfqGnF1CAUd1bhIWB0dTH18LPkhFiBqN/AEg+MIgR6HTGYPEQoALd0LDwiEiIAjbGqGiQgphYoISOTVx8WEIiGwNjUnIK1A3MqWYg+YVp6YwMjOkZmVnS2SAFOq6sUAWMOfFgBT65oMBhzAuXQgsFxiQHsIJ8cBQxFhQWoSpgZtQEyy8sLsAeQ8yMJRAFsnm4FJRCFCwsY2LErqAcqiCmgpEFayRXVkFVVEsxcmJT4F4DVVBb5w4NXC6W+gZGbpiClEaogoVNzXquPGwMvIwtrW3tjDAX8TFad8BULDTv7OpOUu3p7WvqZ0TEtlNZ7UIEaAoE8fQlkLzEOMFnIRqY6M2IlCrZGCe51KLIT57Cj5Jq2RglpsoipB2mTRdADxGWXKUZM2eBnRAt1z2bURBLcMyZq1c2L27+glZ1fjYGKgIAKBei41SAoRQAAAAldEVYdGRhdGU6Y3JlYXRlADIwMjQtMDUtMzFUMjA6NTY6MDYrMDA6MDBtsp/PAAAAJXRFWHRkYXRlOm1vZGlmeQAyMDI0LTA1LTMxVDIwOjU2OjA2KzAwOjAwHO8ncwAAACh0RVh0ZGF0ZTp0aW1lc3RhbXAAMjAyNC0wNS0zMVQyMDo1NjowNyswMDowMO2NDRgAAAAASUVORK5CYII="""
 first_quarter = """iVBORw0KGgoAAAANSUhEUgAAADkAAAA5CAIAAAADehTSAAAAGXRFWHRTb2Z0d2FyZQBBZG9iZSBJbWFnZVJlYWR5ccllPAAAAyJpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADw/eHBhY2tldCBiZWdpbj0i77u/IiBpZD0iVzVNME1wQ2VoaUh6cmVTek5UY3prYzlkIj8+IDx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IkFkb2JlIFhNUCBDb3JlIDUuMy1jMDExIDY2LjE0NTY2MSwgMjAxMi8wMi8wNi0xNDo1NjoyNyAgICAgICAgIj4gPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4gPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIgeG1sbnM6eG1wPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvIiB4bWxuczp4bXBNTT0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL21tLyIgeG1sbnM6c3RSZWY9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZVJlZiMiIHhtcDpDcmVhdG9yVG9vbD0iQWRvYmUgUGhvdG9zaG9wIENTNiAoV2luZG93cykiIHhtcE1NOkluc3RhbmNlSUQ9InhtcC5paWQ6MzIwQ0FEMzgxOUEyMTFFRjhDQUJDNzdGNDhBODMyMUEiIHhtcE1NOkRvY3VtZW50SUQ9InhtcC5kaWQ6MzIwQ0FEMzkxOUEyMTFFRjhDQUJDNzdGNDhBODMyMUEiPiA8eG1wTU06RGVyaXZlZEZyb20gc3RSZWY6aW5zdGFuY2VJRD0ieG1wLmlpZDozMjBDQUQzNjE5QTIxMUVGOENBQkM3N0Y0OEE4MzIxQSIgc3RSZWY6ZG9jdW1lbnRJRD0ieG1wLmRpZDozMjBDQUQzNzE5QTIxMUVGOENBQkM3N0Y0OEE4MzIxQSIvPiA8L3JkZjpEZXNjcmlwdGlvbj4gPC9yZGY6UkRGPiA8L3g6eG1wbWV0YT4gPD94cGFja2V0IGVuZD0iciI/Pl31klcAAAuqSURBVHja1FprbBzVGZ25857ZXdvrZ+zYSRyCyAPEW7RqKkQbCf7Qqv1VgfqiVVuVqvlHqwpVhapqS6kq+uJHiVqKKKIVpS2IUhAFlYIIooFAHk6c2I6dtdfv2ec8dmZ67lzvZj378K6dPwyOGe/O3Dn33O873/nurrjt4Je4D8lBuA/PIV6ugQIc5f+5nueVPM8PBIFIooDfhKfHFh8hxHdctxV8fhAAVKlEsUmiqMqSripe4H/hU7cO9HbEDS1XtGan07l8seh6uGMN9aZwi5ukECj9oOT7cV1LdhiJmGboGuIpCN9Nza88/J17qm85c37qhdffffqFN944+oGoaTFDVSQJuNt6Lt9WbjGUnu+DnW19yb5kXBIl/BnQ/4LKZRMX58df/K1pmmtrR4gsibIq49S1ij//43MPH/nHopnDDFVZbh1xG7nFlht4dwz23bh/97aeTtzuuDQwq4HWHni/aDummctkTC8I7vvqZ+fffPzID7/Bc8GymcUIQdPb28PKuHTdUk8yce2+0Z6uuIsYRe609oyqcTjbcU0zW8jnvviZ21aOPvmtu+5YWjTzRRvTvQxYWWjyHL//iu07B3vpctNF92lKeSypKNlthR4WAzTbxQLC+n/PPiSLopkr0HG2gpUBlSXh6iuHDU0Dl8ingu3kLcdyXcf18IOTvGVbjsu1STNuyWWz1+0dvfjqo1ftGlrJ5DH1TWJlS4/437V9oGi7juOAxKLlgFpoTll8eHaCK4EYlLcFF3dlcnlI8LG/PnzrTftWsnksU9tYGaO6oowM9QahAFhuCRQCZa1AlmHzmBILmLaCOFewXNv+15EfHLxhL4LZazBh0kTkUW+Gh3roGcKx6miof+GbmE91zoF10IbqRTic0DJGSJ2HFiy75FivPPb9nUN9ubxVN2vFRnOFRO0a7uVDqdpEMasoK+J7cjq9aGaYsMV1dbi/uyNhoAxHBoYaxA3yxhMPDt32dWgc6t/GvLIw3dafFEWxFSmJUstxLEUg8o7rHh+bXM7kMJQiS6jAtlM6PZlKpZcFItTejmDo7u546meHTbNOnpG6mm9oSiem3maiXMqYwGerf2piFvgr3gVH6GbEC+klwKquWDhHeODHsZ1PH/ro7R+/FkYiEgmkDqmeP9TXtaHaNS9x+LWag7g5DOa6RxIawRfTS0I5cBHBtu28Nzb133fP4LfrWE8+dLiYLbrrqY1ixaJ3JWKSJLZbk9avFgWXyRdJiLTO+4TP5C1SfguXYwWcUkmRRETt+2enujo7v3b37eB+XZrWRmpfT9zztwAUKcXTYYPGIcSH/8TQ2lJtDnzbdalAEB4vmJki55d+9O3P2fl1xSyKNaarsE6bJpU5boDAuaYozJc1yELuvbHJ1PwytAw1FkbM99esJhxj0bKTXV2HDl4PQaiPFdclE4bv+1sjlXKDE1gcLqwideUCLBYsJ7Ww8s7piULR2b97CDO1bBegdw/3UxHw3HvvuqNaa8VIoYrHtE0HAONQkWUghLAr4VPPzaRFrlmpw0M/GL9ww/7Rm6/eg9YHNRtxiBdRHe785Eeo/vk+gmUdr3iOrst1i0rEazdZWUORPd9zS/656fTJiRTgXbljG+0gPOZyg1qCEaMgZ2Z2OfyThJFM58VE4Jab9jlOKRoDGAidxYZVSldkLDGu8oOag/YwAUsdJI2ZzY9NzcqicOOB0b07Bxv5/zAe+JVcPpVeOn7mwvtnL8wurhA6BVwfHLrlmkrIkuoSoKrKhlmFHhWNB4qFKkpMvVGQIO8MIvhDwRdFkkzESmwtec73gs5EzG8s2IALIz+zsALZQmGbSS+fPD9D5+aVbj4w6sBtRv1AECiyuKEAsJ4FnZ0oQXHQQiGiSggct1QqyxF4EpLJrj3DNGRpWxsuP+aDW+vKbSSagRJlZMnMgoUDV4xg6JoYCLWmOa9sRDzZpfgIW3ksVmXqmEmBLlnAdMDQVSaQILgzboRdT9CKqaAqmy1ijiODvVx5QdbFq1h+/IZw3bB3YReHnYxfeQsDoVk4NzU9Pj1XYQsoB/u6aHlYPz4zZX4QRPIEf8DDY55EkutihWHTEAYtmakwwvzwKHkBM+CX4PJ0tLlFs1J1gAmCund0yAsbtYrs4xyTHkgmSmGrWZF5XNLbmVgzT7X6Gr7WRsFCYeRDAhCsAd1SCSosAgVSsCuuCyKpWDs8GB3b9VftnE4vr6AxdD1IRLIzNjLQgzbJKXlzSyYrIliw7f1dqKBrWMvDVmPla/1vM3aDcBQaOYLD+dU7WigHe3fvzOdzEbOGZ0NBdw327t7eX14HmpT5vL1nZGAg2Yl8wpp0dcTQO4FxQuXW40gNVtxmO34b+zb8mtdBUYWJoJsaYZ4porjgZ7my466tJriOhSDULb1kTqTmsTqyLF2zZ2T7QHe4iROwDhFSk5pb5AQhGq+YqOU6YXq1FAoSESzbQQXHDwigoqso+I2BWEVopYmdmJmXw5YBKzAxMxfQWVwqbwiSsYkUJ9VgBSWFQhGyxW9EbRBiwaS9sPn2uQDdds6y87YNLmmetdbH4nKuqnEv2G5EfIkkHf1gHB6shlcocN7CbQo12htQi+lgqZTyjAN2g4++HDQ7LWaoroFTQqWAbuF48Pg1FZ68dvQUtKkOr6vZYhhGKJsCe3qjh+J12qCEEcmv78dBtuuVWux0DuwejhkazMO23s6RMFgvddgCxfbC68cqMipG0sXMFVDrJUHkFWK7DvMj9cpBQyOC+blNt3qq7LIPt3rVzkEaSDRN13GjKvJbx05g6mLd3IJczy9D5EgQtvaajFyBORGpHRGIKiGd+BYrBfhtZfOapbwbWsZqoNSpScpvnnpJM9TKOCTSsi2v5nyqgnwFvSwJMFL4oe2y0PI++NY6NkgY5zuPP/tq9Y4GqUkafnZxVajnuBnZG0IImEwQkdts0waeVE376WN/F2HmRKE+1tClE/Rr0OO6K2g7Ll/TI0SBrs1rTSk30WYqihR4zv2/fCpeFQB1eGXqODO3xNIwMt1IKyaE16x1BOUDqaCpKu1nDAMOt124IEtR9cM//gMeqJSVtRFWnghkbnE1V7AikUD1P8ytCiyVxrHIVREcM3RdU9kmhSzL8fDw/TZ26+O6OjY++cjvn4sbWnTDpp7O88j8s1Nz7HxdXaWSQD0uuGcSHbKoaLIMoYtpqhBqVjUyURRBcIvs6iot0Z/4yoOxhFEdqc32Xwndp/bGp1KR3SicQ8Xg1jAoKecZ60VpmWyQeYqitMIoRpYU7c5v/mRhOQONr00Y0riLIGbemppdBHPVtwVlPxBJqeZqinjYIJ9kUdH0ex949PnX3knE9LqtP2nW9Ahkfsmcnl0QSCufSpINO5+GjCqSqhn3/+KJX//pRZjX2tXf+DNOFrhzS6voVkaH+1gL3UT9IQyN3iuVSo12tZCLoqTc871Hjjzz72RHjCbr5j6PJSG9sOuWbe/ZNQSmG+3LsuxpxF/Yl0eJBxGGodkF++Dd9719Yry7M94EaEufxfH0wwkCV3X81ORqJofhanuHci/uV+1ZXjoymUxkIxZ/IUENI/bsS291f+zL745NNme0jc+5WaqBtvEL6fSiuWOwT9cVtkNVsyfuVcPCK9ls1qvawsDK6IpMJGVy+uLnv/ur/7x9qqPDiCtyK0anVS/C3JME924575+d6ojrg33JhKHRja1Q6/mysnrhFx1wi2mazAYBPSCq4WfdeP3osZMPPPqX518+qnfEens6KpbvsmGtEgeqpvmCffr8RUkg3V0JQI7FdH4tZOn2m0Y/fuc6EgbHC5WAOHbizJ//+ebvnnllYWHFiOk9/d2N8v3yYI0gBjL4XRTkwPcRFfC7iiKiLylazt9efjM1vzS/lBmbTB0/c+HEyfMIUiUsIv19yeY7pw2fu/XvEVW+5lKxBY7jogWHg2bfd5GptRMJ2epXXi7Dd3P4ymdw5eUGPoO7/MeH6TtP/xdgAJgNNxFidlxqAAAAAElFTkSuQmCC"""
@@ -8,6 +9,6 @@ full = """iVBORw0KGgoAAAANSUhEUgAAADkAAAA5CAIAAAADehTSAAAAGXRFWHRTb2Z0d2FyZQBBZG
 last_quarter = """iVBORw0KGgoAAAANSUhEUgAAADkAAAA5CAIAAAADehTSAAAAGXRFWHRTb2Z0d2FyZQBBZG9iZSBJbWFnZVJlYWR5ccllPAAAAyJpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADw/eHBhY2tldCBiZWdpbj0i77u/IiBpZD0iVzVNME1wQ2VoaUh6cmVTek5UY3prYzlkIj8+IDx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IkFkb2JlIFhNUCBDb3JlIDUuMy1jMDExIDY2LjE0NTY2MSwgMjAxMi8wMi8wNi0xNDo1NjoyNyAgICAgICAgIj4gPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4gPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIgeG1sbnM6eG1wPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvIiB4bWxuczp4bXBNTT0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL21tLyIgeG1sbnM6c3RSZWY9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZVJlZiMiIHhtcDpDcmVhdG9yVG9vbD0iQWRvYmUgUGhvdG9zaG9wIENTNiAoV2luZG93cykiIHhtcE1NOkluc3RhbmNlSUQ9InhtcC5paWQ6MUFFN0UyNDIxOUEyMTFFRjg3NTRDQjM3MkU3M0ZFMEEiIHhtcE1NOkRvY3VtZW50SUQ9InhtcC5kaWQ6MUFFN0UyNDMxOUEyMTFFRjg3NTRDQjM3MkU3M0ZFMEEiPiA8eG1wTU06RGVyaXZlZEZyb20gc3RSZWY6aW5zdGFuY2VJRD0ieG1wLmlpZDoxQUU3RTI0MDE5QTIxMUVGODc1NENCMzcyRTczRkUwQSIgc3RSZWY6ZG9jdW1lbnRJRD0ieG1wLmRpZDoxQUU3RTI0MTE5QTIxMUVGODc1NENCMzcyRTczRkUwQSIvPiA8L3JkZjpEZXNjcmlwdGlvbj4gPC9yZGY6UkRGPiA8L3g6eG1wbWV0YT4gPD94cGFja2V0IGVuZD0iciI/PqGk1S0AAAupSURBVHja1Fp9jBxlHZ53vnd39utu9z7b3vXa3tEWaAuSUARM/AKCkmiCKDEmRtQASVX8Q03wD4WqJMSYYIIQE0QI0RgNiUaJ0QQNidpEQNAW+sG1vfbu9r72bndn53vG5533dm9vd2dvb6kxTCZ7czvvzDzv7+P5Pb93lgzf8nnuPbKJV+QuQRD4QeB5vuN6+BR4IoiCJAiEcBypf/z/sAKf5/uW7VQN2zUtzvVHx4ev3jc4nMuODGRf+P0rWizmuq7l4KQNrDzdCE9Iz7h7wer7geU4Fd10DevGGw7cc8dNd9x8eGrPWOOYP//930DMgPkep5tGqWKsrOnlqiHwvMAgbxO0uF2Upm3jqWkt/thD9z54722KmuA4zzbtSrkMM7Nh6XS6YpiIh/qFqizHcsrIQB++XFguFpZLCBaA3hZisXuP4zGlSjURk392/IHPfeLDQG4aZqlUwqmtJ4kxHg1oIBvO940O9BdWSpfmFj0/4EPIVwwrzFk1rfKa/vUv3PX4N8EbgVHVYRjC0fgLwpkEXc/Z9QJgy2WT+WzywtxSYXlVFIRu4nhrrPBsWTcSqvrXFx8/fHCfY5lAib1UriJvMCCmSEktDtwY2SVmauXQxuMj+VxaO31hHteykOgdK+6IbNg9OvC3F46nUkkL9jRMGGNlrcKHrsNTKbrAz/elx4ZyeF49aruMq3hMPTS569T0LOiC2TdqPN8ZaEk3rj8w8csffu3U9KX5haViWX/99EV8qciSLImSKOJTFkVJklZWK6++fb4aPm9b+UrnxpODe3dqCRVP7OAZPjpG/UrVvO7A7qe/82WQqG17p6dnsUsC3+QsHOJ/QOQ5cvLcDAb3QIJ43OTYaCKudAgkPso7VdMGQf7k2/chq0zLQRLxooCdRERVyPZ01JkL8/RfrmEyLELDPcrDIUB/amxUlqQQbdAtVst2ccFPH7nfCwIAZc+r71Ebg1u1LEDDQX3epu3opqWbNj4Nw4blSIR1AxJMjQ/7nN8tVprjevXRr3y6P6PButvyJuAiFkqlMsOKxwMfBUeYP4jPUeggkCi4SICJHYNuu8DlW71vmPb7D0997APXIV675s2GOxKimyaCAdeajkPIRjmtHyH93Ra6YBIHcHOZVEqL4WALrJiQYVqPHLsHhRRZ2ZPGIK7rURkQEXYMr+1uMi1yC0FSqRq6ZeFysKQbkkIkVpwC0Ltvv2mgP2NuP53rtxFFISQjr4Ma9GGI2qmAcJAZ9C+qIGqkZamKPNCX8jfbnm+iOr1qPPiZ23rzfj2jk3HV9ztdTyfQMAlCPcDmRRivY4fQaaJbfnP6Oze/78BQLmOHxbNHUev5mpYKa2angolzYEPb8ag3KcYNWQECB0aYNp2MN0Ytv5lTrU/ddlQ3rN6MGqpvatT18i0IIaUGHTyAHANRoKuIqXIIFYOJIklszggDrwEs38gXkPEfOnoNZttjG+PDkcHU7lHXMpAZ9KmyyE5FZNj6VjVBF3wiHkuoSkKVmUREsGbSGm7K1S7fwOq47vUH9mBObkT6s6YlFFntMxxF7dDk+Mpq+cxMAWPCdOEUSWTWjTIwowXHDSsOv1HvMBpFUkvEg1asqFU3XLu3czVHlT1y1Xg2mbCpQnAQ1mzHBEIwlOrZwxhn4Z44gjxXJamzWzA323F0w8aOGzJ8uENKU+tZuqEJMeLafbs6ZxVALRbL+ydGHGewWK44rh/2JxIwTc8uuIFbWFqFJBVFcV0CUDqiyAWRD0IzR1AYYfqwXji9wFfDqIVu9v1VTtiMlTFwY5PUzlv8zPxSsaTv3z0y0J+VZIU6xIS37YtzJAjVFtCJsoKGW5ao9sK2zqE4iAwDrlFosNAHceF6sEGbGAA7D+bTHWoVboaajuxGdZmeXWRAscmydO5ywQ+Z/PJC8V9vXcCXAsUq1YBSkCJPuhcVhLIsBYnsbMMDMH0ipiIGWgtxszoRhPnFoq7r7JvCcnG5WA5NiJnwiPjC4iKID4HXiA6SvG2GBbUtsgS2savnT+7eNTGah/DdUp3AupcLS5VyqVwurZVYP0NqM+ErVQugGV80zpI5tA6tfsRqch1u/Ut8Nra4jTFAh7oB100dADgAYi5WZDmolRwWarIogN3YKkvjVbA9GFQIA5cRJ47jIUvQQA820EsispFfb9bb9IY0nug9QmrbMqY4pkoxNp9JzS6sQJICXFh3uJ2jwzFZiitK2xqAXo0QuSEGUP098Lok+GEFoc0H5hDUOKGedg1YBaGwsBQyRVdNM+IP96gYVjoZOzQ5NlNY0Q0DXh7NZ2s9SaciVy9AIUuCYIKYQm3OzgS13HAcr+6bBqyScOqdyzcdnvQZrUf3vqGz/Gwq8caZC6WKmUyo6HX37BxglB5agutymQBA2ToiLgDxqbLcxGWG7dSRbMQr2ud/vHlWVuNxVe5MBSGSYDCXqRg2Wg40ZK++NX3izbNvnr64tEoJoXv1GDaR62Ba2RLhbhgG34o1psh/OfEfHEyMDlJN3nFJIqYoMMn4SI4lvo1eMgjKhnXmwtzp83PsMd3x6IZWQJg2WQjlo6SbhG/BCtZ96ZXXcZBJxffsoAWsQ6uOovrqyXdmF4t1xQROAE/BzMWybhpVvgvr4ipVVUIoRBJ4SRRbEjgol9vZlcpNzz/x2klck8um90/sEAmB8RD+KL9OuDOhzmxJ11cCrsl8JKRe0EKXRQo44rIMHYgi15QhYJW1ihGQdutZGAr9+ONf/PHnRw5A0EEyH75qHG4tl6vo41Cr0loMwgViQBBItArhmMTvvquMygzE/cLKWuMazyZPxVXluRdfRjbDlQgAx/Pjijw0kB0byY8O9qW0eC6b3HIx8Iq8GsBN8KCV1QrPk/b9Fq0Wsnj8yV+rsRippapHaYg2a7g4iSIjCVs2CNh47l0hhjkhL5sSlG+aDdB898lfcYGrKFJrbJ27NM80a1vNERZO+iompcU6KpKtjQpNchlBv3ntrDlbww6JHDv+jKLGm5gSl+nQAGHWs34mk0wAmc8WLcJv8O9QPjuQywW1YOgBMfjk0vwyaYkmvnVOyUTsiWd/98apM1pCbaJupBeF5vusvdy3a3hiR55RGFv7uPWGa/aHL2RwHumIBgGfUe1hlPd105xHALSsG7dZ10bUaintzvt/MPPyU6hh9eU3PB5JhoQDg0I27N05hI65P5PKZ9NofcFrA/l+0HdTxSc1P3RJYeCF09NzmGNrNeHbhgu6uYWV0p1f+r6koJxJDS8HqS1vvGbfoakxVZVYzsHvMB465jrQVgHZjWnZWuLZmVmqJ9uRSeTd01r8pVdeO/bo02osztr82lsULywQjYsMtJcXozvVbl5isSJyfm5prWJGveSIrITwQjatPfH8Hx7+0XMqXWSQtnzYu2FTuHymsLi0vNbh9Uanqo2K0JfRjj/1my8+/ARoQYurHfB01jqd3liEXdr0pcX5hVVBEPje3sOEFCb1Z5LPvPjy0Xu+AcenUpooCG0NY9Gl905AW61FqL7nEUonz84sr5VpPnWUEVurIWrdtPb62+f7b77vt386kdA0GLj1prCraZoRK4deW3NKEGWlyhun6JsmUeC3jCK+O3IWMsk4bnfXg4/d+tlvnb+8mEym0A7UX2Wx7IEurjfiTHTWgW4qP0ApiujPYM5zFwsgjy3fGG7v3THuFQd9yeI/T07v/cgDH73lyPe+eu/1107RvsU2UQjYIgj6EARDX18fzAwp2Zh27I0SDku6Mb+wUixXYQJwefdJSbb7GxK2Mlo1Lb1Szeez933yg3fffvTIwckGiQfQwtUfP7ZjqJ/Ua4HPVarVlZK+XCw59IcbrNRvjzpIz793geVAtKhqVtXEP1cf3HNocteenUND+fTIQP9Djz2LsLFdz7IcA0OqFln/XQZPSI8ER979b3PY+gXrnlnvAM/S97SyRDbWhK+AsL0Cv80JWxrssqrI3P9y47n3zvZewvpfAQYAgFA+v3YOE8oAAAAASUVORK5CYII="""
 new = """iVBORw0KGgoAAAANSUhEUgAAADkAAAA5CAIAAAADehTSAAAAGXRFWHRTb2Z0d2FyZQBBZG9iZSBJbWFnZVJlYWR5ccllPAAAAyJpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADw/eHBhY2tldCBiZWdpbj0i77u/IiBpZD0iVzVNME1wQ2VoaUh6cmVTek5UY3prYzlkIj8+IDx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IkFkb2JlIFhNUCBDb3JlIDUuMy1jMDExIDY2LjE0NTY2MSwgMjAxMi8wMi8wNi0xNDo1NjoyNyAgICAgICAgIj4gPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4gPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIgeG1sbnM6eG1wPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvIiB4bWxuczp4bXBNTT0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL21tLyIgeG1sbnM6c3RSZWY9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZVJlZiMiIHhtcDpDcmVhdG9yVG9vbD0iQWRvYmUgUGhvdG9zaG9wIENTNiAoV2luZG93cykiIHhtcE1NOkluc3RhbmNlSUQ9InhtcC5paWQ6ODg4QkJFRTIxNzg1MTFFRjg1MkNEM0I3RTJERkMyN0YiIHhtcE1NOkRvY3VtZW50SUQ9InhtcC5kaWQ6ODg4QkJFRTMxNzg1MTFFRjg1MkNEM0I3RTJERkMyN0YiPiA8eG1wTU06RGVyaXZlZEZyb20gc3RSZWY6aW5zdGFuY2VJRD0ieG1wLmlpZDo4ODhCQkVFMDE3ODUxMUVGODUyQ0QzQjdFMkRGQzI3RiIgc3RSZWY6ZG9jdW1lbnRJRD0ieG1wLmRpZDo4ODhCQkVFMTE3ODUxMUVGODUyQ0QzQjdFMkRGQzI3RiIvPiA8L3JkZjpEZXNjcmlwdGlvbj4gPC9yZGY6UkRGPiA8L3g6eG1wbWV0YT4gPD94cGFja2V0IGVuZD0iciI/PgqxwcIAAAleSURBVHja1Fppc+O4ESUOXjps+bbHO7NXUvmcH5Afk7+c2tQmuzvleNb27viWdZIggDwAFCXRFEXJm0oNrdHQMkk8vO5+3Q2In/3t794XclDvyzm+JKz8jfdrc7h3dzo/CPHwQygxh/mV/B+waotRKbyUVDqO/HYrboVh6HPOGWNEaQ+fZ0JM02w8TYejiZCSUsoc7m1B8y1YVBbj7m7ncK/T67YBr2DV/VhW8RMbasEspZNp8vgyesC/acIYPqBbQOaNURqgAInz0+Pe2cEehjTUapWKbBX5s18k2D452H13tAfQN7eP908DkMws4j8Yq0WppZJnRwfnJ3t4PEwsMrmRQaTES8FNvnt/en5y8J+b+/5gxBzeZojXY7UoVTsKvv/wPvB94wA2hPLna09vYkfcqzIJt/nLN2f9wfjjr79h2g0JZt2v/1oPNJPy3fHe9x9O4XgYCbhFpoTM0kyCWiC3PrlZmGv75CgKTvZ7g/EEIdgk5lZixeO0Bfr+7PD4YBdglJSpEEmagZpCnGDcTKlMZSbMN4wW3AtFO97fTVMxGk/Xwl2NFVEj5dfnR91WnKQCzwWLsJejcPEwMe95WaYI9WDNDeGa10FvR3lqMJyQWnmgq7xKgtHzo3YcSRv7xty5m5afNUPvJanM7MWbsmusd3J0uNc1ZGi9AVYT9VKdHfU6rRzoMovVRw5XZIuDEfs4TDOTGV44J6vhfvvVccdSswourZSnTjva39vBLLcgqfBlnCdCQvwTIVIh7XmK80ooTtT+/O0p/F41xmrIOD892AKoox0MORcWmeGSzCoC54rgGLmDrHA8SuifPpys8gRanpxSUCh4YI3frKUWqG2yUCX/dudWN5aIIEbCEMnmtdtp7+90Kj2hjDUK/W63pTYPkdLYltHKQLTcZ5IsXDwRYpKIqRAjSK0Q33x1rKr8gC6TqpG1t2bUK4oWJOHah0jLfXEuAZ14zlUAFlkNiv6ar0Wsns9ptx1jTm/BippQr5+P0VVb4Bpvs+SSma4bf3h3tP/aa+mCa6uDXle+AairCzllOPMJq4EKDMNpMpqkcFyUjITq2d0e5yjfVBjwHbhiJVYnVXs7Hfy/fUh5Xhj4GBv25T591Sgs5w57EywO3WiFETclIgl8FnCOe0DqMZLZshYVWL04DFCh1biZy4eVFzhMGA7jjSbJOEmAJ47COV3VucMgRoFhJxlEmKgF6ozc221bL9AVvCJLqdVI7T3wsGL0vJbWs4oalUsUcGi+mY7SMDEiuhUGsLCeTWZVtoMSu1xQJDbjDIyhEF28jxc63GoFutZZUZdA0YRNl4X+URv3xmqZzpjijGRSO60yY3MdhyFGRvaqeTIeiArTtRJwXjRu0ARDXzt66I/oLOz4orLWqxXwQf6cpQwBtqTCLSkyKIosYs597rcpQ801zQSzjjlrc2diVsVtLgTEcx0bMnEchIa+KLx/Hi75gLNpwH1dmz8d/eNkqlzwzhwObpobB12Kxp+IH7BOFLbi0N1lLvZWePpMrsh8FEwPac/QDF4q/BVB4ebnrYGLQYlJ6A6EVfJJkuamVHIySeBHmVW+xXocvfhir1g7iku5AIO76CJWXvginUVQbeFnEMBdUZagNQXNQohSrYhOFdeAyZbVAXdAibIscXCLi5eqx/mH5hpKzX8IrwrNwqUwWch5g3mbAzayPWK1h2Pcco4lJIpCuqgj9l4Tr75fCEWhNvArvaqPdTV186oeMe4zSwACX3k2YealGcyNp8WvvB9AEZaud3flgM+MIoNPKIVtk4rLAkdziQk+Uw21KkzrGEbgU6Yoyn4XwdABFvr+KjnFHcBmEoYLf61sIlA+89sxg6FcwOp5sSYXvWuuWRBOOK1sRi2uhCgKKeGIURiawtOqKmA0KdNsk6xQB2J+tiqfxiZr0MX4w9MwE1LyVxcbSIyos2pyzLxAsboxTVNMDMnJ1WWWMNK88LGOoMksAF6v4gAShqjgFQo4Giet/R1GhFpHDESe07yQVkazEhcXCNvQ517DVQK61sXoYDQllJTvQGZ7GYzhLgGiUq+hVplchXRa2CTvqEDzOBVes1LdrgrNZcHn7HU6G46mlLzCitGeByPcCOPGNtnW1Ed4TzNRah5nVZ5Osow0i0wMFPoM1kBFRpcXQQBxOJ6WgofOuzOtB6OJ6SUobUchN/WhWxC2rwX0q5YL8tbPiIJuKCSccZQX9JXbAMPD85CxpTW5eS7An28f+vkiD0TO94E4jgPMHu9tM3XSZHi8vamxtMRhqLvHPjyz2sMBBUUNLJvrsHNvU3jYQt/z/AZZLdfzN+63gNT+0K2dVWO1syE3d4+r1s+aWRa1Yl4ubk8qJde/P5QcYBmrdYPf7p6lzR+vn4E0WGoDF9EXnyBatNY10bmGVAZSB5NUVDhxSX4xp4urz4zRqgkvpQO0mqXdIhikE7fiKGL2qMzpDdzdu7y656xipZuW8zWlTy+j55dhCa6TwKLG55QihE07mTuzqfpQqaGUKbTCId4ILiBeXt9CdSrrUlqlI/Tjp9vMlAdLN0AZUL/hr6Yz9o2hcUEUQC4ClKrQSM+rWhGqWygoA33sD+/sFk0jrLkhiPfvi2u36bdYcDAOoD48cl4a25X/GvIahhkze2Dil0+/c7vR0TQr2yAzNc5PF9f2lDRRmXoXXAtUyOzHiyvG6MZr8NbbKKqZny9vAKNJFnjD+hcFL//85crTXv1eVx0feAqy7g8//YqGpUoZFreWVP3a0cocyxny/g8fL5HE1+570noFMZPO5D9+/jQYThBWq55VI6WrpgFkcM2b28cfP15R0miDds1enLMJUNw9vSAX9HbazLSYFR6pbctVGq/Ywl0qQSyd01T86+Lq6WVsdsab7Rs2alyZFYTHlyEyyvnJwelhz+whyvnis2sMpW2PijhTs3WkAgcgARbmfHlzC20CSs422D7mzTOKYVR7158frz8/HO3tnh7uQlalZS5fA8q3U2SpQadOTYj3/DL+/NB/sokGCr3prvwG3x9wFsa4AHb//PL54Rk9dK/b3unG3VaMBGHZXboek5hOE7Qi/cEYtTx+xYS3QLkx1kXE1EiN+f4AQN8+9t0ahB8EPsKEmYUDs3krpbCrSWbhmphvZbC3fZNk+++7FKA95uWrsaZxN0tIs7bILF68/WsufwDWUoHm/LU4+V8c/xVgAH8KQ4/tkIlgAAAAAElFTkSuQmCC"""
 waning_crescent = """iVBORw0KGgoAAAANSUhEUgAAADkAAAA5CAIAAAADehTSAAAAGXRFWHRTb2Z0d2FyZQBBZG9iZSBJbWFnZVJlYWR5ccllPAAAA2ZpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADw/eHBhY2tldCBiZWdpbj0i77u/IiBpZD0iVzVNME1wQ2VoaUh6cmVTek5UY3prYzlkIj8+IDx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IkFkb2JlIFhNUCBDb3JlIDUuMy1jMDExIDY2LjE0NTY2MSwgMjAxMi8wMi8wNi0xNDo1NjoyNyAgICAgICAgIj4gPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4gPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIgeG1sbnM6eG1wTU09Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9tbS8iIHhtbG5zOnN0UmVmPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvc1R5cGUvUmVzb3VyY2VSZWYjIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtcE1NOk9yaWdpbmFsRG9jdW1lbnRJRD0ieG1wLmRpZDoyODYzQTA3ODEyMTlFRjExQkM1RUJBQTBEOTE3Q0NCQSIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDo4NzIzMkQ5QzE5MTIxMUVGQThERUQwMDBCNTQ1NkM0OCIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDo4NzIzMkQ5QjE5MTIxMUVGQThERUQwMDBCNTQ1NkM0OCIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ1M2IChXaW5kb3dzKSI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjI4NjNBMDc4MTIxOUVGMTFCQzVFQkFBMEQ5MTdDQ0JBIiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjI4NjNBMDc4MTIxOUVGMTFCQzVFQkFBMEQ5MTdDQ0JBIi8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+qdtkYwAADg1JREFUeNrUWmlsXFcZffe9edvs3rfYseMkTuIQ2jQt0E20lahafqCKUkQlUEEi4g/8AdEKCRWJP5WQABVahMoPKqpWLbRUULrQkhZ1TVOStNkax7ETb+Nl7LFne/PWy7n32ZPn8czYToNER1Yzdufdd+73ne9857tvSMdN3xY+JS9R+PS8QldqIUqp51HXYy8WA1GUJFEk7PV/gRXITMsuliy7ZAolS9KU1o7mjuZkUyKaSi+mZhdt6jmuK0lSSPRfnwj65WBF/EzbyecKjlHaMdD7jS/feMeNn92/p19RNf8DR04MPfLki+Z2V9dk07IyuUI6k5+aXcgVjBBwh0KXh5lsqraQX8O0s/NLDY3x+w/edfCe2xuSceTfta2SaYVCkqqFn/7HG7998uVELBrRVXaDFT7IIalomGNT6fMT09iqKiPW0qYQbwKradsLc4stzclHHzx49x03AaJVMpB/ShlZVUXWw5GnXnj94SdeamlIIqJVCpkQWWZBHZuaO3V+3LRdTZFBjCvJAY/SzFLett37v/fVh350H/5iFPK26/KoEYF6yCyAvvjGe488+UpzQ0LXZYFWXwf8Riy72pu6O5pPDY+PTM4CqyxJG+HE+lgd15tLZ/p62v/8qx9es3enYyGUKCpqWQ7ehCQxGtbC0ejbx07/+k8vxaPhiKYizHUVQ7BsB+D2DWztbGv44OSoYZoI8Lpw18FqO046k7v1C/tefuynsqyYRjFvlMZS6fmlAlYmvM5aGuMLS/nHn38d7+OJcH2gQY0rGGYiGrnlut1HTo7gLooMkaun91Js69W1/h92n80bX7p+3y8fuC+bz0dVZTazdOr8hO24SkhE3lExsWgYQX7m5XfeOna2vSmphKTNqh4qDHzI5YvZQrG+HtfECkAA+sVrd//+ZwezRWMxW0ylM4u5IvbONUcUCMH7hkTk30dOP/vq+12tDQ5rA6x6BLoZBeR56GlvzjC4Rh24Yq3t5grFqwa2PvyT72SyhVLJEvn1+A8vW+JnMRELD1+cfu29E7GoJvH6sG3Ltu1gKtmnsbOVn+q3cz1U6rV7+pOxMGLk0c34AYh2e3PyFz/+JpYolkyy+uXXhxxi8Tt6ZvTshalkNMy2QQgoC7mgvM36ewOOfNHIZPML2Tyy7DoOIzqpUsGeQA8M9mua7Dj2RrECnK4q37/3js7WRtBgOYpragNBHbqYOnT4VFtTAjf3K4qIou25DmMha6glywJ/gAMhxe9Id9YoFUoWPrwWLiKqqcrA1i5JlFwmiOthdV2Kaw4Mbvv6nTfMZ3LVS1hAUCU0+tMjE6m5BfSncu0jZNy9eKAytA1NzkdZfqFZoeuirVRw2k8LctLb1dKUjCI/a/WkEqthlhJR/YHv3pXOZBGPWnoT0bWJ1Pzhj841JWPBwOOWrI0BMfWgd/ilkqO8ItFjXUrLNYR/jZK9lC8gCYZpDW7vgWdYe3exoqRQALd9fl9fV2uB0bRGXyZEVUJjM+mzo1OxiB4MAOXAJSJ4rsfQVNVLkNhhnPbXB1ng1FikWVbdXN6IhNWO5oSvwTWxlkwbluK+u25BHdRSdFyPHgPpPjk8Hglrlfri4xNFrkS1pIt1EX7hsp6wfQnUr1tkA324v6cd4Xc9rzpWj3uQfbt6dvS0QaTq9DtNlbGZoQssqGuNGLNPPPEiswpVkbJYItewZpQxwf/b8meJRAARKyfjEbqatJewOo4LU/eVW65byhteXTFXQqH0Qm50Mh3WlLUVwPoZYXjxA9bWCCzjG2wAxB9GLayqqD82U7heWFERdMtxutsaUZbB9cWgZMgSue1zg0WjVMdFQAFgCcZn5tFmK+oGbAM9QOWSzVQpLKvAXZHHMuPLYp03CohpMhKBPUvEIooc4oHzWpuS+Fxwt2KZhbhsZ29XWNcAuhZTgQbpQzDGpxFUNai8wKQoiqookGd8IFc0XMHTVRU78rgCVUXstxUUFj6ArGJxunIvBCUZ1avwFavhyv2D28ChGuKP1uJGIxp8HOz9xMwCAoBuCBRcCimu4aMJ473E8S0Vio7rxCJhVoIia2lV4SI7WNlybChPoVhiSsf3gM2DsiSgBmK5sPDXgb5OkznLGu2YA4knIj1dHbbtoAUgxaosg22gKJCYFhoWjagazB0TWSrwgHq6rCiSRGtw1w8tugY4ip6HtBQKhh9aUALboRX+1cfe29nCtlXrKEEUF/PG8OjUQiYDRexua0bWWD24rCpMyL7I9oPZLyqF4SfxUlWF8Pqg7JakllqXC85XA8dzcTmSA6G9JNpBvkoCaWtO1uxVfFH4FYQOXhs+QZZlj6spLrBdLI1UUjQey4QpE6DTILTIfAKLJ1gLhmzEhhNubUAe8AuVuoI/qANUAMWgQUiuV3tFwumDfNmOzSWfxQwGBeXoj//41bDtbLHEagsOhscMUZd53XhrNIGuvKoSA+LI/w3WFmviNETIrm1bWxvjnlcHK2cPO2GhqDAQzLIsNMyyePmAwApsB+VSTjsu1BBmLmE+sjJKidv2coAob0mSxMiJuSNY6GLQoOOakByqg5Uuly5oio97fp8kAfovr4SGCXuIxemlpggaJMKaFmLMAWKXgSMQNfh0VN4l7AyopDCUQkXAQ8E6Z4s6nkDqTXQibwf8Xmwl5FaWJctwPEL9bqQpiq6gn3lk2RUIgfIluq7qgorL2WZ42PB3cA9lijwgSsCN9dkMwVspqcTKCw1Uyi5lcWNaJ66UzTDsyESS/N1BYgEOAS5aJooIKDVW+/ioWKuh8NwwKYZ+QFMhGKABBveYpntBbwWrbkNrKVkJXqjMJ8vzRiZn+jpbKJ2hAXNZaec81mAwtMAXw39AN9j5gKoCsc9kL1gO9epdwMzNTuZ4rzLglnQ1eAaD3RTQmKhQHiHEck0gqSfPjYejUaaaNe5G+ByHjsVKkJ0BYlYhCA1aVLaIGFleQC/XGV8ZYSlZGVsd6tJLIutDIhj7qFAO6yWsTKvfOT4EBe1qbYQm1dJCyFNYV9pbkgigJsuc/+zgEsNPHr6pWGSeYQNw+bkbWW7QVMCMtWwOgq0nVyCsTFdj9Tv4vw6fwPuO5mRLQwKaWc1zsN4d0dRENDw9n4EYBOdbZlNcr8hb7bpwgZJ16RDGQMw5QliRRbJKT9BcFhbzfIoklToAMVuaX7o4kepub+rb0qLI0uTMArOh/mHpshMWMP+jTfd2thZLx+iavgm5Qa1YjhhStfq0pZyRsbBO+PsKecJtl3JFy1plToLnLsR0PQTs5uv2mWYpGY+2NyU58QnMczwSbohHLD5gJKORglE6/NEwSp7LdaVWoK5laaOHRVU3hJK4MDmbyRX8UFX2AqgaaPrH59/wvT3TNlHobGnY3de5t797e08bOIrx1S//hkQUpgwWjqxVY5YDSgXhsg/bCT+omZxb8FbL0arDHAxSc5mlvx96NxxZnnXAPBQTfkBChKq1IY4YAyveDG7rXiwUaTUFZfcSNnWoVTF6iKnZBQRFJGL12RBLq4oMs/fz3z0n+Edoq4goQpMupNJoNwi5pik7ett0RTYZpciqAZMw1gqiuMHDzbVBRacZvjgNcawg2KpzQv+ui9l8T0fT/r07LdMMTHwidHRyZh6Vi+aJhVAW2ULx45HJeESnK0Ms3sAK6rywLh3GbOapAOI1Np2ems34I0O9cxddU3JF88FHnobfDQcOfyiz0iK8M1DiF+xnoK/r7tuvLxT9RwYU5Y9tQOzikSg7EkRbl2X/wHDjAUYg4dqGL6Rcz11btVXOX5H9ufmlMyNTX7vzZuoi4ZSf/FCMK9h0ejEHdPGo3tfd1hCPzi1kMXyj5WKTET1M2FGhF5SwgAdYJ7ooUxTM0TOji7liqNoThCpYeV8Q2FFFWLnhwGccPkD7XASgLW2N3e2N6BcQv0Q8jjp45a3jgI6QV4zzQQJ4nrcuVpBneDyFoYMNQtUkr/q5NuSNKeiHQwcG+wb6twKux2Wf+lMrx80tqdDV1rSQLRw5MdyUiFdFQ/gYU9MMBc5yZuYXTw1PeMwbhTZ3Bo9Kn1/Mvfrm8ZsO7Onr6XQd2/Vo8Hb8FNuJRGOJmH709PmCYSHql4cVejK/lD92ZtR2XUWWN/28gLA6U2cz2b+99v7Ve3oRXc/FUqtSyWZO2+7ubNdV+dV3T0TDqrTmYLA+VvwNqUdEj54ZgYqrtYGu8xwGq2MhpPiZl95OxiPXX7M3RGjwVMavJEwqe7ZvKZXMN4+eRR9e+9zHPz2uwEr52Qeyd25s+sTZMaS+PtB1sJbhIv1/feWdj0fG77nzJg3u3bXhp4Tlpx0EagVjsKd/y9Tc4odDFxNRnaz0G38zPtAgVrxV1RCI/5+TI6MTs/7T2vUVrT7Wcqlpunrk+LnfPP5C35amqwYHFExUnuNPkQABQxOPx3b1dZwdnRoZn41FdB+Zf8yx6sCCMOOBwf9iKv3eh0PZgqHyZ3AbUt+NYPWFLBrRMec88eyhPzx3aKC3Y3Bgm6ZpssQeMWBGME2rpalx30D3qXMXz4/NRHQlaH95ExJVBWOylJrNvPvR0HhqHiKKStp4VyOb/b5L+bF8LBb51t23/uDe23f2964wECGUZtKZhx77y7EzFzpbGn3v63cgGOex1NzE9DwmH5U/3t7sdwjI5X03BxGDYOXhuBZziqrsv2b3zft3DW7fAiOxY2tHNm88+tQ/Pzg9gkDm80Yml1/IFhF8mT9x3WDGrxjWVbLlsqMy07TxXwqVQNcIMefAiMhwMQvyCb89cmW+m4P7AxF+MIQJ/+PXp+k7T/8VYAABxU5IGghr5gAAAABJRU5ErkJggg=="""
-waning_gibbous  = """iVBORw0KGgoAAAANSUhEUgAAADkAAAA5CAIAAAADehTSAAAAGXRFWHRTb2Z0d2FyZQBBZG9iZSBJbWFnZVJlYWR5ccllPAAAAyJpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADw/eHBhY2tldCBiZWdpbj0i77u/IiBpZD0iVzVNME1wQ2VoaUh6cmVTek5UY3prYzlkIj8+IDx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IkFkb2JlIFhNUCBDb3JlIDUuMy1jMDExIDY2LjE0NTY2MSwgMjAxMi8wMi8wNi0xNDo1NjoyNyAgICAgICAgIj4gPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4gPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIgeG1sbnM6eG1wPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvIiB4bWxuczp4bXBNTT0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL21tLyIgeG1sbnM6c3RSZWY9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZVJlZiMiIHhtcDpDcmVhdG9yVG9vbD0iQWRvYmUgUGhvdG9zaG9wIENTNiAoV2luZG93cykiIHhtcE1NOkluc3RhbmNlSUQ9InhtcC5paWQ6MjFBNzRGQzUxOUExMTFFRjk2Mjg5MDMwN0IyQzJENzYiIHhtcE1NOkRvY3VtZW50SUQ9InhtcC5kaWQ6MjFBNzRGQzYxOUExMTFFRjk2Mjg5MDMwN0IyQzJENzYiPiA8eG1wTU06RGVyaXZlZEZyb20gc3RSZWY6aW5zdGFuY2VJRD0ieG1wLmlpZDoyMUE3NEZDMzE5QTExMUVGOTYyODkwMzA3QjJDMkQ3NiIgc3RSZWY6ZG9jdW1lbnRJRD0ieG1wLmRpZDoyMUE3NEZDNDE5QTExMUVGOTYyODkwMzA3QjJDMkQ3NiIvPiA8L3JkZjpEZXNjcmlwdGlvbj4gPC9yZGY6UkRGPiA8L3g6eG1wbWV0YT4gPD94cGFja2V0IGVuZD0iciI/Pt43mwoAAA2LSURBVHja1Fp7jFxVHZ77vvOend2d3dlHu213+9iWlmpta5EGqJQEozZiEBL+IcRQiYnBEDWRGJRADCSYKNGAIo/wMCoBlSCNYJBCRcW2IHRb2u2y3dfs7Lxfd+Y+/c49O9PpzJ3Z7ZZEuWkns/feuec7v/P9vt/3OzN89MpbXZ+Qg/9YnmLZh2FaJg7LYhmW4xiOZXGJYZj/PVaA0nSjoqqlsmqpGgB393RGIx0+t6xp+qmPZiVRwASAlcU/Fi8E9qVA51cQQl03ShW1VFRCId8N1+7e99nNuy5bP7K6F3B0xNblEgT+2ZcO//Tpl/0eN8JcUMq5fCmVLeIqMBPcK8LMXxRKBLJQKldU7ebrP3fHTfuv2L5BqZC44szUXBKwFh/Ksddfud3rkX708+d9Hjnk93UG/WsGXMVSeT6ZTWRyNuDFSC//YJaZW7phFEuVsqoevHH/3bffEPS780UC2jBNx/tBVp9X/vcH49/9yXM+twQ+4CTg4bxhmDPxVCyRBlzORrxMrJx/9fYlwwlMWMG9n9706mM/+PK+Haqm5YsKmIAwMm0XYag/Mtjb+Zcj74kCB1iIO1iO9Q8FvJFwsKhUlLJKoS4H8RJYsawlpVIsq4/c8/UH7roFWY4BLMusqDpWX9N1juNozADPkdmj6wYQu3/+Z1wUeELUal4Cek9nCCcRBYZgXRou3zbTTXDRLQqHn/zh8OpoMp1XdT22kImnclh6+mgAwnjdHf6erhDek7DVHbgtV1RuPXDV2NmZY2MT4G4NEKIAuegK+f0eGVdx55J8aBlXGsJod8dj994BiEiXiqadGJ/GSfAMf/IIKcfSlc0Vy8lMIRzw4oxlNUobtOGanZtfePVfID3Pcw3rJvB8dziYyRU0w2DappszVrL0ZbUnHPzVvQcBp6ioSN5ktoC14qoZvJib9oETwIQbuoJ+XG1gA5IJPFk/FH3pjaOSCCawDVTBRyLhQDJbNNrCZZ2TqaK5JeHhu2/Dn5T+jM2oVjJD4LIM1nFiJo7Q1p0ngiDwHODu3bHp6p2bVVW3LKu5rCDjNq7pw2NMq/l6a74if5Vy5Wffv8PrkYtKeZlJinsAC2SAtMmSYNrRYixmPp1LpnMVTfdK8oF9O/72zphERIFphgtSbVgTPTE+xbDOEWGbaQq1P3jT/nWDPSWS8hej1YDLMYlsgRQnwgrzxMT0XDyNoAKdZuiQ1ysu31BQFMePY1k8sjzQ02WYhmNsG6jjKle0NQPdt3xxLxCbF4WUPo5hiopCRJ5jx6fmsUR8leC4CpX7wt5P5QvQZt1hqnakkM2yJDXoiQNWTAiTvvvgV1EMkbMrMhiMrpuAVigphZLaIEOAHvC7P7N1BMnKNJUbqLiiqliE4cEIRm8O7QVYEdR9u7euXxXFmxW7IaoS2YLCOtGuXFav2bUlX1KsunBiOLtWWwCKEuNxy6GArzm0bD1dsO63feVq2KIVrH4tQh5JssiolmNCIrSja/v9XrdZNRKkglhmLYMRUSAZjHY2h/Y8VlTMretXD6+Kon6uGCiGQa23BZV3nC+iAMOzY/M61DPd0EmKMA0JyiKiXlmCTTMdsWIY6OiXrtphl3trRUAJDuhROOjFG7wado/QfCesz/bRIeIkNaOkagDrFkVan3HIZJKEDD3hkHmhiWNr0wW7P7/nsrKqrSyilt2/jAz2gIuwi7CB/ZEOspxNcEGDjUP98D3E7SBGlTJKo9ctofp4ZIlWNbAiHPLZLLAaawEM0aa1/fAWxWS2TUdlVYWpOWlwbcNQX0lVT0/GcLU/EoLFRnpNx1LEDhLBXWQk4CP8fZGOclmDpQBiTTNEEaXAos+hr6h2aIdUXauNxdbIun3TGlSX9no0MtgLIuJmxAbcxwx1OxeI2xJ5ODKUUICC8s8ncx+cmQr5PZAVBJi9cG741FC0WyfV3/7TNBBmqAERBMNkqpUs4JfN5rhi+M3Dg1pbrJxd8ZF/EPNMvqjaN7slUTfNWCIDus8k0gO9nTBl0JOSokJzkEZeNx/t6oCTdNXBReMVjYSOn5qsLZpaHRpP4w1WtvtKryxbZtbFNXDAIBNFtNpgBdDT52LpXGFVtKuvp9Pn82HwfD4PRZxPZDETGT0hww72dBo2ekng4U0Bi5hdlmR3DS2Y3RkM0NRppBMcumniUwIeKAv1ca3mlmH2dodaNU9VJ0UcE4wfcMiyTAhgmKIkpdJ5CCpumJpP2WRFb8j1R8LhoB830LD5vVjN8+KO90Gfx7GQ0lQgVdNySaLopK+GAVcFDrSvAraZ4qbjabWsIi3wZyaXn46nWLvmo/RnCiXYwrGz07FEtiac4HO0K2Qa59ECpcctmdb5wyGbXcR5Wc1xxfN2bhnGEy3TWspMuYBxKhbP53BkE+kcZ3sTOhPAzebLSkWbnF2or0xgx+p+cEyniUjIRxoK8o76wxometJGSTLEyb+CTDzLC9yShYCSAf22XRotkedtlSQcoOWANgKgGiZgVJ+GM51B9N7izHwKVoFks64DCHIIUy2bKrnTvtmyp8HzbO1pTVgZRoG3stvoZXgpiA7pDfH4cMCH4UF0YlhJS21ApMAliZSihh0GU7Y7GRR/jmc+mom7ZYlGToaYGET77H0QxIKjnzXJGaYJK8fOzKdFQVhemYJQo8njsKaSIGwZGTg3l4Sj8wl8tKeD8NjFOPIeJ01bakRWSudLZH9EqZAejmMwDTyzflURCxJ7pjmuPDc+Fds8PED53r5pwT0Qo1OTs8l0AZVw41AfogV8BtGaxfAssSvBMgupHCSyVslgmKr7DOcTA6WhHslibgmCcPTkREfAC1VqT1matpHOQCpTFAU+V1DOTM2Pjc9MTM+jS2OXt0WFRTk3u8DbSkI/YJiNHhLnS+WKA1Z0c28f/xBjr+6FcTTbK5cPPOOYgd5wNfFLME2JTOH9M+iuUlxz4+eEdXw6bifQomAh0g1j2s1Fub44L3IAKF/7x/sYOBzyY+C5RAbvW7XqiqodOzFJIVVvIf9Zi51L5nhB6Ar525cVJP/JiVm/x416AojIJwBobr+yhVL9ZkKVAzxXzJeOHP8QENGdoYoitrQyYVRQkLg722DSrQA8qXnVWDvMkIX2NMBYZ2fiaJKhd6j4PrQsotQQFBpUUpab6xZudXvlp/74BnwkgEELt21YtaqvM+R3eyTR75X6ukNe96JRZ+qO5phhUqWK2gYufMLfj51G4mPCVlX8G1srjl3I5Bs6tvMRhs994sXXOXujigaxI+Ab6utGjq8d6I10BjEBs82uSN2WkUF64JZgZVk8fHRMkoQ2pRGjJFJkS9m538LSAMrDzx2C46b1g9DAMKlVBXrIE8+yy/mSQxJEV4spYZRCUXnnxFkQoHUnzCaS1A+16GMRD59Xvu+R5+GmHZjOMJOzCb2uxDd7DtonQVJQOM0WpgQl6g+vvyOLIssyLVfG5ZpZSDZvcV4QJ6hxsaTe/+gLAa+7mey5YokSiPZxGJW2U3YlJyjhl8Hu0XWDkgQwIr2zHi6GRx797tDbaK1a6TDumVlIYz2bb2AbAMFo3v/LF+eTWa9bbKhVKN9mNVwAuXEo2hUOoMzin2o7qMtH1+3eNhoIBCBbHo8nGAy63e56uAj5X99+L5UpCC0IgFigy52dTzruGzfuv3K2gT905N1vfG2/bktV7RJ8Epp69CpYqHWDERTwgFfu7QyB31iH9WsHg35vgwNGObR34nWq/wG/93sPPUMtorOD49hTZ2cBoGoz22K1SxE3PZ+C+b/h2p1oxGvuHVkZCQfRPkC/YFlo+2/ZdcTjkdHSOG6BgQyVCimVPo906M13D731ntctO4kd8awfTS+AaRznvBnvsK9NHD7PvXXsZNDr2btjFM0thWvZTKC2sp6FwCxJEumeWyQ14irAHLPctx98EpMUeK65RGHEuYX0XCLN2wVzufvatOSGg77vPPT0b15+E2+an968fG1UDMOjOD34+J80zXRSGAIUajoVS/JcS6Dtvtuge+e/feWILEv792y1VdZsjYYczs/hOJ5l3jp+8tHfvxbwubkLFZpQjudn4+nJuQTdqV3J9zD2UziE4c+Hj4HvN163G6Pae3dO7bhhgAaOD5FFfja2cOcDT6EuNgSV7iKPT8biqSyJ6FKFZonLeDw8AdR7y4G7Tp+LdXcEoDuM0xdMqqo2MMEGCsEu3fnAE8jLeqDEavGcUqm8e2oyky8SjrKX/L0hnT1iA7X6xbOvgP7X7dkGbUJbaFT1gULUNOLhkTk0PHjFrHRNvf2eR9F/25tqTG25QJvJ2fjEzAJDGpjlfiW7NNZaGLCGR8cmkCIw17u2jfTZu1TVnd5FuJAn8EEHbjR2mvqtHz9+ZioGAba/tyMJANJPx5JnzsXKqsbbC7/8746Zi/oNCf1GuKiUy8Xylbu23Hz9ngPX7OztCmFgWrpo1cVy48037/v19HwShhorrOpaKltKpnNYH47y9OJ/ssGs4PcutMaSbyOUiqFUogORXZeNbBkehIGEdfR6JAjqfY+8GE/nYPjLFbWokB8YsCv70cAlYm3IKiwroCDemt1FYCq8wCMp4de4RWyX+uuRj+e3OYgU7J0ofDy/8bkkzfq/Oj5JWP8rwADE2W3sMrYCrAAAAABJRU5ErkJggg=="""
+waning_gibbous = """iVBORw0KGgoAAAANSUhEUgAAADkAAAA5CAIAAAADehTSAAAAGXRFWHRTb2Z0d2FyZQBBZG9iZSBJbWFnZVJlYWR5ccllPAAAAyJpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADw/eHBhY2tldCBiZWdpbj0i77u/IiBpZD0iVzVNME1wQ2VoaUh6cmVTek5UY3prYzlkIj8+IDx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IkFkb2JlIFhNUCBDb3JlIDUuMy1jMDExIDY2LjE0NTY2MSwgMjAxMi8wMi8wNi0xNDo1NjoyNyAgICAgICAgIj4gPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4gPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIgeG1sbnM6eG1wPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvIiB4bWxuczp4bXBNTT0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL21tLyIgeG1sbnM6c3RSZWY9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZVJlZiMiIHhtcDpDcmVhdG9yVG9vbD0iQWRvYmUgUGhvdG9zaG9wIENTNiAoV2luZG93cykiIHhtcE1NOkluc3RhbmNlSUQ9InhtcC5paWQ6MjFBNzRGQzUxOUExMTFFRjk2Mjg5MDMwN0IyQzJENzYiIHhtcE1NOkRvY3VtZW50SUQ9InhtcC5kaWQ6MjFBNzRGQzYxOUExMTFFRjk2Mjg5MDMwN0IyQzJENzYiPiA8eG1wTU06RGVyaXZlZEZyb20gc3RSZWY6aW5zdGFuY2VJRD0ieG1wLmlpZDoyMUE3NEZDMzE5QTExMUVGOTYyODkwMzA3QjJDMkQ3NiIgc3RSZWY6ZG9jdW1lbnRJRD0ieG1wLmRpZDoyMUE3NEZDNDE5QTExMUVGOTYyODkwMzA3QjJDMkQ3NiIvPiA8L3JkZjpEZXNjcmlwdGlvbj4gPC9yZGY6UkRGPiA8L3g6eG1wbWV0YT4gPD94cGFja2V0IGVuZD0iciI/Pt43mwoAAA2LSURBVHja1Fp7jFxVHZ77vvOend2d3dlHu213+9iWlmpta5EGqJQEozZiEBL+IcRQiYnBEDWRGJRADCSYKNGAIo/wMCoBlSCNYJBCRcW2IHRb2u2y3dfs7Lxfd+Y+/c49O9PpzJ3Z7ZZEuWkns/feuec7v/P9vt/3OzN89MpbXZ+Qg/9YnmLZh2FaJg7LYhmW4xiOZXGJYZj/PVaA0nSjoqqlsmqpGgB393RGIx0+t6xp+qmPZiVRwASAlcU/Fi8E9qVA51cQQl03ShW1VFRCId8N1+7e99nNuy5bP7K6F3B0xNblEgT+2ZcO//Tpl/0eN8JcUMq5fCmVLeIqMBPcK8LMXxRKBLJQKldU7ebrP3fHTfuv2L5BqZC44szUXBKwFh/Ksddfud3rkX708+d9Hjnk93UG/WsGXMVSeT6ZTWRyNuDFSC//YJaZW7phFEuVsqoevHH/3bffEPS780UC2jBNx/tBVp9X/vcH49/9yXM+twQ+4CTg4bxhmDPxVCyRBlzORrxMrJx/9fYlwwlMWMG9n9706mM/+PK+Haqm5YsKmIAwMm0XYag/Mtjb+Zcj74kCB1iIO1iO9Q8FvJFwsKhUlLJKoS4H8RJYsawlpVIsq4/c8/UH7roFWY4BLMusqDpWX9N1juNozADPkdmj6wYQu3/+Z1wUeELUal4Cek9nCCcRBYZgXRou3zbTTXDRLQqHn/zh8OpoMp1XdT22kImnclh6+mgAwnjdHf6erhDek7DVHbgtV1RuPXDV2NmZY2MT4G4NEKIAuegK+f0eGVdx55J8aBlXGsJod8dj994BiEiXiqadGJ/GSfAMf/IIKcfSlc0Vy8lMIRzw4oxlNUobtOGanZtfePVfID3Pcw3rJvB8dziYyRU0w2DappszVrL0ZbUnHPzVvQcBp6ioSN5ktoC14qoZvJib9oETwIQbuoJ+XG1gA5IJPFk/FH3pjaOSCCawDVTBRyLhQDJbNNrCZZ2TqaK5JeHhu2/Dn5T+jM2oVjJD4LIM1nFiJo7Q1p0ngiDwHODu3bHp6p2bVVW3LKu5rCDjNq7pw2NMq/l6a74if5Vy5Wffv8PrkYtKeZlJinsAC2SAtMmSYNrRYixmPp1LpnMVTfdK8oF9O/72zphERIFphgtSbVgTPTE+xbDOEWGbaQq1P3jT/nWDPSWS8hej1YDLMYlsgRQnwgrzxMT0XDyNoAKdZuiQ1ysu31BQFMePY1k8sjzQ02WYhmNsG6jjKle0NQPdt3xxLxCbF4WUPo5hiopCRJ5jx6fmsUR8leC4CpX7wt5P5QvQZt1hqnakkM2yJDXoiQNWTAiTvvvgV1EMkbMrMhiMrpuAVigphZLaIEOAHvC7P7N1BMnKNJUbqLiiqliE4cEIRm8O7QVYEdR9u7euXxXFmxW7IaoS2YLCOtGuXFav2bUlX1KsunBiOLtWWwCKEuNxy6GArzm0bD1dsO63feVq2KIVrH4tQh5JssiolmNCIrSja/v9XrdZNRKkglhmLYMRUSAZjHY2h/Y8VlTMretXD6+Kon6uGCiGQa23BZV3nC+iAMOzY/M61DPd0EmKMA0JyiKiXlmCTTMdsWIY6OiXrtphl3trRUAJDuhROOjFG7wado/QfCesz/bRIeIkNaOkagDrFkVan3HIZJKEDD3hkHmhiWNr0wW7P7/nsrKqrSyilt2/jAz2gIuwi7CB/ZEOspxNcEGDjUP98D3E7SBGlTJKo9ctofp4ZIlWNbAiHPLZLLAaawEM0aa1/fAWxWS2TUdlVYWpOWlwbcNQX0lVT0/GcLU/EoLFRnpNx1LEDhLBXWQk4CP8fZGOclmDpQBiTTNEEaXAos+hr6h2aIdUXauNxdbIun3TGlSX9no0MtgLIuJmxAbcxwx1OxeI2xJ5ODKUUICC8s8ncx+cmQr5PZAVBJi9cG741FC0WyfV3/7TNBBmqAERBMNkqpUs4JfN5rhi+M3Dg1pbrJxd8ZF/EPNMvqjaN7slUTfNWCIDus8k0gO9nTBl0JOSokJzkEZeNx/t6oCTdNXBReMVjYSOn5qsLZpaHRpP4w1WtvtKryxbZtbFNXDAIBNFtNpgBdDT52LpXGFVtKuvp9Pn82HwfD4PRZxPZDETGT0hww72dBo2ekng4U0Bi5hdlmR3DS2Y3RkM0NRppBMcumniUwIeKAv1ca3mlmH2dodaNU9VJ0UcE4wfcMiyTAhgmKIkpdJ5CCpumJpP2WRFb8j1R8LhoB830LD5vVjN8+KO90Gfx7GQ0lQgVdNySaLopK+GAVcFDrSvAraZ4qbjabWsIi3wZyaXn46nWLvmo/RnCiXYwrGz07FEtiac4HO0K2Qa59ECpcctmdb5wyGbXcR5Wc1xxfN2bhnGEy3TWspMuYBxKhbP53BkE+kcZ3sTOhPAzebLSkWbnF2or0xgx+p+cEyniUjIRxoK8o76wxometJGSTLEyb+CTDzLC9yShYCSAf22XRotkedtlSQcoOWANgKgGiZgVJ+GM51B9N7izHwKVoFks64DCHIIUy2bKrnTvtmyp8HzbO1pTVgZRoG3stvoZXgpiA7pDfH4cMCH4UF0YlhJS21ApMAliZSihh0GU7Y7GRR/jmc+mom7ZYlGToaYGET77H0QxIKjnzXJGaYJK8fOzKdFQVhemYJQo8njsKaSIGwZGTg3l4Sj8wl8tKeD8NjFOPIeJ01bakRWSudLZH9EqZAejmMwDTyzflURCxJ7pjmuPDc+Fds8PED53r5pwT0Qo1OTs8l0AZVw41AfogV8BtGaxfAssSvBMgupHCSyVslgmKr7DOcTA6WhHslibgmCcPTkREfAC1VqT1matpHOQCpTFAU+V1DOTM2Pjc9MTM+jS2OXt0WFRTk3u8DbSkI/YJiNHhLnS+WKA1Z0c28f/xBjr+6FcTTbK5cPPOOYgd5wNfFLME2JTOH9M+iuUlxz4+eEdXw6bifQomAh0g1j2s1Fub44L3IAKF/7x/sYOBzyY+C5RAbvW7XqiqodOzFJIVVvIf9Zi51L5nhB6Ar525cVJP/JiVm/x416AojIJwBobr+yhVL9ZkKVAzxXzJeOHP8QENGdoYoitrQyYVRQkLg722DSrQA8qXnVWDvMkIX2NMBYZ2fiaJKhd6j4PrQsotQQFBpUUpab6xZudXvlp/74BnwkgEELt21YtaqvM+R3eyTR75X6ukNe96JRZ+qO5phhUqWK2gYufMLfj51G4mPCVlX8G1srjl3I5Bs6tvMRhs994sXXOXujigaxI+Ab6utGjq8d6I10BjEBs82uSN2WkUF64JZgZVk8fHRMkoQ2pRGjJFJkS9m538LSAMrDzx2C46b1g9DAMKlVBXrIE8+yy/mSQxJEV4spYZRCUXnnxFkQoHUnzCaS1A+16GMRD59Xvu+R5+GmHZjOMJOzCb2uxDd7DtonQVJQOM0WpgQl6g+vvyOLIssyLVfG5ZpZSDZvcV4QJ6hxsaTe/+gLAa+7mey5YokSiPZxGJW2U3YlJyjhl8Hu0XWDkgQwIr2zHi6GRx797tDbaK1a6TDumVlIYz2bb2AbAMFo3v/LF+eTWa9bbKhVKN9mNVwAuXEo2hUOoMzin2o7qMtH1+3eNhoIBCBbHo8nGAy63e56uAj5X99+L5UpCC0IgFigy52dTzruGzfuv3K2gT905N1vfG2/bktV7RJ8Epp69CpYqHWDERTwgFfu7QyB31iH9WsHg35vgwNGObR34nWq/wG/93sPPUMtorOD49hTZ2cBoGoz22K1SxE3PZ+C+b/h2p1oxGvuHVkZCQfRPkC/YFlo+2/ZdcTjkdHSOG6BgQyVCimVPo906M13D731ntctO4kd8awfTS+AaRznvBnvsK9NHD7PvXXsZNDr2btjFM0thWvZTKC2sp6FwCxJEumeWyQ14irAHLPctx98EpMUeK65RGHEuYX0XCLN2wVzufvatOSGg77vPPT0b15+E2+an968fG1UDMOjOD34+J80zXRSGAIUajoVS/JcS6Dtvtuge+e/feWILEv792y1VdZsjYYczs/hOJ5l3jp+8tHfvxbwubkLFZpQjudn4+nJuQTdqV3J9zD2UziE4c+Hj4HvN163G6Pae3dO7bhhgAaOD5FFfja2cOcDT6EuNgSV7iKPT8biqSyJ6FKFZonLeDw8AdR7y4G7Tp+LdXcEoDuM0xdMqqo2MMEGCsEu3fnAE8jLeqDEavGcUqm8e2oyky8SjrKX/L0hnT1iA7X6xbOvgP7X7dkGbUJbaFT1gULUNOLhkTk0PHjFrHRNvf2eR9F/25tqTG25QJvJ2fjEzAJDGpjlfiW7NNZaGLCGR8cmkCIw17u2jfTZu1TVnd5FuJAn8EEHbjR2mvqtHz9+ZioGAba/tyMJANJPx5JnzsXKqsbbC7/8746Zi/oNCf1GuKiUy8Xylbu23Hz9ngPX7OztCmFgWrpo1cVy48037/v19HwShhorrOpaKltKpnNYH47y9OJ/ssGs4PcutMaSbyOUiqFUogORXZeNbBkehIGEdfR6JAjqfY+8GE/nYPjLFbWokB8YsCv70cAlYm3IKiwroCDemt1FYCq8wCMp4de4RWyX+uuRj+e3OYgU7J0ofDy/8bkkzfq/Oj5JWP8rwADE2W3sMrYCrAAAAABJRU5ErkJggg=="""
 waxing_crescent = """iVBORw0KGgoAAAANSUhEUgAAADkAAAA5CAIAAAADehTSAAAAGXRFWHRTb2Z0d2FyZQBBZG9iZSBJbWFnZVJlYWR5ccllPAAAAyJpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADw/eHBhY2tldCBiZWdpbj0i77u/IiBpZD0iVzVNME1wQ2VoaUh6cmVTek5UY3prYzlkIj8+IDx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IkFkb2JlIFhNUCBDb3JlIDUuMy1jMDExIDY2LjE0NTY2MSwgMjAxMi8wMi8wNi0xNDo1NjoyNyAgICAgICAgIj4gPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4gPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIgeG1sbnM6eG1wPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvIiB4bWxuczp4bXBNTT0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL21tLyIgeG1sbnM6c3RSZWY9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZVJlZiMiIHhtcDpDcmVhdG9yVG9vbD0iQWRvYmUgUGhvdG9zaG9wIENTNiAoV2luZG93cykiIHhtcE1NOkluc3RhbmNlSUQ9InhtcC5paWQ6RjQ5RTYzREUxOUExMTFFRkI0REVFQ0FEOUMxNEZEMjciIHhtcE1NOkRvY3VtZW50SUQ9InhtcC5kaWQ6RjQ5RTYzREYxOUExMTFFRkI0REVFQ0FEOUMxNEZEMjciPiA8eG1wTU06RGVyaXZlZEZyb20gc3RSZWY6aW5zdGFuY2VJRD0ieG1wLmlpZDpGNDlFNjNEQzE5QTExMUVGQjRERUVDQUQ5QzE0RkQyNyIgc3RSZWY6ZG9jdW1lbnRJRD0ieG1wLmRpZDpGNDlFNjNERDE5QTExMUVGQjRERUVDQUQ5QzE0RkQyNyIvPiA8L3JkZjpEZXNjcmlwdGlvbj4gPC9yZGY6UkRGPiA8L3g6eG1wbWV0YT4gPD94cGFja2V0IGVuZD0iciI/PuAfeCQAAAzrSURBVHja1FppbFzVFX7vvv3N4hlviY0dx3HiOCGxE5pCSxsVqlRl7UKF1KYt6SZaVUol6EJFKzVSK/hFQIiKUBVUWkVAAUGbVixFFEjYStoE0mw2jZcY2wneZntv5q397nv2+M3qcYxa8eSM7Jk793733HO+851zw7Zs/ybzIXn4D2QWl/5zXf/Fpa/4nWUYQlj/+T9jdb3HdvBDH8ZxZVmSRYHnOPxZHwtPz6SHht+j+5BERRYVCZ/xQP+/w+ohZIDPsmws3tocb4pFY9FQJCR7n1KzOo7bEIvcc/t38M7U1PTLh088c+jok8+/cW5iSgkrqiJhQxdgbLZ2f/UNaQGm7bSubFjT1lwfDTkwLTWs69Bjn3vwezZnAPLen+zq7lrFuDbDUqMcPz249+E/P/TEi4IsRlR6BktCXCvWOUy23XHRip7OVp7nLMvDWHljWcME4rtv27VhTVtGywKWDIOKsmPlfn7vo3f+5ilFlsKqjKk+MKxYFUBN026MRbdu6BBFwaKo3VrOAXAty9r3i5tbm+KanqMBx8J7BUlWk4nEjbfe/fyrR2PRMPZQi4G5SMfW6utRa1pOX8/qTevasBhweugdz6ouluAIKW8GluU5guF/e/Wd667YJok8TgLv49UwDHjtrht29KxueeSvh/BuLR5cza4+UNDO5VvWh0OySQ+dOmLWNNkAW2ENBWcripUmyei59pUN+/Z8V9N0TJL/CPjUkHp29NylO2+fTWrRkMJxpApWUg2o7ciCcMmmLhxkNkuhJjJazrKAnuQfzxqAkMpoCCa2nHVBWGdGz//2iRdUVSYB42HGVCrd3to49Nyvu9qaE2kNxlgyVt+iosj3bujA7JbjJHU9pemsx/DBw8pzPQyc0rNll4KThFVp/4GDw6Pn4JoFIeu4ybQmCNyxP93V2daUyuhVIoGUA0qngPv0ru9gGRZuCTDE+6mUhPJvZrCfwgH+3iRBiIbVPfueFOC2hQeN5dKZLF7ffPROVZYzetZ13dqxIm7sjd2rOBoZTq2E4kH0AtEKTpYzjGQ6M51KZw2jf3Ds+YNHQopUtF9AS2vZaEg99Ps9aXi3YdXEAz7bd7Q2N8YjftgugatZ1jeIKMwdNM7U9HabP5CXDp+44TOXgWftksnhvhe1rKiPKk+/+BYScmk2LrYrTh+h0L6yfqlA8ycO9vXPPa3pzrwP+A+YFRnk4adfdh0mGGTEYzeOsGZO/8FNn9/cvQrGXcQHPKPa6ztbPQ51mQt6HI/GTC+tlQYiaPXZ145Mzqby6Qr2w8j+4Ykjp4ZODY0zjvnUPT/KJNNBdiuDFd9pjCMG5NrdtOzuqXWxUrlAhAqbnEn/88QZxFieJU4OvkcJy3YmZ5LH+8+uWd12/Y5LtRLTkgKjWs6q1gaYdjkqk3AcFbJMhVgmrCqJLx0+TnjJJ2csB9amPsARvE4mkjDavT/7tpbMFPk0CXpqNCTDqLXk+ipCDJyEV47lKqBF5PFHTg6df38ymdKhZ/En4VjP6ajwQFxm9dzq9tatfevACOV5APtrb21CYF2wp/pRosoSQxMb46fiUjfAO+D/7tUtgHJ+JtlYF6kLKeenkjQoWbZn9UWwtyRyYUV67NnXPIJjC+zqJ6rm+sgyjRpWFMuxEVg8xyuCOFfVlGAFISCMEGfQYe8MjCBGLu1du2V9x7aNXTAWMOh67qvXb4f4COJZwBrxpGQVo7qBp8xHDBNRFSSRlJZN69lMNofMCTnheCdb9B2olv+MjItYjxDTtEbPT8MZIGdhUd/R8SZDhL7N67CZYqyAjzqkilG9cGFCsoLTpY7lFQJ5HNSZ6LnD7RzfEwzTTGo60NSFVFUU2LkCcoENhscmeU8HIqRmkunpRPrdkfGBkfHZVAY7Ybxz33F5b9BlSV72Q/VVdwBvqBMLqZEQrT8knsePIoowHtW1VC6akkD/ZMlcQWu7VEtIkuTObTbPFWRiKoFBvkPrOXPg7MRMSoMyHBiewA/VDI758b7unGEW14aYGkdQPapo1tazomnRolRGDuS8A0FdY+uGCUN4AocepeyKyP74C4Wrf/740C0WNAxMSL/i0DNZCHaXTCVSDckI+GFzdztT6gMUq8BXIkUmkCoNy4a2YAmXD5ScZfprwa7Iq5gLABQYE/ae3zyNhMLwwhjwP2FJaeRBFc8m0jioztZmJpC9FnyA44mzWGr1MxF8yBeKnuCwADH/kWnbWs5IohSEn7ELkSd7uIOTYzTNTCxTNlj9JCrIChPIoHm7MvFoRBaEWsQUMGUB0KR1nxEgUT+l4l1sWcvlggjgoCGQUSGN5OgEdjSiWJ7+WChFHScWVR0/aQUm4fN7p8KHY12TYWuAi0pBhgKkjkj8BfKM7XMqR+OLCZiWCkUkM+wB32U8kQSW3Ly2Hb5yzDibzOjQWYzXJWmoC9fXlVGkfH59bNGtORHkR0KCZE3DnTcA7AOSgt8TwCzMWPgc1gWH+NnUMu1N6zqQ0g3T7l3Xfm5qdioB93XjdZF4JASgxK+MAkUyPw+V0Q2jyBjVTEsoiVqug69EVVnLmY6XIUOyTPncZaskFG854lVKzutvD8D7Qe09nS2N8TqPth2/RcLx3OTkNBMoeEg+j0PsgGLmc9AiXUHQNUrFREpDPYh0GlWVWCSMIgS8WIua8DsMSAE4AVSLYA8UuoDod0nmiwu+f2iM4fkSrIQkUxoUD7NYQ8EjeVfiBQPFN2ExO5JqIp1J6zqUAFNbfwp4FEkAE/s8COZKe02kAlUl8G+dOMOJZbCyyHIcx6mSVIlEgjU0plVEab5ooYEP3kV86NlcLd0exMa6jhZagnrdG7z4fly0ziuHT6LwKvUB8v5s0o8ViCC3Kl4gm0lrhmUygVrKL8rBZGCzRdFCkVy8tr2zrZkmF9OoiygdrY12ILL9vtOzB48CTJnYAi1OJdPgEaQcDIWF3HJxNme2cnvxP8oaOUnkq3sRMl/f+g7g+MjGTnzLmQuohQlBZCf6z2ipTCSsFNuV9sl4Mjo+yXsyCvooGg4h6cMrvCKTw7zBHhtbqa/hveNUrYGpw5jWtou7wAAoAGkr0WvoBcdAAj3w+AtySCkod4NmH5mYpCpjvsyHjAorMjwJqKGnUNS7VRTDvGygaKqOQr7r7W7nRcmusCUwAF4feOwFiPHy9RY1kssMjb6f7+G4AX2NfQsCz9ZARi5ToJtKB+hZ4+rtW23TqDRGUeWHnngOPOODLo8Vauj04BilkDJFEgM94rLFNUIpUJAELWUrKRLbMW3n6u1bfMVT+ni+zv30rv3RsFLkY6SosoOXDwyNleuL0yTMBoKNeK4S1Bx44O4RVc27chFi/Jo1zKs+0cvxfNnKHnPKinrnvj9OpzJySUOXlHaiTw9N5HJmSdvWhbjOewVcAlkKDu14sogqbseJhtV4XRQaBZmFx0OvjzgmsB/wKSj4G1+8Mpst7wCoWlGL337PI5hq8X6WD/fNYwOI/+BoLKcqIseyfgceMYf1kXhi4RCNPEmupyhFj3nc+Thj53vJ89cHOfPKyzataIoHK778g7qICNJnb74DISUJ/OI9TR9rRs/9e2AE8qCgG8Ww4ASAq4uoQsAjYT1BJDxXvgbOm9byZPjunVdl9VzpSISRpKi7f/nAsYERiK+yyY9UuJNAnTl1ZnRCLLxymF+joHjyuyyV0pzvu/6twdev+ySEKeR50Rg4i6KG7vvDgfv2PxOLhCrdGpBKXSco4+Pvjo6em0YSWP6FKk6/MRb+1pc+TW+O3GKLqqHwIwde2v2rByFeRYFf8t0G53WajpwafHd4At6znHtUeCcK3Ttu2WkadlGnEtIEFt370FM7f7g3FgtXT858dT0FlKeGxlIZrW/DGsI6lRrIKLtJhVsuZNBkWrt117UdK5sgxIJHR/2SE7/24737DxyM19fJorCsuzhfXGKNs+NTjXFKU6Ucv1AYlrgKKDmRzFxzxSU3feHKjDZ3x0L1pCTi3PsHRz96421vvN1fD4vWUJaSxUfAd3nOtK1XDp94+/Qw1hLLuYTtS9HAPhD4iVTmsr61t+z6nJbRcSb0rksSo9E6wP3+nvt7rto9OZuM14UFvqbr9iXccwOJJ4icNa0rujpWyJLo33n7EmmBVv0LGdtJZrRtG7vuuPUruazpeH0dhvCpRHLP/Y/v/d1fRImPqMqSLufZJf0fkvy1PA63MR5pW9HQ0hQDaP9+wUPt+nUzBMo1n9ryvS9fOxdeOe2xZ15/8Mm/v3zoiBRF+pCWeiG/ZKzFd8peEaIoYpwWhrLi5RtoCYDe0tO542Ob/nVy8B/vDLx6tH9seJxVadOcXstz3IXxCbvM/5szJw8c1wlILzguqn7/8kgUBcATaKeVLJOkl/t/c+aKLVKqQpgP/CHMh+f5MGH9rwADABbn1B7aevJLAAAAAElFTkSuQmCC"""
-waxing_gibbous = """iVBORw0KGgoAAAANSUhEUgAAADkAAAA5CAIAAAADehTSAAAAGXRFWHRTb2Z0d2FyZQBBZG9iZSBJbWFnZVJlYWR5ccllPAAAAyJpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADw/eHBhY2tldCBiZWdpbj0i77u/IiBpZD0iVzVNME1wQ2VoaUh6cmVTek5UY3prYzlkIj8+IDx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IkFkb2JlIFhNUCBDb3JlIDUuMy1jMDExIDY2LjE0NTY2MSwgMjAxMi8wMi8wNi0xNDo1NjoyNyAgICAgICAgIj4gPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4gPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIgeG1sbnM6eG1wPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvIiB4bWxuczp4bXBNTT0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL21tLyIgeG1sbnM6c3RSZWY9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZVJlZiMiIHhtcDpDcmVhdG9yVG9vbD0iQWRvYmUgUGhvdG9zaG9wIENTNiAoV2luZG93cykiIHhtcE1NOkluc3RhbmNlSUQ9InhtcC5paWQ6RDgwODlCRUExOUExMTFFRjkzQTA4OTIyOUVDRjE5MjkiIHhtcE1NOkRvY3VtZW50SUQ9InhtcC5kaWQ6RDgwODlCRUIxOUExMTFFRjkzQTA4OTIyOUVDRjE5MjkiPiA8eG1wTU06RGVyaXZlZEZyb20gc3RSZWY6aW5zdGFuY2VJRD0ieG1wLmlpZDpEODA4OUJFODE5QTExMUVGOTNBMDg5MjI5RUNGMTkyOSIgc3RSZWY6ZG9jdW1lbnRJRD0ieG1wLmRpZDpEODA4OUJFOTE5QTExMUVGOTNBMDg5MjI5RUNGMTkyOSIvPiA8L3JkZjpEZXNjcmlwdGlvbj4gPC9yZGY6UkRGPiA8L3g6eG1wbWV0YT4gPD94cGFja2V0IGVuZD0iciI/PhYq7/EAAA15SURBVHja1FppjGRVFX5bva32qp7eprunZ2uYhWEmTBRQIJFFJBqjSDQmElEESfxBDMkkhKhAQAiRiBAUnRgHByIRUdmcCCTAoA44CDL71j29d1V1116vqt7qd+/rrqmufQbU8FKpVPdb7ne/c853zrn3CX2X3cR8TA6O+fgcwkf1IMdx3G/LdmzbJjRwHM+x7vF/xuqQg3wDmU3/ED2CaduWZW9aO5DOFWLzmdhcEleyokeVRUn0eASB49j/HVaKkLEpQJ7jIkFvwK/6FBlQSmUDJx+586YL1g+6Z0HxifG5tw8cf+0fB194/V+xRFJVFUXGpPhzIJvtPLYWUVqExa6Qrzsa9qkSQ3DD7nahWPYq4uN3fTsU8GnFsk1dAi4gCLy0xOu+D47//HevPPXiXvz2qfLZIu4UK3VEwmV3JDjQGxV4zv3TPaWVdAB94ke3+hQJv13frTlAMyD6vbKmle7b+adHfvuyIoleVRJ4vkOsvH/Vtg780jEt2+9VNqwZiIT8DMVdwVPSiel33v3dgFfRSuVGOBefY5gWKEfQfe7TW2/+ypXvHhk9fGoa0+ZpDH5YrCR0gMxy1gx0r+rvdi3uUEIpWscwLF3XH73r5v4VYbhBM6DVB4KvWNbhFd+5/qqh/q7nXnkHN4HdtnC5NkBtB1dcsH6oKxwAK3DWsq4XSuWirpcMAywuZHJfuvoTQa9c1I3Ofc91m9hC5oZrLnn39w94FSlXKFpU6c4FqwvU4+HXrOo1bVM3TKgRwAEwCHBtpuvmlvOGLr9o04mJ2IHjE5ZpnZUkmZaVzhZWdkf2P/MACM7l28DlWpgedlm9sodnOYCG1cAcA4RL2g6aYbebv/yZYklnqWWPnp61LYc7m9DGKDmtKIrCm0/ePdTXlddKbryeHVYAWj2wguXI49jqwx2Dor/hmksFQdBNkzDNsWBlbDqOQDmjMiwJf2gTFBUfhFH9TODigMg4zJ4n7oT00uh0OsVq06hf1deFFNlsloZp9kaDl2/fUC4bS7BYIMkWSgWt7AICLo7hYqnswZOT+w+PvndkfGw6gYlVT6ZyIC4DPvWFR3cUYCbD7EgH3JzZEw0hGzUDiv8XtNItN1zp8yrwhCoWWUoTG/KrdM7wiplMTnPFlaqbHk9mFFFSFbGePMx/1coVPlX5y1vvyaJY7/pcPamSIETDfoR8M7/BQ3uigc3rhhBbtY9j2UKxSKoWnjs1GcNMiN2J5YmTQEkRA2PTsbJuVDsDzhKV5TjY5I5vfmHD6gF4QhsfIKRadn9P1HGaCiXOYKTrLt8O0bEbXMWapg0cea2Y13Tqn9WYGJbOYzaertCGK+Doo5Pxg8cnML1cobDrvtvyOc2sslgDrBjb7yO1RYtgdGXlkgvXN/MqCo/N5Ivuj9qp0AsyBY3jFocmFpiYzRSKpuNArQ+Pzmw5f/jaK7bVU8vVkNodDbYWOSSqi7esR8ZqeBkeokoSOWs5zbSLOrXD865rMIZlFYqG6wP4SqYLOa3049u/Xshr1nI/XIYVxQQ+ze2/6AAXbV5X1s1m9U0o4MUYkig0fwyLfApzZ3JF4BNpUessHZIkFEvljWuHLty0ForQGCvsHg55W5PqJrMt6wYQXvUySeJS9KCixQ98W7ZtN8RLvTaVKUCMD52aNg1z3WCPbtplA15gD/d3ISLzxeJtX70a+lVNHFedqII+r2M7LbOivXqgm+X5GoemjJAacf1gD/JQrlBSJGlld9iyGsBlXTHmSY5AAB05PQON275xeNO6gS0jwyjacQ/Kseuvvtgq6tUDVbAyiuzB/U5LUkHnyKo+w2joAMx5w/2arh8ZnTk+Pjsxlwj5vf3dIVxsupDrQVMh0w1rdh6ywMH9KuKAezCBCzat1qsMeIZXRZbtdiUdrDc80K2RzIJCxcITCRCLAEFOV0QPFBcBg0nHFrKHTk5ivC0jQyC4WZFAsx2bzhWJS0zFR6fj2byGXIwT6Iiu2L6pkheXYUVP4bTDCmBXfXLThtX9/StC0aAvGvIN9ER6uoIAi9Q4PZ/q7griT8QHiIT1wBls1dcVhoc0nT/Los48PZPI5DUAHZ1KjE3FcFfZMLZvXlOuCi+hglXyiG0rZTBa1M1wgEO+8Pl84CqXy6GIQcsKemQ0qiw32BOFyefm05JH8KsyLXptGBvoG5Jb05Q7nJPMauGsBn3YsHbArsoIS7wyjCjyTgdlva4bM4mULMvEASxblKRkKgdBxXiTsSS6VoyLRIqqNBL0m1Qg8Vi0WXbrsF3uFZl8AZE62BtlGmAlhR/nKlyLB8kiSjvPVCypl3Sedh3pbG4qnuRozoeep/MalOjI6NTcfIZhK6nO6esK2VYDtBVZbZggo0E/U6WhZ3j1qzBaq5YS1yCVAwECZXIunsviyMynsm4CqpQgmVypWDbGZxL20jCAAu9ADeVKwpkVGstGjKLlrPyzsnID9YTPiJKHqZqGUJlg28UcllYMNKFzBVIRE57gVc5Sbe6mA7f7k2UPKUqWRsJ/EItQpelYEqUCxsEZOMZQb9TnlY+OziCvuoJFUlJAxYf4D+xQBamy7sIig7d11zLUjs4IxRQBxziRgA/Dw15ARptbCyIFTZXE2kjF2LLoGRnugySggYNP4+O6xYY1K+OpbCargY9QQA35VLeryxa0BlhJDWGaXLtVQ4doUxlPQT+CkXCL5PFsXj8wMbtQKOk+j9DXEyZ+zLANpZq064uxgnkyC5k8NBW1S9Cnjgz1doV8VOmID+AKOORsIsVUNREVrCykxytLJcd0oTeMUFgfnSe+IUbHxmcWUvlIyHf+cD/YAj6wSzKDZXfYd5+YmAMgmfeggRmbSQyvXFF9L06NTiaYqhDiKjiQgjkBTatDo6jJygfHIcBxcXc0gOIN7V42Xzw5GTtyahoCDsq5jhcwkZZYWmi7mRbKXZPb8PD3j572eDy1WGklX4IISYLoLC2mNlhV5DkoFPwJdh7ojSwFvoaR5tP5gyenZuNJ6gPtDxkxzlKvIOu1jlepzfC4YN8Hx8hltbwS+UUT58ANkc2bwYVdxiZjpm2/d3g8mc5V6g+kRHKjR5hdyCaSWY7rZLmcPW+oD6Gvm4bfKw32hpeVVLSuffXtQ2C3zl+pWOQLJVmGqKH4ZRpW0wB07PQM5gojWHU5k6M0QxZWhP3tV7VsW1WlLSOrMFsosbW8EEPS2ffvE1pOC/REGvgr6Emkc5gQXQkTvGT1lzQaLOk/ObIk7cZWXovNp92lsgbtFG30tLLeideCHeQCnWQIu8aMPlXe9fwbileuHoKrYoVLJDOss8QWIUmAIqqiiG+RqhTOgPV3D42iAmyWzQlcy2KYc19rh6dBuZ98/k1Vlhr3MG6ajC1kqr3NqXzo8hb+A7b/9v4xoG/I3GLP5BGZTlY3mxwg9TfPvQ7Ka3I+V1PgTMUW2MUVlLqkZRhUCvjJuYWZRBI/agznpnh4M5zHbl6UtD5gQMTLvU/8ARJeA4OrsSBiESUfXxfIdCXQcdt/RRb37H0f/aqbZtzdGKCE5ymqtHHtoCTJoijSCuHs4OKWgE95YOfzqWwBBmy1luGun03HFnTDqFlOckgiYF3yMPU39h9B2dHfHUZg4EPjw9q6ce3FF24MBAKCx6OqajAYVBTlrOB6FWkmlrz/V39E8VW/nlW/Bk8WctL5YndXqCZ/YRqLxRvqAY4v6fp1l21DA4jyKeBVRtYMBv1eVC3Vko6sQ/YaTJNp4lfVB9n5UOVrb70fbbAqi/XX19maJVYulfXxqYTAL0t7uBmPgJbhg0Lu2b++HU9lwDHIiKAJVMiaoVO/DKOqnaRdhFEk6P3+g7vQBuOBDW/hGncRPJdIZWYTVEeXe4IrS7gAKB/c+WcfjQDomd1kEcQ922ZDUODDAd/Pdu/55bOvwV8bLtA2XdemGQjxPj+fzBJZZRsgQOH8zoFTr+77AGS3SKpuGd6aUZThT7/81o6Hd0eCvuqk2unehts/oWGfiadATP14mD0K+4d+/QJ6BKn5AK4atKhgVkQCP9n10i0/+EU44G0BtM2eEdgCu5CFk6dneZpp67UQkbTj4aeQmJsNA9/Qdb0hFwh2BNM3djz2w8eegccjqbe2QJu9OLdOKJb0RCoboDvE1Ry5jhtbyI7PxD/7qa0Oy9UX2oVCocYN8BN0wtxHR6c/86179h8ebctop3ucboqH7M/NpyFJECk0ShXEdHeYQ3NX1EqXbB1hSBO2aBMXqGEYlSoH30CJMNJN646Hdn/v3p0wS8Ard7gl2x5rhV0Mr5XKs/EUShMvdGWJCbKAJfD/PHgKOrp1ZLCs66VSGUc+n4cDuPeCNihGNOxPZ7R7Hn/2a3f89OjYNDIfoHdW7J7l+wPuBoXDMeg5Z+fT0P9oOBAJqmgPgRXc7H5xb14r3n7j54slkpC9KELpzhYAzSXSz+z5+9Mv7X1r3yHZr0ZD/nN4hYA9t3dz3PVa940H5BuvIiqKxHN8uWxcum3kxi9ekc1r8fnM2HTiwImJdw6enJ2K84rkJQ4vdL4J/9FgrX+TZHHr3rYBFxUZ2ezkl+8Ych/2PaAP+25OJWwWhZ1hkCOY/87xcXrn6T8CDADzRBW59plmEAAAAABJRU5ErkJggg=="""
\ No newline at end of file
+waxing_gibbous = """iVBORw0KGgoAAAANSUhEUgAAADkAAAA5CAIAAAADehTSAAAAGXRFWHRTb2Z0d2FyZQBBZG9iZSBJbWFnZVJlYWR5ccllPAAAAyJpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADw/eHBhY2tldCBiZWdpbj0i77u/IiBpZD0iVzVNME1wQ2VoaUh6cmVTek5UY3prYzlkIj8+IDx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IkFkb2JlIFhNUCBDb3JlIDUuMy1jMDExIDY2LjE0NTY2MSwgMjAxMi8wMi8wNi0xNDo1NjoyNyAgICAgICAgIj4gPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4gPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIgeG1sbnM6eG1wPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvIiB4bWxuczp4bXBNTT0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL21tLyIgeG1sbnM6c3RSZWY9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZVJlZiMiIHhtcDpDcmVhdG9yVG9vbD0iQWRvYmUgUGhvdG9zaG9wIENTNiAoV2luZG93cykiIHhtcE1NOkluc3RhbmNlSUQ9InhtcC5paWQ6RDgwODlCRUExOUExMTFFRjkzQTA4OTIyOUVDRjE5MjkiIHhtcE1NOkRvY3VtZW50SUQ9InhtcC5kaWQ6RDgwODlCRUIxOUExMTFFRjkzQTA4OTIyOUVDRjE5MjkiPiA8eG1wTU06RGVyaXZlZEZyb20gc3RSZWY6aW5zdGFuY2VJRD0ieG1wLmlpZDpEODA4OUJFODE5QTExMUVGOTNBMDg5MjI5RUNGMTkyOSIgc3RSZWY6ZG9jdW1lbnRJRD0ieG1wLmRpZDpEODA4OUJFOTE5QTExMUVGOTNBMDg5MjI5RUNGMTkyOSIvPiA8L3JkZjpEZXNjcmlwdGlvbj4gPC9yZGY6UkRGPiA8L3g6eG1wbWV0YT4gPD94cGFja2V0IGVuZD0iciI/PhYq7/EAAA15SURBVHja1FppjGRVFX5bva32qp7eprunZ2uYhWEmTBRQIJFFJBqjSDQmElEESfxBDMkkhKhAQAiRiBAUnRgHByIRUdmcCCTAoA44CDL71j29d1V1116vqt7qd+/rrqmufQbU8FKpVPdb7ne/c853zrn3CX2X3cR8TA6O+fgcwkf1IMdx3G/LdmzbJjRwHM+x7vF/xuqQg3wDmU3/ED2CaduWZW9aO5DOFWLzmdhcEleyokeVRUn0eASB49j/HVaKkLEpQJ7jIkFvwK/6FBlQSmUDJx+586YL1g+6Z0HxifG5tw8cf+0fB194/V+xRFJVFUXGpPhzIJvtPLYWUVqExa6Qrzsa9qkSQ3DD7nahWPYq4uN3fTsU8GnFsk1dAi4gCLy0xOu+D47//HevPPXiXvz2qfLZIu4UK3VEwmV3JDjQGxV4zv3TPaWVdAB94ke3+hQJv13frTlAMyD6vbKmle7b+adHfvuyIoleVRJ4vkOsvH/Vtg780jEt2+9VNqwZiIT8DMVdwVPSiel33v3dgFfRSuVGOBefY5gWKEfQfe7TW2/+ypXvHhk9fGoa0+ZpDH5YrCR0gMxy1gx0r+rvdi3uUEIpWscwLF3XH73r5v4VYbhBM6DVB4KvWNbhFd+5/qqh/q7nXnkHN4HdtnC5NkBtB1dcsH6oKxwAK3DWsq4XSuWirpcMAywuZHJfuvoTQa9c1I3Ofc91m9hC5oZrLnn39w94FSlXKFpU6c4FqwvU4+HXrOo1bVM3TKgRwAEwCHBtpuvmlvOGLr9o04mJ2IHjE5ZpnZUkmZaVzhZWdkf2P/MACM7l28DlWpgedlm9sodnOYCG1cAcA4RL2g6aYbebv/yZYklnqWWPnp61LYc7m9DGKDmtKIrCm0/ePdTXlddKbryeHVYAWj2wguXI49jqwx2Dor/hmksFQdBNkzDNsWBlbDqOQDmjMiwJf2gTFBUfhFH9TODigMg4zJ4n7oT00uh0OsVq06hf1deFFNlsloZp9kaDl2/fUC4bS7BYIMkWSgWt7AICLo7hYqnswZOT+w+PvndkfGw6gYlVT6ZyIC4DPvWFR3cUYCbD7EgH3JzZEw0hGzUDiv8XtNItN1zp8yrwhCoWWUoTG/KrdM7wiplMTnPFlaqbHk9mFFFSFbGePMx/1coVPlX5y1vvyaJY7/pcPamSIETDfoR8M7/BQ3uigc3rhhBbtY9j2UKxSKoWnjs1GcNMiN2J5YmTQEkRA2PTsbJuVDsDzhKV5TjY5I5vfmHD6gF4QhsfIKRadn9P1HGaCiXOYKTrLt8O0bEbXMWapg0cea2Y13Tqn9WYGJbOYzaertCGK+Doo5Pxg8cnML1cobDrvtvyOc2sslgDrBjb7yO1RYtgdGXlkgvXN/MqCo/N5Ivuj9qp0AsyBY3jFocmFpiYzRSKpuNArQ+Pzmw5f/jaK7bVU8vVkNodDbYWOSSqi7esR8ZqeBkeokoSOWs5zbSLOrXD865rMIZlFYqG6wP4SqYLOa3049u/Xshr1nI/XIYVxQQ+ze2/6AAXbV5X1s1m9U0o4MUYkig0fwyLfApzZ3JF4BNpUessHZIkFEvljWuHLty0ForQGCvsHg55W5PqJrMt6wYQXvUySeJS9KCixQ98W7ZtN8RLvTaVKUCMD52aNg1z3WCPbtplA15gD/d3ISLzxeJtX70a+lVNHFedqII+r2M7LbOivXqgm+X5GoemjJAacf1gD/JQrlBSJGlld9iyGsBlXTHmSY5AAB05PQON275xeNO6gS0jwyjacQ/Kseuvvtgq6tUDVbAyiuzB/U5LUkHnyKo+w2joAMx5w/2arh8ZnTk+Pjsxlwj5vf3dIVxsupDrQVMh0w1rdh6ywMH9KuKAezCBCzat1qsMeIZXRZbtdiUdrDc80K2RzIJCxcITCRCLAEFOV0QPFBcBg0nHFrKHTk5ivC0jQyC4WZFAsx2bzhWJS0zFR6fj2byGXIwT6Iiu2L6pkheXYUVP4bTDCmBXfXLThtX9/StC0aAvGvIN9ER6uoIAi9Q4PZ/q7griT8QHiIT1wBls1dcVhoc0nT/Los48PZPI5DUAHZ1KjE3FcFfZMLZvXlOuCi+hglXyiG0rZTBa1M1wgEO+8Pl84CqXy6GIQcsKemQ0qiw32BOFyefm05JH8KsyLXptGBvoG5Jb05Q7nJPMauGsBn3YsHbArsoIS7wyjCjyTgdlva4bM4mULMvEASxblKRkKgdBxXiTsSS6VoyLRIqqNBL0m1Qg8Vi0WXbrsF3uFZl8AZE62BtlGmAlhR/nKlyLB8kiSjvPVCypl3Sedh3pbG4qnuRozoeep/MalOjI6NTcfIZhK6nO6esK2VYDtBVZbZggo0E/U6WhZ3j1qzBaq5YS1yCVAwECZXIunsviyMynsm4CqpQgmVypWDbGZxL20jCAAu9ADeVKwpkVGstGjKLlrPyzsnID9YTPiJKHqZqGUJlg28UcllYMNKFzBVIRE57gVc5Sbe6mA7f7k2UPKUqWRsJ/EItQpelYEqUCxsEZOMZQb9TnlY+OziCvuoJFUlJAxYf4D+xQBamy7sIig7d11zLUjs4IxRQBxziRgA/Dw15ARptbCyIFTZXE2kjF2LLoGRnugySggYNP4+O6xYY1K+OpbCargY9QQA35VLeryxa0BlhJDWGaXLtVQ4doUxlPQT+CkXCL5PFsXj8wMbtQKOk+j9DXEyZ+zLANpZq064uxgnkyC5k8NBW1S9Cnjgz1doV8VOmID+AKOORsIsVUNREVrCykxytLJcd0oTeMUFgfnSe+IUbHxmcWUvlIyHf+cD/YAj6wSzKDZXfYd5+YmAMgmfeggRmbSQyvXFF9L06NTiaYqhDiKjiQgjkBTatDo6jJygfHIcBxcXc0gOIN7V42Xzw5GTtyahoCDsq5jhcwkZZYWmi7mRbKXZPb8PD3j572eDy1WGklX4IISYLoLC2mNlhV5DkoFPwJdh7ojSwFvoaR5tP5gyenZuNJ6gPtDxkxzlKvIOu1jlepzfC4YN8Hx8hltbwS+UUT58ANkc2bwYVdxiZjpm2/d3g8mc5V6g+kRHKjR5hdyCaSWY7rZLmcPW+oD6Gvm4bfKw32hpeVVLSuffXtQ2C3zl+pWOQLJVmGqKH4ZRpW0wB07PQM5gojWHU5k6M0QxZWhP3tV7VsW1WlLSOrMFsosbW8EEPS2ffvE1pOC/REGvgr6Emkc5gQXQkTvGT1lzQaLOk/ObIk7cZWXovNp92lsgbtFG30tLLeideCHeQCnWQIu8aMPlXe9fwbileuHoKrYoVLJDOss8QWIUmAIqqiiG+RqhTOgPV3D42iAmyWzQlcy2KYc19rh6dBuZ98/k1Vlhr3MG6ajC1kqr3NqXzo8hb+A7b/9v4xoG/I3GLP5BGZTlY3mxwg9TfPvQ7Ka3I+V1PgTMUW2MUVlLqkZRhUCvjJuYWZRBI/agznpnh4M5zHbl6UtD5gQMTLvU/8ARJeA4OrsSBiESUfXxfIdCXQcdt/RRb37H0f/aqbZtzdGKCE5ymqtHHtoCTJoijSCuHs4OKWgE95YOfzqWwBBmy1luGun03HFnTDqFlOckgiYF3yMPU39h9B2dHfHUZg4EPjw9q6ce3FF24MBAKCx6OqajAYVBTlrOB6FWkmlrz/V39E8VW/nlW/Bk8WctL5YndXqCZ/YRqLxRvqAY4v6fp1l21DA4jyKeBVRtYMBv1eVC3Vko6sQ/YaTJNp4lfVB9n5UOVrb70fbbAqi/XX19maJVYulfXxqYTAL0t7uBmPgJbhg0Lu2b++HU9lwDHIiKAJVMiaoVO/DKOqnaRdhFEk6P3+g7vQBuOBDW/hGncRPJdIZWYTVEeXe4IrS7gAKB/c+WcfjQDomd1kEcQ922ZDUODDAd/Pdu/55bOvwV8bLtA2XdemGQjxPj+fzBJZZRsgQOH8zoFTr+77AGS3SKpuGd6aUZThT7/81o6Hd0eCvuqk2unehts/oWGfiadATP14mD0K+4d+/QJ6BKn5AK4atKhgVkQCP9n10i0/+EU44G0BtM2eEdgCu5CFk6dneZpp67UQkbTj4aeQmJsNA9/Qdb0hFwh2BNM3djz2w8eegccjqbe2QJu9OLdOKJb0RCoboDvE1Ry5jhtbyI7PxD/7qa0Oy9UX2oVCocYN8BN0wtxHR6c/86179h8ebctop3ucboqH7M/NpyFJECk0ShXEdHeYQ3NX1EqXbB1hSBO2aBMXqGEYlSoH30CJMNJN646Hdn/v3p0wS8Ard7gl2x5rhV0Mr5XKs/EUShMvdGWJCbKAJfD/PHgKOrp1ZLCs66VSGUc+n4cDuPeCNihGNOxPZ7R7Hn/2a3f89OjYNDIfoHdW7J7l+wPuBoXDMeg5Z+fT0P9oOBAJqmgPgRXc7H5xb14r3n7j54slkpC9KELpzhYAzSXSz+z5+9Mv7X1r3yHZr0ZD/nN4hYA9t3dz3PVa940H5BuvIiqKxHN8uWxcum3kxi9ekc1r8fnM2HTiwImJdw6enJ2K84rkJQ4vdL4J/9FgrX+TZHHr3rYBFxUZ2ezkl+8Ych/2PaAP+25OJWwWhZ1hkCOY/87xcXrn6T8CDADzRBW59plmEAAAAABJRU5ErkJggg=="""
@@ -1,5 +1,6 @@
 import sys
 from datetime import datetime
+from typing import List, Tuple
 import ephem
 from moon_phase_class import MoonCalculator
 
@@ -11,35 +12,55 @@ class MoonPhaseCLI(MoonCalculator):
         """
         Display moon details in a formatted output
         """
+        print(self.format())
+
+    def format(self) -> str:
+        """
+        Moon details as the lines display prints
+        """
         details = self.moon_details
-        
-        print(f"Date: {self.date.strftime('%Y-%m-%d')}")
-        print(f"Moon Phase (Numeric): {details['phase_numeric']:.4f}")
-        print(f"Moon Phase (Name): {details['phase_name']}")
-        print(f"Moon Illumination: {details['illumination_percent']:.2f}%")
-        print(f"Illumination Description: {details['illumination_description']}")
-        print(f"Moon Age: {details['moon_age_days']:.2f} days")
-        print(f"Next New Moon: {ephem.Date(details['next_new_moon']).datetime().strftime('%Y-%m-%d')}")
+        next_new_moon = ephem.Date(details['next_new_moon']).datetime()
+        return "\n".join([
+            f"Date: {self.date.strftime('%Y-%m-%d')}",
+            f"Moon Phase (Numeric): {details['phase_numeric']:.4f}",
+            f"Moon Phase (Name): {details['phase_name']}",
+            f"Moon Illumination: {details['illumination_percent']:.2f}%",
+            f"Illumination Description: {details['illumination_description']}",
+            f"Moon Age: {details['moon_age_days']:.2f} days",
+            f"Next New Moon: {next_new_moon.strftime('%Y-%m-%d')}",
+        ])
 
-def main():
+# ------------------------------ RUN ------------------------------------- #
+def run(args: List[str], lunations=None) -> Tuple[int, str]:
     """
-    Main entry point for the moon phase CLI application
+    Everything main does except printing, so moon_daemon.py can answer
+    for it. args are the command line arguments after the program name,
+    lunations is passed on to MoonCalculator.
+
+    Returns:
+        (exit code, output text)
     """
     # Check if a date is provided as a command-line argument
-    if len(sys.argv) > 1:
+    if args:
         try:
             # Attempt to parse the date from command-line argument
-            input_date = datetime.strptime(sys.argv[1], '%Y-%m-%d')
+            input_date = datetime.strptime(args[0], '%Y-%m-%d')
         except ValueError:
-            print("Invalid date format. Use YYYY-MM-DD.")
-            sys.exit(1)
+            return 1, "Invalid date format. Use YYYY-MM-DD."
     else:
         # Use current date if no argument provided
         input_date = datetime.now()
-    
-    # Create and display moon phase information
-    moon_cli = MoonPhaseCLI(input_date)
-    moon_cli.display()
+
+    # Create moon phase information
+    return 0, MoonPhaseCLI(input_date, lunations).format()
+
+def main():
+    """
+    Main entry point for the moon phase CLI application
+    """
+    code, output = run(sys.argv[1:])
+    print(output)
+    sys.exit(code)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
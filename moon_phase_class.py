@@ -9,15 +9,19 @@ class MoonCalculator(ABC):
     Abstract base class for moon phase and illumination calculations
     """
 
-    def __init__(self, date: datetime = None):
+    def __init__(self, date: datetime = None, lunations=None):
         """
         Initialize the moon calculator
 
         Args:
             date (datetime, optional): Date for calculations. 
                 Defaults to current date if not provided.
+            lunations (optional): anything with covers(dte) and
+                bounds(dte) like lunation_tables.LunationTable, the
+                next new moon is looked up there instead of searched
         """
         self.date = date or datetime.now()
+        self.lunations = lunations
         self.moon_details = self._calculate_moon_details()
 
 # --------------------- CALCULATE MOON DETAILS --------------------------- #
@@ -41,7 +45,11 @@ class MoonCalculator(ABC):
         phase_illumination = moon.moon_phase * 100
 
         # Find the date of the next new moon after the given date
-        new_moon = ephem.next_new_moon(self.date)
+        dte = ephem.Date(self.date)
+        if self.lunations is not None and self.lunations.covers(dte):
+            new_moon = ephem.Date(self.lunations.bounds(dte)[1])
+        else:
+            new_moon = ephem.next_new_moon(self.date)
 
         # Calculate moon age (days since last new moon)
         moon_age = ephem.Date(self.date) - ephem.Date(new_moon)
@@ -5,7 +5,10 @@
     Purpose: Python moon phase program using ephem library
     Display moon information at the current time and location
 """
+import os
 import moon_class
+# Offline city lookup, no network needed
+import gazetteer
 # Windows: pip install rich
 # Linux: pip3 install rich
 # Import Console for console printing
@@ -26,13 +29,25 @@ class MoonPhase:
                 subtitle="By William Loring")
         )
 
+        self.get_location()
+
         # Create moonclass object to access methods and properties
-        self.mc = moon_class.MoonClass(False)
+        if self.lat is None:
+            self.mc = moon_class.MoonClass(False)
+        else:
+            self.mc = moon_class.MoonClass(False, lat=self.lat, lng=self.lng)
 
         # Create observer
         self.mc.get_observer()
 
+        # Raw lat and lng, show the closest named place instead
+        if self.address is None:
+            city, km = gazetteer.nearest(self.mc.lat, self.mc.lng)
+            self.address = f"{km:,.0f} km from {city.address}" \
+                if km >= 10 else city.address
+
         # Display moon information
+        console.print(f" [bold green]{self.address}[/bold green]")
         console.print(f"[green]{self.mc.formatted_time}[/green]")
         # print()
         console.print(
@@ -51,11 +66,66 @@ class MoonPhase:
         console.print(
             f" Illumination: [cyan]{self.mc.illumination:.2f}%[/cyan]"
         )
-        console.print(f"          Age: [cyan]{self.mc._moon_age:.2f} days[/cyan]")
+        console.print(f"          Age: [cyan]{self.mc.moon_age:.2f} days[/cyan]")
         console.print(f"   [cyan]{self.mc.phase_ascii}[/cyan]")
 
         print()
         input(" Enter to exit")
 
+# -------------------------- GET LOCATION -------------------------------- #
+    def get_location(self):
+        """
+        Ask for a city and look it up in the offline gazetteer.
+        Blank city keeps the MoonClass default location.
+        """
+        # None lets MoonClass use its default lat and lng
+        self.lat = None
+        self.lng = None
+        self.address = None
+
+        city = input(" Enter city (Enter for default): ").strip()
+        if not city:
+            return
+        state = input(" Enter state: ")
+        country = input(" Enter country: ")
+        print()
+
+        location = self._lookup(city, state, country)
+        # Online fallback only when a geocoding server is configured
+        if location is None and os.environ.get("MOON_GEOCODER_URL"):
+            # Cached network geocoding, only imported when configured
+            from geocode_client import GeocodeClient
+            with GeocodeClient(os.environ["MOON_GEOCODER_URL"]) as client:
+                try:
+                    location = client.geocode(city, state, country)
+                # Network errors, and a reply that is not JSON or has
+                # no lat, lon or display_name
+                except (OSError, ValueError, KeyError) as e:
+                    console.print(f" [red]Geocoding failed: {e}[/red]")
+        if location is None:
+            console.print(
+                f" [red]{city} not found, using default location[/red]")
+            return
+        self.lat, self.lng, self.address = location
+
+    def _lookup(self, city: str, state: str, country: str):
+        """
+        (lat, lng, address) from the gazetteer, None if not found.
+        A close spelling is only used when the user says it is right.
+        """
+        matches = gazetteer.lookup(city, state, country)
+        if not matches:
+            for match in gazetteer.fuzzy(city, state, country)[:3]:
+                answer = input(
+                    f" {city} not found, did you mean {match.address}? "
+                    f"(y/n): ").strip().lower()
+                if answer.startswith("y"):
+                    matches = [match]
+                    break
+        if not matches:
+            return None
+        best = matches[0]
+        return str(best.lat), str(best.lng), best.address
+
 
 moon_phase = MoonPhase()
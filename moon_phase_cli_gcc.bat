@@ -4,6 +4,7 @@ python -m nuitka ^
     --onefile ^
     --mingw64 ^
     --lto=no ^
+    --include-data-files=assets/gazetteer.dat=assets/gazetteer.dat ^
     --windows-icon-from-ico=moon.ico ^
     -o moon_phase_cli.exe ^
     moon_phase_cli.py
@@ -3,21 +3,49 @@
     Author: William A Loring
     Created: 07-08-23
     Purpose: Python moon phase program using ephem library
+    Options:
+        --profile-startup  print time spent in imports, widget
+                           creation, first calculation and first paint
+        --tkcalendar       use the tkcalendar Calendar widget instead
+                           of the built in date picker
 """
+# Start the clock before the other imports for --profile-startup
+import time
+_start_time = time.perf_counter()
 
+import sys
 import tkinter as tk
 from tkinter import ttk
-# pip install tkcalendar
-from tkcalendar import Calendar
 from base64 import b64decode
 # from PIL import Image, ImageTk
 import moon_class
+from date_picker import DatePicker
+from month_phases import MonthPhaseCache
+from year_view import YearView
 from moon_icon import moon_16
 from moon_icon import moon_32
 
+_import_time = time.perf_counter() - _start_time
+
+# Calendar day background and text color for each moon phase index
+PHASE_COLORS = [
+    ("#2b2b2b", "white"),   # New
+    ("#4a4a5e", "white"),   # Waxing Crescent
+    ("#76768c", "white"),   # First Quarter
+    ("#b8b89a", "black"),   # Waxing Gibbous
+    ("#f3dc7a", "black"),   # Full Moon
+    ("#b8b89a", "black"),   # Waning Gibbous
+    ("#76768c", "white"),   # Last Quarter
+    ("#4a4a5e", "white"),   # Waning Crescent
+]
+
 
 class MoonPhase:
-    def __init__(self) -> None:
+    def __init__(self, profile: bool = False,
+                 use_tkcalendar: bool = False) -> None:
+        self._use_tkcalendar = use_tkcalendar
+        start = time.perf_counter()
+
         # Create the main window
         self.root = tk.Tk()
         self.root.title("Moon Phase")
@@ -27,7 +55,11 @@ class MoonPhase:
         large_icon = tk.PhotoImage(data=b64decode(moon_32))
         self.root.iconphoto(False, large_icon, small_icon)
 
+        # Phase of each day in the calendar, recent months are cached
+        self.phase_cache = MonthPhaseCache()
+
         self.create_widgets()
+        widgets_done = time.perf_counter()
 
         # Create moonclass object to access methods and properties
         # Default location is lat and lng of Scottsbluff, NE
@@ -38,6 +70,22 @@ class MoonPhase:
 
         # Display moon information based on current time when program starts
         self.display_moon_phase()
+        self.display_month_phases()
+        compute_done = time.perf_counter()
+
+        if profile:
+            # Draw the first frame now so it can be timed
+            self.root.update()
+            paint_done = time.perf_counter()
+            print(f"Imports:           {_import_time * 1000:7.1f} ms")
+            print(f"Widgets:           "
+                  f"{(widgets_done - start) * 1000:7.1f} ms")
+            print(f"First calculation: "
+                  f"{(compute_done - widgets_done) * 1000:7.1f} ms")
+            print(f"First paint:       "
+                  f"{(paint_done - compute_done) * 1000:7.1f} ms")
+            print(f"Time to first paint: "
+                  f"{(paint_done - _start_time) * 1000:7.1f} ms")
 
         # Run the main loop
         self.root.mainloop()
@@ -54,6 +102,21 @@ class MoonPhase:
         self.mc.get_observer(cal_time)
         self.display_moon_phase()
 
+# ------------------------- SHOW YEAR VIEW ------------------------------- #
+    def show_year_view(self, *args):
+        """Open the year window on the year selected in the calendar"""
+        YearView(
+            self.root,
+            self.cal.selection_get().year,
+            on_select=self.select_date
+        )
+
+    def select_date(self, date):
+        """Show date in the calendar and the moon details panel"""
+        self.cal.selection_set(date)
+        self.cal.see(date)
+        self.get_time()
+
 # ----------------------- DISPLAY MOON PHASE ----------------------------- #
     def display_moon_phase(self):
         """
@@ -121,6 +184,28 @@ class MoonPhase:
         except Exception as e:
             self.lbl_moon_phase.config(text=f"Error: {e}")
 
+# --------------------- DISPLAY MONTH PHASES ---------------------------- #
+    def display_month_phases(self, *args):
+        """
+        Color each day of the displayed month by its moon phase,
+        hovering a day shows the phase description. The months
+        before and after are computed in the background so paging
+        through the calendar does not wait on ephem.
+        """
+        month, year = self.cal.get_displayed_month()
+        bins = self.phase_cache.get(year, month)
+
+        # Only the displayed month carries phase events
+        self.cal.calevent_remove(tag="phase")
+        for day, phase_index in bins.items():
+            self.cal.calevent_create(
+                day,
+                moon_class.MoonClass.moon_phase_descriptions[phase_index],
+                tags=["phase", f"phase_{phase_index}"]
+            )
+
+        self.phase_cache.prefetch(year, month)
+
 # ----------------------- CREATE WIDGETS --------------------------------- #
     def create_widgets(self):
         """Create frames"""
@@ -134,18 +219,29 @@ class MoonPhase:
             text="Calculate Moon Phase",
             relief=tk.GROOVE)
 
-        self.cal = Calendar(
-            self._entry_frame,
-            selectmode="day",
-            date_pattern="yyyy/mm/dd",
-            firstweekday="sunday"
-        )
+        if self._use_tkcalendar:
+            # pip install tkcalendar
+            # Imported only when asked for, it is slow to import and build
+            from tkcalendar import Calendar
+            self.cal = Calendar(
+                self._entry_frame,
+                selectmode="day",
+                date_pattern="yyyy/mm/dd",
+                firstweekday="sunday"
+            )
+        else:
+            self.cal = DatePicker(self._entry_frame)
 
         self.btn_calculate = ttk.Button(
             self._main_frame, text="Calculate Moon Phase",
             command=self.get_time
         )
 
+        self.btn_year = ttk.Button(
+            self._main_frame, text="Year View",
+            command=self.show_year_view
+        )
+
         # Fill the frame to the width of the window
         self._entry_frame.pack(fill=tk.X)
         self._main_frame.pack(fill=tk.X)
@@ -169,6 +265,7 @@ class MoonPhase:
         self.lbl_image = ttk.Label(self._main_frame)
 
         self.btn_calculate.grid(row=0, column=0, sticky=tk.W)
+        self.btn_year.grid(row=0, column=1, sticky=tk.W)
         self.lbl_moon_phase.grid(row=1, column=0, sticky=tk.W)
         self.lbl_moon_illumination.grid(row=2, column=0, sticky=tk.W)
         self.lbl_km_to_moon.grid(row=3, column=0, sticky=tk.W)
@@ -185,12 +282,25 @@ class MoonPhase:
         for child in self._main_frame.winfo_children():
             child.grid_configure(padx=5, pady=3, ipadx=1, ipady=1)
 
-        # Iterate over each row in the calendar widget
-        for row in self.cal._calendar:
-            # Iterate over each label in the current row
-            for lbl in row:
-                # Bind the double-click event to the get_time method
-                lbl.bind("<Double-1>", self.get_time)
+        # Day colors for each moon phase, dark new moon to bright full
+        for phase_index, (background, foreground) in enumerate(PHASE_COLORS):
+            self.cal.tag_config(
+                f"phase_{phase_index}",
+                background=background,
+                foreground=foreground
+            )
+        self.cal.bind("<<CalendarMonthChanged>>", self.display_month_phases)
+
+        if self._use_tkcalendar:
+            # Iterate over each row in the calendar widget
+            for row in self.cal._calendar:
+                # Iterate over each label in the current row
+                for lbl in row:
+                    # Bind the double-click event to the get_time method
+                    lbl.bind("<Double-1>", self.get_time)
+        else:
+            # The date picker is one canvas, one binding covers every day
+            self.cal.bind("<Double-1>", self.get_time)
 
         # Either enter key will call the method
         self.root.bind("<Return>", self.get_time)
@@ -199,8 +309,12 @@ class MoonPhase:
 
 # ------------------------- QUIT PROGRAM --------------------------------- #
     def quit(self, *args):
+        self.phase_cache.close()
         self.root.destroy()
 
 
 # Create program object to start program
-moon_phase = MoonPhase()
+moon_phase = MoonPhase(
+    profile="--profile-startup" in sys.argv,
+    use_tkcalendar="--tkcalendar" in sys.argv
+)
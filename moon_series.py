@@ -0,0 +1,230 @@
+"""
+    Name: moon_series.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: Column store for many moon readings
+    A MoonSeries keeps each MoonReading field in its own array, about
+    41 bytes a row, where a MoonClass object or a moon_details dict
+    per date costs several hundred. Rows are in time order, so a
+    time range is found with bisect. Columns are handed out as
+    memoryviews, numpy.frombuffer can use them without a copy.
+"""
+import datetime
+import statistics
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from typing import Callable, Dict, Hashable, Iterable, Iterator, Union
+# pip install ephem
+import ephem
+from moon_stream import MoonReading, iter_moon
+
+# Column name -> array type code, the MoonReading fields in order
+COLUMNS = {
+    "date": "d",
+    "moon_phase": "d",
+    "illumination": "d",
+    "earth_to_moon": "d",
+    "moon_age": "d",
+    "phase_index": "b",
+}
+
+# Phase targets for count_phase, fraction of the lunation
+NEW_MOON, FIRST_QUARTER, FULL_MOON, LAST_QUARTER = 0.0, 0.25, 0.5, 0.75
+
+# Group by keys, from a row's datetime
+GROUP_KEYS: Dict[str, Callable[[datetime.datetime], Hashable]] = {
+    "year": lambda dt: dt.year,
+    "month": lambda dt: (dt.year, dt.month),
+    "day": lambda dt: dt.date(),
+}
+
+
+class MoonSeries:
+    """
+    Example Usage:
+        series = MoonSeries.compute(datetime.datetime(2024, 1, 1),
+                                    datetime.datetime(2025, 1, 1),
+                                    datetime.timedelta(hours=1))
+        march = series.between(datetime.datetime(2024, 3, 1),
+                               datetime.datetime(2024, 4, 1))
+        print(series.mean("illumination", by="month"))
+        print(series.count_phase(FULL_MOON, by="year"))
+    """
+
+    def __init__(self, columns: Dict[str, array] = None) -> None:
+        if columns is None:
+            columns = {name: array(code) for name, code in COLUMNS.items()}
+        self._columns = columns
+
+    @classmethod
+    def from_readings(cls, readings: Iterable[MoonReading]) -> "MoonSeries":
+        """Build from readings in time order, a generator is fine"""
+        series = cls()
+        for reading in readings:
+            series.append(reading)
+        return series
+
+    @classmethod
+    def compute(
+        cls,
+        start,
+        end,
+        step: Union[datetime.timedelta, float]
+    ) -> "MoonSeries":
+        """Readings from start up to end, one every step"""
+        if isinstance(step, datetime.timedelta):
+            step = step.total_seconds() / 86400
+        if step <= 0:
+            raise ValueError("step must be positive, rows are in time order")
+        # Readings go straight into the arrays, none are kept
+        return cls.from_readings(iter_moon(start, step, end))
+
+    def append(self, reading: MoonReading):
+        dates = self._columns["date"]
+        dte = float(ephem.Date(reading.date))
+        if dates and dte < dates[-1]:
+            raise ValueError("readings must be appended in time order")
+        dates.append(dte)
+        for name in tuple(COLUMNS)[1:]:
+            self._columns[name].append(getattr(reading, name))
+
+# ------------------------------ ROWS ------------------------------------ #
+    def __len__(self) -> int:
+        return len(self._columns["date"])
+
+    def __getitem__(self, index):
+        """A MoonReading for an int, a new MoonSeries for a slice"""
+        if isinstance(index, slice):
+            return MoonSeries({name: column[index]
+                               for name, column in self._columns.items()})
+        values = [column[index] for column in self._columns.values()]
+        values[0] = ephem.Date(values[0]).datetime()
+        return MoonReading(*values)
+
+    def __iter__(self) -> Iterator[MoonReading]:
+        for i in range(len(self)):
+            yield self[i]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.itemsize * len(column)
+                   for column in self._columns.values())
+
+# ------------------------------ COLUMNS --------------------------------- #
+    def column(self, name: str) -> memoryview:
+        """
+        Read only view of a column, no copy. Dates are ephem dates
+        (days since 12/31/1899 noon).
+        """
+        return memoryview(self._columns[name]).toreadonly()
+
+    def to_numpy(self) -> Dict[str, "numpy.ndarray"]:
+        """Columns as NumPy arrays sharing this series' memory"""
+        # pip install numpy, only needed here
+        import numpy
+        return {name: numpy.frombuffer(self.column(name), dtype=code)
+                for name, code in COLUMNS.items()}
+
+# ---------------------------- TIME SLICE -------------------------------- #
+    def between(self, start, end) -> "MoonSeries":
+        """Rows from start up to end"""
+        dates = self._columns["date"]
+        first = bisect_left(dates, float(ephem.Date(start)))
+        last = bisect_left(dates, float(ephem.Date(end)))
+        return self[first:last]
+
+    def resample(self, step: Union[datetime.timedelta, float]
+                 ) -> "MoonSeries":
+        """
+        Every step from the first row, keep the first row at or after
+        each step. Values are picked, not averaged, since averaging a
+        phase across a new moon would be meaningless.
+        """
+        if isinstance(step, datetime.timedelta):
+            step = step.total_seconds() / 86400
+        dates = self._columns["date"]
+        if not dates:
+            return MoonSeries()
+        rows = []
+        i = 0
+        dte = dates[0]
+        while True:
+            i = bisect_left(dates, dte, i)
+            if i == len(dates):
+                break
+            rows.append(i)
+            # Skip to the next step after the row actually kept
+            dte += step * (int((dates[i] - dte) // step) + 1)
+        return MoonSeries({
+            name: array(column.typecode, (column[i] for i in rows))
+            for name, column in self._columns.items()
+        })
+
+# ---------------------------- GROUP BY ---------------------------------- #
+    def _group_keys(self, by) -> list:
+        key = GROUP_KEYS[by] if isinstance(by, str) else by
+        return [key(ephem.Date(dte).datetime())
+                for dte in self._columns["date"]]
+
+    def aggregate(self, name: str, by, func: Callable = statistics.fmean
+                  ) -> Dict[Hashable, float]:
+        """
+        func of a column for each group.
+
+        Args:
+            name: column name
+            by: "year", "month", "day" or a function of a datetime
+            func: called with the list of values in a group
+        """
+        groups: Dict[Hashable, list] = {}
+        for key, value in zip(self._group_keys(by), self._columns[name]):
+            groups.setdefault(key, []).append(value)
+        return {key: func(values) for key, values in groups.items()}
+
+    def mean(self, name: str, by) -> Dict[Hashable, float]:
+        return self.aggregate(name, by)
+
+    def count_phase(self, phase: float, by) -> Dict[Hashable, int]:
+        """
+        How many times the moon reached phase, e.g. FULL_MOON, in each
+        group. Counted on the row where the phase was first passed.
+        """
+        counts: Dict[Hashable, int] = {}
+        phases = self._columns["moon_phase"]
+        keys = self._group_keys(by)
+        for i in range(1, len(phases)):
+            moved = (phases[i] - phases[i - 1]) % 1
+            to_target = (phase - phases[i - 1]) % 1
+            if 0 < to_target <= moved:
+                counts[keys[i]] = counts.get(keys[i], 0) + 1
+        return counts
+
+
+# ------------------------------ MAIN ------------------------------------ #
+def main():
+    """A year of hourly readings, memory use and some aggregates"""
+    year = datetime.date.today().year
+    t = time.perf_counter()
+    series = MoonSeries.compute(datetime.datetime(year, 1, 1),
+                                datetime.datetime(year + 1, 1, 1),
+                                datetime.timedelta(hours=1))
+    print(f"{len(series)} hourly readings in "
+          f"{time.perf_counter() - t:.2f} s, "
+          f"{series.nbytes / len(series):.0f} bytes a row "
+          f"(a MoonReading is {sys.getsizeof(series[0])} bytes "
+          f"before its values)")
+
+    print("\nMean illumination by month")
+    for (y, month), mean in series.mean("illumination", "month").items():
+        print(f"    {y}-{month:02}  {mean:5.1f}%")
+
+    full_moons = series.count_phase(FULL_MOON, "year")
+    print(f"\nFull moons in {year}: {full_moons.get(year, 0)}")
+    daily = series.resample(1)
+    print(f"Resampled to daily: {len(daily)} rows")
+
+
+if __name__ == "__main__":
+    main()
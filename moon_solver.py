@@ -0,0 +1,319 @@
+"""
+    Name: moon_solver.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: When does the moon reach a phase or an illumination
+    The inverse of MoonClass: given a target moon_phase or
+    illumination, find the instants the moon reaches it, the next
+    one, the previous one or all of them in a range.
+
+    A LunationTable indexes the new moons of the range. moon_phase is
+    linear between two new moons, so a phase target is exact from the
+    bounds. Illumination rises from its least near each new moon to
+    its greatest near the full moon and falls again. Those extremes
+    are found first (Brent's method, they can be hours away from the
+    new and full moon), then each rising and falling stretch holds at
+    most one crossing of any target, found by bracketed root finding.
+    Many targets share the table and the extremes, and each crossing
+    found narrows the brackets of the targets after it.
+
+    Usage:
+        python moon_solver.py --illumination 25
+        python moon_solver.py --phase 0.3 --previous
+        python moon_solver.py --illumination 25 50 75 --range 2024 2024
+        python moon_solver.py --benchmark
+"""
+import argparse
+import datetime
+import time
+from bisect import bisect_left
+from typing import Callable, List, NamedTuple, Optional, Tuple
+# pip install ephem
+import ephem
+from apsides import brent_minimum
+from lunation_tables import LunationTable
+
+# Crossings are found to this, in days
+TOLERANCE = ephem.second
+# Days either side of a new or full moon to look for the least or
+# greatest illumination
+EXTREME_WINDOW = 1.0
+# next and previous look this many days ahead first, then twice as
+# far, up to SEARCH_LIMIT. Some targets near 0 or 100 percent are
+# not reached every month.
+SEARCH_WINDOW = 32.0
+SEARCH_LIMIT = 800.0
+
+
+class Solution(NamedTuple):
+    # UTC
+    date: datetime.datetime
+    # "phase" or "illumination"
+    value: str
+    target: float
+    # True between new moon and full moon
+    waxing: bool
+
+
+def _root(f: Callable[[float], float], a: float, fa: float, b: float,
+          fb: float, tolerance: float = TOLERANCE) -> float:
+    """
+    Zero of f between a and b, fa and fb of opposite signs. Regula
+    falsi with the Illinois change: when the same end is kept twice,
+    its value is halved so the other end moves too.
+    """
+    side = 0
+    c = a
+    while True:
+        previous = c
+        c = (a * fb - b * fa) / (fb - fa)
+        if abs(c - previous) < tolerance or abs(b - a) < tolerance:
+            return c
+        fc = f(c)
+        if fc == 0:
+            return c
+        if (fc > 0) == (fb > 0):
+            b, fb = c, fc
+            if side == -1:
+                fa /= 2
+            side = -1
+        else:
+            a, fa = c, fc
+            if side == 1:
+                fb /= 2
+            side = 1
+
+
+# ---------------------------- MOON SOLVER ------------------------------- #
+class MoonSolver:
+    """
+    Example Usage:
+        solver = MoonSolver("2024/1/1", "2025/1/1")
+        for solution in solver.illumination(25, 50, 75):
+            print(solution.date, solution.target, solution.waxing)
+        print(solver.phase(0.3))
+    """
+
+    def __init__(self, start, end) -> None:
+        self._start = float(ephem.Date(start))
+        self._end = float(ephem.Date(end))
+        # A lunation either side, for the stretches that cross start
+        # and end
+        self._table = LunationTable.build(self._start - 30,
+                                          self._end + 30)
+        # (time, illumination) of the least and greatest illumination,
+        # alternating, found on first use
+        self._extremes: List[Tuple[float, float]] = None
+        # Same illumination as MoonClass, ephem's default observer
+        self._observer = ephem.Observer()
+        self._moon = ephem.Moon()
+        # Illumination computations, for benchmarks
+        self.computations = 0
+
+    def _illumination(self, dte: float) -> float:
+        self.computations += 1
+        self._observer.date = dte
+        self._moon.compute(self._observer)
+        return self._moon.phase
+
+# ------------------------------ PHASE ----------------------------------- #
+    def phase(self, *targets: float) -> List[Solution]:
+        """
+        Every instant moon_phase equals a target (0 to 1), in time
+        order. Exact from the new moons, no searching.
+        """
+        times = self._table.times
+        solutions = []
+        for target in targets:
+            if not 0 <= target < 1:
+                raise ValueError("phase targets must be from 0 up to 1")
+            for i in range(0, len(times) - 4, 4):
+                dte = times[i] + target * (times[i + 4] - times[i])
+                if self._start <= dte < self._end:
+                    solutions.append((dte, target))
+        solutions.sort()
+        return [Solution(ephem.Date(dte).datetime(), "phase", target,
+                         target < 0.5) for dte, target in solutions]
+
+# --------------------------- ILLUMINATION ------------------------------- #
+    def _extreme(self, dte: float, sign: int) -> Tuple[float, float]:
+        """Least (sign 1) or greatest (sign -1) illumination near dte"""
+        def f(t):
+            return sign * self._illumination(t)
+        low, high = dte - EXTREME_WINDOW, dte + EXTREME_WINDOW
+        points = [(low, f(low)), (dte, f(dte)), (high, f(high))]
+        if not points[1][1] < min(points[0][1], points[2][1]):
+            # Not bracketed, an extreme this far from the new or full
+            # moon has not been seen. Use the event itself.
+            return dte, sign * points[1][1]
+        best, value = brent_minimum(f, *points, tolerance=TOLERANCE)
+        return best, sign * value
+
+    def _stretches(self) -> List[Tuple[float, float]]:
+        if self._extremes is None:
+            times = self._table.times
+            extremes = []
+            # New moon, then full moon, every lunation, and the last
+            # new moon
+            for i in range(0, len(times), 2):
+                sign = 1 if i % 4 == 0 else -1
+                extremes.append(self._extreme(times[i], sign))
+            self._extremes = extremes
+        return self._extremes
+
+    def illumination(self, *targets: float) -> List[Solution]:
+        """Every instant the illumination crosses a target (percent)"""
+        targets = sorted(targets)
+        solutions = []
+        extremes = self._stretches()
+        for (t0, f0), (t1, f1) in zip(extremes, extremes[1:]):
+            if t1 < self._start or t0 >= self._end:
+                continue
+            rising = f1 > f0
+            low, high = (f0, f1) if rising else (f1, f0)
+            # Targets this stretch passes through, in the order the
+            # moon reaches them
+            inside = targets[bisect_left(targets, low):
+                             bisect_left(targets, high)]
+            if not rising:
+                inside.reverse()
+            a = t0
+            for target in inside:
+                def f(t):
+                    return self._illumination(t) - target
+                fa = f(a)
+                if fa == 0:
+                    dte = a
+                else:
+                    dte = _root(f, a, fa, t1, f1 - target)
+                if self._start <= dte < self._end:
+                    solutions.append(Solution(
+                        ephem.Date(dte).datetime(), "illumination",
+                        target, rising))
+                # Monotonic stretch, the next target is further along
+                a = dte
+        solutions.sort()
+        return solutions
+
+
+# ------------------------- NEXT AND PREVIOUS ---------------------------- #
+def _search(solve: Callable[[MoonSolver], List[Solution]], dte,
+            forward: bool) -> Optional[Solution]:
+    dte = float(ephem.Date(ephem.now() if dte is None else dte))
+    when = ephem.Date(dte).datetime()
+    window = SEARCH_WINDOW
+    while window <= SEARCH_LIMIT:
+        if forward:
+            solutions = [s for s in solve(MoonSolver(dte, dte + window))
+                         if s.date > when]
+        else:
+            solutions = [s for s in solve(MoonSolver(dte - window, dte))
+                         if s.date < when]
+        if solutions:
+            return solutions[0] if forward else solutions[-1]
+        window *= 2
+    return None
+
+
+def next_phase(target: float, after=None) -> Optional[Solution]:
+    """First instant after after (default now) moon_phase is target"""
+    return _search(lambda solver: solver.phase(target), after, True)
+
+
+def previous_phase(target: float, before=None) -> Optional[Solution]:
+    return _search(lambda solver: solver.phase(target), before, False)
+
+
+def next_illumination(target: float, after=None) -> Optional[Solution]:
+    """
+    First crossing of target percent after after (default now), None
+    if it is not reached for years, e.g. 100
+    """
+    return _search(lambda solver: solver.illumination(target), after,
+                   True)
+
+
+def previous_illumination(target: float, before=None
+                          ) -> Optional[Solution]:
+    return _search(lambda solver: solver.illumination(target), before,
+                   False)
+
+
+# ---------------------------- BENCHMARK --------------------------------- #
+def benchmark():
+    """Every whole percent for a year, together and one at a time"""
+    year = datetime.date.today().year
+    start = datetime.datetime(year, 1, 1)
+    end = datetime.datetime(year + 1, 1, 1)
+    targets = range(1, 100)
+
+    t = time.perf_counter()
+    solver = MoonSolver(start, end)
+    together = solver.illumination(*targets)
+    bulk = time.perf_counter() - t
+    per_crossing = solver.computations / len(together)
+
+    t = time.perf_counter()
+    apart = []
+    for target in targets[::10]:
+        apart.extend(MoonSolver(start, end).illumination(target))
+    single = (time.perf_counter() - t) / len(targets[::10])
+
+    print(f"{year}: {len(together)} crossings of {len(targets)} targets")
+    print(f"    together     {bulk:6.2f} s, "
+          f"{per_crossing:.1f} illuminations a crossing")
+    print(f"    one at a time {single * len(targets):5.2f} s "
+          f"(from {len(targets[::10])} targets)")
+    phases = MoonSolver(start, end).phase(*(i / 100 for i in range(100)))
+    print(f"    {len(phases)} phase instants for 100 targets")
+
+
+# ------------------------------ MAIN ------------------------------------ #
+def main():
+    parser = argparse.ArgumentParser(
+        description="When the moon reaches a phase or an illumination")
+    parser.add_argument("--illumination", type=float, nargs="+",
+                        default=[], metavar="PERCENT")
+    parser.add_argument("--phase", type=float, nargs="+", default=[],
+                        metavar="FRACTION",
+                        help="moon_phase, 0 new, 0.5 full")
+    parser.add_argument("--previous", action="store_true",
+                        help="the last time before now instead of the next")
+    parser.add_argument("--range", type=int, nargs=2,
+                        metavar=("FIRST", "LAST"),
+                        help="every time in these years")
+    parser.add_argument("--benchmark", action="store_true")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark()
+        return
+    if not args.illumination and not args.phase:
+        parser.error("give --illumination or --phase targets")
+
+    if args.range:
+        solver = MoonSolver(datetime.datetime(args.range[0], 1, 1),
+                            datetime.datetime(args.range[1] + 1, 1, 1))
+        solutions = sorted(solver.illumination(*args.illumination) +
+                           solver.phase(*args.phase))
+    else:
+        if args.previous:
+            find_phase, find_illumination = previous_phase, \
+                previous_illumination
+        else:
+            find_phase, find_illumination = next_phase, next_illumination
+        solutions = [find_illumination(target)
+                     for target in args.illumination]
+        solutions += [find_phase(target) for target in args.phase]
+
+    for solution in solutions:
+        if solution is None:
+            print("Not reached")
+            continue
+        trend = "waxing" if solution.waxing else "waning"
+        print(f"{solution.date:%Y-%m-%d %H:%M:%S} UTC  {solution.value} "
+              f"{solution.target:g}  {trend}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+"""
+    Name: moon_stream.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: Stream moon readings lazily over an unbounded time range
+    LunationTracker keeps the lunation bounds (previous and next new
+    moon) from step to step and only searches again when time leaves
+    the lunation, so a long replay costs one moon position per step.
+"""
+# pip install ephem
+import ephem
+import datetime
+import sys
+import time
+from itertools import islice
+from typing import Iterator, List, NamedTuple, Union
+from moon_class import MoonClass
+
+
+class MoonReading(NamedTuple):
+    """One moon reading, the same values MoonClass reports"""
+    date: datetime.datetime
+    # Fraction of the lunation, 0 new, 0.5 full, 1 new again
+    moon_phase: float
+    # Surface illumination in percent
+    illumination: float
+    # Distance from earth to the moon in AU
+    earth_to_moon: float
+    # Days since the last new moon
+    moon_age: float
+    # Index into MoonClass.moon_phase_descriptions
+    phase_index: int
+
+    @property
+    def phase_description(self) -> str:
+        return MoonClass.moon_phase_descriptions[self.phase_index]
+
+    @property
+    def km_to_moon(self) -> float:
+        return 149597870.7 * self.earth_to_moon
+
+    @property
+    def miles_to_moon(self) -> float:
+        return self.earth_to_moon * 92955807.273
+
+
+# ------------------------- GET PHASE INDEX ------------------------------ #
+def get_phase_index(moon_phase: float) -> int:
+    """
+    Convert moon phase (0 - 1) to an index into the phase descriptions.
+    Each of the 8 named phases is 0.125 wide and centered on its
+    nominal value, the same bins MoonClass uses.
+    """
+    return int((moon_phase + 0.0625) / 0.125) % 8
+
+
+# ------------------------- GET READING ---------------------------------- #
+def get_reading(dte, lat: str = None, lng: str = None) -> MoonReading:
+    """
+    Calculate a single moon reading for an instant.
+
+    Args:
+        dte: datetime, ephem.Date or anything ephem.Date accepts
+        lat, lng (optional): observer location. Like MoonClass,
+            the observer is left at ephem's default when not provided.
+    """
+    dte = ephem.Date(dte)
+    observer = ephem.Observer()
+    if lat is not None and lng is not None:
+        observer.lat = str(lat)
+        observer.lon = str(lng)
+    previous_new_moon = ephem.previous_new_moon(dte)
+    next_new_moon = ephem.next_new_moon(dte)
+    return make_reading(
+        ephem.Moon(), observer, dte, previous_new_moon, next_new_moon
+    )
+
+
+def make_reading(moon, observer, dte, previous_new_moon, next_new_moon):
+    """Compute the moon at dte inside a known lunation"""
+    observer.date = dte
+    moon.compute(observer)
+
+    # Fractional position of dte between the two new moons
+    lunation = (dte - previous_new_moon) / (next_new_moon - previous_new_moon)
+    moon_phase = lunation % 1
+
+    return MoonReading(
+        ephem.Date(dte).datetime(),
+        moon_phase,
+        moon.phase,
+        moon.earth_distance,
+        dte - previous_new_moon,
+        get_phase_index(moon_phase)
+    )
+
+
+# ------------------------- LUNATION TRACKER ----------------------------- #
+class LunationTracker:
+    """
+    Keep the current lunation while time steps forward or backward.
+
+    The previous and next new moon are only searched for again when
+    time crosses one of them. Stepping into the neighbouring lunation
+    reuses the shared new moon, so a crossing costs one search. Within
+    a lunation, a reading is a single moon position.
+
+    Example Usage:
+        tracker = LunationTracker()
+        for hour in range(24 * 365):
+            reading = tracker.reading(start + hour / 24)
+    """
+
+    def __init__(self, lat: str = None, lng: str = None,
+                 table=None) -> None:
+        """
+        Args:
+            lat, lng (optional): observer location
+            table (optional): lunation_tables.LunationTable, lunations
+                it covers are looked up instead of searched for
+        """
+        self._table = table
+        self._moon = ephem.Moon()
+        self._observer = ephem.Observer()
+        if lat is not None and lng is not None:
+            self._observer.lat = str(lat)
+            self._observer.lon = str(lng)
+        # Empty lunation, the first update searches for the bounds
+        self._previous_new_moon = 0.0
+        self._next_new_moon = 0.0
+        self._events = None
+        # Number of new moon searches, for benchmarks
+        self.searches = 0
+
+    @property
+    def previous_new_moon(self) -> ephem.Date:
+        return ephem.Date(self._previous_new_moon)
+
+    @property
+    def next_new_moon(self) -> ephem.Date:
+        return ephem.Date(self._next_new_moon)
+
+    @property
+    def events(self) -> dict:
+        """
+        Principal phase times of the current lunation. Only searched
+        for when asked, then kept until the lunation changes.
+        """
+        if self._events is None:
+            new_moon = self._previous_new_moon
+            first_quarter = ephem.next_first_quarter_moon(new_moon)
+            full = ephem.next_full_moon(first_quarter)
+            last_quarter = ephem.next_last_quarter_moon(full)
+            self._events = {
+                "new": ephem.Date(new_moon),
+                "first_quarter": first_quarter,
+                "full": full,
+                "last_quarter": last_quarter,
+                "next_new": ephem.Date(self._next_new_moon),
+            }
+        return self._events
+
+# ----------------------------- UPDATE ----------------------------------- #
+    def update(self, dte) -> bool:
+        """
+        Move the tracker to dte. Returns True if the lunation changed.
+        """
+        dte = float(dte)
+        if self._previous_new_moon <= dte < self._next_new_moon:
+            return False
+
+        if self._table is not None and self._table.covers(dte):
+            previous_new_moon, next_new_moon = self._table.bounds(dte)
+        elif self._previous_new_moon == self._next_new_moon:
+            # First update, there is no lunation to reuse. The empty
+            # lunation sits at ephem's epoch, 12/31/1899.
+            previous_new_moon = float(ephem.previous_new_moon(dte))
+            next_new_moon = float(ephem.next_new_moon(dte))
+            self.searches += 2
+        elif self._next_new_moon <= dte:
+            # Forward, the old next new moon may be the new previous one
+            next_new_moon = float(ephem.next_new_moon(dte))
+            self.searches += 1
+            if next_new_moon - self._next_new_moon < 31:
+                previous_new_moon = self._next_new_moon
+            else:
+                previous_new_moon = float(ephem.previous_new_moon(dte))
+                self.searches += 1
+        else:
+            # Backward, the old previous new moon may be the next one
+            previous_new_moon = float(ephem.previous_new_moon(dte))
+            self.searches += 1
+            if self._previous_new_moon - previous_new_moon < 31:
+                next_new_moon = self._previous_new_moon
+            else:
+                next_new_moon = float(ephem.next_new_moon(dte))
+                self.searches += 1
+
+        self._previous_new_moon = previous_new_moon
+        self._next_new_moon = next_new_moon
+        self._events = None
+        return True
+
+# ------------------------------ PHASE ----------------------------------- #
+    def phase(self, dte) -> float:
+        """
+        Fraction of the lunation at dte, same as MoonClass.moon_phase.
+        Cheaper than reading(), the moon position is not needed.
+        """
+        dte = float(ephem.Date(dte))
+        self.update(dte)
+        return ((dte - self._previous_new_moon) /
+                (self._next_new_moon - self._previous_new_moon)) % 1
+
+# ----------------------------- READING ---------------------------------- #
+    def reading(self, dte) -> MoonReading:
+        """Moon reading at dte, datetime or ephem.Date"""
+        dte = float(ephem.Date(dte))
+        self.update(dte)
+        return make_reading(
+            self._moon, self._observer, dte,
+            self._previous_new_moon, self._next_new_moon
+        )
+
+
+# --------------------------- ITER MOON ---------------------------------- #
+def iter_moon(
+    start,
+    step: Union[datetime.timedelta, float],
+    end=None
+) -> Iterator[MoonReading]:
+    """
+    Lazily yield moon readings from start, one every step.
+
+    Args:
+        start: first instant, datetime or ephem.Date
+        step: timedelta, or a number of days. May be negative
+            to walk backwards in time.
+        end (optional): stop before this instant. If not provided,
+            the generator never ends, use itertools.islice or
+            takewhile to bound it.
+
+    Example Usage:
+        from itertools import islice
+        for reading in islice(iter_moon(datetime.datetime.now(),
+                                        datetime.timedelta(hours=1)), 24):
+            print(reading.date, reading.phase_description)
+    """
+    if isinstance(step, datetime.timedelta):
+        step = step.total_seconds() / 86400
+    if step == 0:
+        raise ValueError("step must not be zero")
+
+    dte = float(ephem.Date(start))
+    stop = None if end is None else float(ephem.Date(end))
+
+    # The tracker only searches for new moons when a lunation ends
+    tracker = LunationTracker()
+    i = 0
+    while True:
+        # Multiply rather than accumulate so long runs do not drift
+        current = dte + i * step
+        if stop is not None and (
+            current >= stop if step > 0 else current <= stop
+        ):
+            return
+        yield tracker.reading(current)
+        i += 1
+
+
+# ------------------------ ITER MOON CHUNKS ------------------------------ #
+def iter_moon_chunks(
+    start,
+    step: Union[datetime.timedelta, float],
+    size: int,
+    end=None
+) -> Iterator[List[MoonReading]]:
+    """
+    Yield lists of at most size readings. Each chunk is only
+    computed when the consumer asks for it, so a slow consumer
+    never has more than one chunk in memory.
+    """
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    readings = iter_moon(start, step, end)
+    while True:
+        chunk = list(islice(readings, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# ---------------------------- BENCHMARK --------------------------------- #
+def benchmark(steps: int = 24 * 60):
+    """Hourly steps with MoonClass.get_observer and LunationTracker"""
+    start = ephem.Date(datetime.datetime(2024, 1, 1))
+    dates = [ephem.Date(start + i * ephem.hour) for i in range(steps)]
+
+    mc = MoonClass(False)
+    t = time.perf_counter()
+    for dte in dates:
+        mc.get_observer(dte.datetime())
+        # Values are only calculated when read
+        mc.moon_phase, mc.illumination
+    observer_time = time.perf_counter() - t
+
+    tracker = LunationTracker()
+    t = time.perf_counter()
+    for dte in dates:
+        tracker.reading(dte)
+    tracker_time = time.perf_counter() - t
+
+    # Stepping backwards over the same range
+    backward = LunationTracker()
+    t = time.perf_counter()
+    for dte in reversed(dates):
+        backward.reading(dte)
+    backward_time = time.perf_counter() - t
+
+    print(f"{steps} hourly steps")
+    print(f"get_observer      {observer_time / steps * 1e6:9.1f} us/step")
+    print(f"tracker forward   {tracker_time / steps * 1e6:9.1f} us/step "
+          f"({tracker.searches} new moon searches)")
+    print(f"tracker backward  {backward_time / steps * 1e6:9.1f} us/step "
+          f"({backward.searches} new moon searches)")
+
+
+# ------------------------------ MAIN ------------------------------------ #
+def main(days: int = 30):
+    """Print one reading a day for the next days"""
+    start = datetime.datetime.now()
+    for reading in iter_moon(start, datetime.timedelta(days=1),
+                             start + datetime.timedelta(days=days)):
+        print(
+            f"{reading.date:%Y-%m-%d} {reading.illumination:6.2f}% "
+            f"{reading.phase_description}"
+        )
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark()
+    else:
+        main()
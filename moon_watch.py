@@ -0,0 +1,359 @@
+"""
+    Name: moon_watch.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: Notify when the moon changes phase, without polling
+    Each subscription works out the time of its next event in advance:
+    the moon entering a new named phase bin, a principal phase (new,
+    first quarter, full, last quarter) or the illumination crossing a
+    threshold. The watcher keeps the next event of every subscription
+    in a heap and sleeps until the earliest one, so it uses no CPU
+    between events.
+
+    Phase bin changes come straight from the lunation bounds, the
+    same bins and moon_phase MoonClass uses. Principal phases are
+    ephem's own search results. Illumination crossings come from
+    moon_solver.py: the least and greatest illumination of each month
+    are found first, so crossings close to them are not missed, then
+    each crossing to a second.
+
+    Events are JSON lines on stdout, or POSTed to a webhook:
+        {"time": "2026-10-25T22:47:31Z", "event": "phase",
+         "name": "First Quarter (increasing to full)", "value": 2}
+
+    Usage:
+        python moon_watch.py --phase --principal --illumination 50
+        python moon_watch.py --principal --webhook http://127.0.0.1:8000/
+        python moon_watch.py --phase --list 30
+        python moon_watch.py --benchmark
+"""
+import argparse
+import datetime
+import heapq
+import itertools
+import json
+import sys
+import threading
+import time
+import urllib.request
+from typing import Callable, Iterator, List, NamedTuple, Optional
+# pip install ephem
+import ephem
+import moon_solver
+from lunation_tables import EVENT_NAMES
+from moon_class import MoonClass
+from moon_stream import LunationTracker
+
+# ephem date of the Unix epoch, to turn time.time() into ephem dates
+UNIX_EPOCH = float(ephem.Date("1970/1/1"))
+
+# Longest single sleep in seconds. Waking once an hour costs nothing
+# and catches the wall clock jumping (suspend, clock changes).
+MAX_SLEEP = 3600
+
+# Keys into LunationTracker.events, in the order of EVENT_NAMES
+_EVENT_KEYS = ("new", "first_quarter", "full", "last_quarter")
+
+
+class Event(NamedTuple):
+    # ephem date
+    date: float
+    # "phase", "principal" or "illumination"
+    event: str
+    name: str
+    # Phase index, principal phase kind or illumination threshold
+    value: float
+
+    def to_json(self) -> str:
+        when = ephem.Date(self.date).datetime()
+        return json.dumps({
+            "time": f"{when:%Y-%m-%dT%H:%M:%S}Z",
+            "event": self.event,
+            "name": self.name,
+            "value": self.value,
+        })
+
+
+def now() -> float:
+    """Current time as an ephem date"""
+    return UNIX_EPOCH + time.time() / 86400
+
+
+# -------------------------- SUBSCRIPTIONS ------------------------------- #
+# A subscription has next_event(after), the first event strictly after
+# the ephem date after. One that can go a while without events also
+# has horizon, in days: next_event returns None when there is no event
+# within horizon, and the watch asks again from after + horizon.
+class PhaseBinWatch:
+    """The moon entering each of the 8 named phases"""
+
+    def __init__(self) -> None:
+        self._tracker = LunationTracker()
+
+    def next_event(self, after: float) -> Event:
+        tracker = self._tracker
+        tracker.update(after)
+        while True:
+            previous = float(tracker.previous_new_moon)
+            length = float(tracker.next_new_moon) - previous
+            # Bin k ends 1/16 of a lunation past its named phase
+            for k in range(8):
+                boundary = previous + (k / 8 + 1 / 16) * length
+                if boundary > after:
+                    index = (k + 1) % 8
+                    return Event(boundary, "phase",
+                                 MoonClass.moon_phase_descriptions[index],
+                                 index)
+            tracker.update(tracker.next_new_moon)
+
+
+class PrincipalPhaseWatch:
+    """New moon, first quarter, full moon and last quarter"""
+
+    def __init__(self) -> None:
+        self._tracker = LunationTracker()
+
+    def next_event(self, after: float) -> Event:
+        tracker = self._tracker
+        tracker.update(after)
+        while True:
+            events = tracker.events
+            for kind, key in enumerate(_EVENT_KEYS):
+                if float(events[key]) > after:
+                    return Event(float(events[key]), "principal",
+                                 EVENT_NAMES[kind], kind)
+            tracker.update(tracker.next_new_moon)
+
+
+class IlluminationWatch:
+    """Illumination rising above or falling below a threshold"""
+
+    def __init__(self, threshold: float, horizon: float = 60) -> None:
+        """
+        Args:
+            threshold: percent, 0 to 100
+            horizon: days solved for at a time. Some thresholds near 0
+                or 100 are not reached for months.
+        """
+        if not 0 < threshold < 100:
+            raise ValueError("threshold must be between 0 and 100")
+        self._threshold = threshold
+        self.horizon = horizon
+        # Crossings (ephem date, rising) from _start up to _end
+        self._start = self._end = 0.0
+        self._crossings = []
+
+    def _solve(self, after: float):
+        self._start, self._end = after, after + self.horizon
+        solver = moon_solver.MoonSolver(self._start, self._end)
+        solutions = solver.illumination(self._threshold)
+        self._crossings = [(float(ephem.Date(solution.date)),
+                            solution.waxing) for solution in solutions]
+
+    def _first_after(self, after: float) -> Optional[Event]:
+        for dte, rising in self._crossings:
+            # Solved again from a new start, the crossing after was set
+            # to can come back a little later, within the tolerance
+            if dte > after + moon_solver.TOLERANCE:
+                direction = "above" if rising else "below"
+                return Event(dte, "illumination",
+                             f"Illumination {direction} "
+                             f"{self._threshold:g}%", self._threshold)
+        return None
+
+    def next_event(self, after: float) -> Optional[Event]:
+        if not self._start <= after < self._end:
+            self._solve(after)
+        event = self._first_after(after)
+        if event is None and self._start < after:
+            # Only the end of the solved span was left, look a whole
+            # horizon ahead
+            self._solve(after)
+            event = self._first_after(after)
+        return event
+
+
+# ---------------------------- NOTIFIERS --------------------------------- #
+def print_json(event: Event):
+    print(event.to_json(), flush=True)
+
+
+class Webhook:
+    """POST each event as JSON to url, usually a local endpoint"""
+
+    def __init__(self, url: str, timeout: float = 5.0) -> None:
+        self._url = url
+        self._timeout = timeout
+
+    def __call__(self, event: Event):
+        request = urllib.request.Request(
+            self._url, data=event.to_json().encode(), method="POST",
+            headers={"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(request, timeout=self._timeout):
+                pass
+        except OSError as e:
+            # A receiver that is down should not stop the watch
+            print(f"moon_watch: webhook failed: {e}", file=sys.stderr)
+
+
+# ----------------------------- MOON WATCH ------------------------------- #
+class MoonWatch:
+    """
+    Example Usage:
+        watch = MoonWatch(notify=print_json)
+        watch.add(PhaseBinWatch())
+        watch.add(IlluminationWatch(50))
+        watch.run()
+    """
+
+    def __init__(self, notify: Callable[[Event], None] = print_json
+                 ) -> None:
+        self._notify = notify
+        # (event date, tie breaker, subscription, event), earliest first
+        self._heap = []
+        self._order = itertools.count()
+        self._stop = threading.Event()
+
+    def add(self, subscription, after=None):
+        """Watch subscription from after (default now) on"""
+        self._schedule(subscription,
+                       now() if after is None else float(ephem.Date(after)))
+
+    def _schedule(self, subscription, after: float):
+        event = subscription.next_event(after)
+        if event is not None:
+            dte = event.date
+        elif getattr(subscription, "horizon", None):
+            # Nothing for now, look again at the end of the horizon
+            dte = after + subscription.horizon
+        else:
+            return
+        heapq.heappush(self._heap, (dte, next(self._order), subscription,
+                                    event))
+
+    def _pop(self) -> Optional[Event]:
+        """
+        Take the earliest entry and schedule its subscription's next.
+        None for a subscription that had nothing within its horizon.
+        """
+        dte, _, subscription, event = heapq.heappop(self._heap)
+        self._schedule(subscription, dte)
+        return event
+
+# ------------------------------- RUN ------------------------------------ #
+    def run(self):
+        """Notify each event at its time, until stop() or none are left"""
+        self._stop.clear()
+        while self._heap and not self._stop.is_set():
+            wait = (self._heap[0][0] - now()) * 86400
+            if wait > 0:
+                self._stop.wait(min(wait, MAX_SLEEP))
+            else:
+                event = self._pop()
+                if event is not None:
+                    self._notify(event)
+
+    def stop(self):
+        """End run(), safe to call from another thread"""
+        self._stop.set()
+
+    def events(self, end) -> Iterator[Event]:
+        """The events up to end, without waiting for them"""
+        end = float(ephem.Date(end))
+        while self._heap and self._heap[0][0] <= end:
+            event = self._pop()
+            if event is not None:
+                yield event
+
+
+# ---------------------------- BENCHMARK --------------------------------- #
+def benchmark(idle: float = 2.0):
+    """CPU for a year of events against polling every minute"""
+    start = now()
+    watch = MoonWatch()
+    for subscription in (PhaseBinWatch(), PrincipalPhaseWatch(),
+                         IlluminationWatch(50)):
+        watch.add(subscription, start)
+    cpu = time.process_time()
+    count = sum(1 for _ in watch.events(start + 365.25))
+    scheduled = time.process_time() - cpu
+
+    # Polling: MoonClass.get_observer once a minute, for one day
+    mc = MoonClass(gui_mode=False)
+    moment = ephem.Date(start).datetime()
+    cpu = time.process_time()
+    for minute in range(1440):
+        mc.get_observer(moment + datetime.timedelta(minutes=minute))
+        mc.phase_index, mc.illumination
+    polled = (time.process_time() - cpu) * 365.25
+
+    # A watch with nothing due for days, sleeping
+    watch = MoonWatch(notify=lambda event: None)
+    watch.add(PrincipalPhaseWatch())
+    thread = threading.Thread(target=watch.run)
+    cpu = time.process_time()
+    thread.start()
+    time.sleep(idle)
+    watch.stop()
+    thread.join()
+    sleeping = time.process_time() - cpu
+
+    print(f"One year, {count} events (phase bins, principal phases, "
+          f"50% illumination)")
+    print(f"    scheduled          {scheduled:8.3f} s CPU")
+    print(f"    polling per minute {polled:8.1f} s CPU (one day "
+          f"measured)")
+    print(f"Idle watch, {idle:g} s: {sleeping * 1000:.1f} ms CPU")
+
+
+# ------------------------------ MAIN ------------------------------------ #
+def main():
+    parser = argparse.ArgumentParser(
+        description="Notify when the moon changes phase")
+    parser.add_argument("--phase", action="store_true",
+                        help="entering each of the 8 named phases")
+    parser.add_argument("--principal", action="store_true",
+                        help="new, first quarter, full and last quarter")
+    parser.add_argument("--illumination", type=float, action="append",
+                        default=[], metavar="PERCENT",
+                        help="illumination crossing PERCENT, can repeat")
+    parser.add_argument("--webhook", metavar="URL",
+                        help="POST events to URL instead of stdout")
+    parser.add_argument("--list", type=float, metavar="DAYS",
+                        help="print the events of the next DAYS and exit")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="CPU use against polling every minute")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark()
+        return
+
+    subscriptions: List = [IlluminationWatch(threshold)
+                           for threshold in args.illumination]
+    if args.phase:
+        subscriptions.append(PhaseBinWatch())
+    if args.principal:
+        subscriptions.append(PrincipalPhaseWatch())
+    if not subscriptions:
+        parser.error("choose at least one of --phase, --principal "
+                     "and --illumination")
+
+    watch = MoonWatch(Webhook(args.webhook) if args.webhook
+                      else print_json)
+    for subscription in subscriptions:
+        watch.add(subscription)
+
+    if args.list is not None:
+        for event in watch.events(now() + args.list):
+            print(event.to_json())
+        return
+    try:
+        watch.run()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""
+    Name: observation_planner.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: Find the best moon viewing windows for a year
+    A window is a stretch of night where the moon is above a chosen
+    altitude, the sun is below twilight and the illumination is in a
+    chosen range. Sun and moon positions are computed once an hour for
+    the year and shared by every site. Each site gets its altitudes
+    from those positions with the hour angle formula. Only the hours
+    where a condition changes are refined, by bisection on positions
+    interpolated between the hourly samples.
+
+    Windows shorter than an hour that start and end between two hourly
+    samples can be missed.
+"""
+import datetime
+import math
+import sys
+import time
+from typing import Dict, List, NamedTuple, Tuple
+# pip install ephem
+import ephem
+
+TWO_PI = 2 * math.pi
+# Earth's equatorial radius in AU, for the moon's parallax
+EARTH_RADIUS_AU = 6378.137 / 149597870.7
+
+
+# ------------------------- VIEWING WINDOW ------------------------------- #
+class ViewingWindow(NamedTuple):
+    """Times are UTC"""
+    night: datetime.date
+    start: datetime.datetime
+    end: datetime.datetime
+    # Percent, at the middle of the window
+    illumination: float
+    # Degrees, highest hourly sample in the window
+    max_altitude: float
+
+    @property
+    def hours(self) -> float:
+        return (self.end - self.start).total_seconds() / 3600
+
+
+def site_coordinates(site) -> Tuple[float, float]:
+    """
+    Latitude and longitude in degrees of a MoonClass, gazetteer City
+    or (lat, lng) tuple
+    """
+    if isinstance(site, tuple) and len(site) == 2:
+        lat, lng = site
+    else:
+        lat, lng = site.lat, site.lng
+    # MoonClass stores them as strings
+    return float(lat), float(lng)
+
+
+# --------------------------- PLANNER ------------------------------------ #
+class ObservationPlanner:
+    """
+    Example Usage:
+        planner = ObservationPlanner(2027, min_altitude=20,
+                                     min_illumination=30)
+        for window in planner.windows(MoonClass(gui_mode=False)):
+            print(window.night, window.hours)
+    """
+
+    def __init__(
+        self,
+        year: int,
+        min_altitude: float = 10.0,
+        twilight: float = -12.0,
+        min_illumination: float = 0.0,
+        max_illumination: float = 100.0,
+        tolerance: float = 60.0
+    ) -> None:
+        """
+        Args:
+            year: nights to plan, by local date of the evening
+            min_altitude: moon altitude in degrees
+            twilight: sun altitude in degrees, -12 is nautical twilight
+            min_illumination, max_illumination: percent
+            tolerance: seconds, accuracy of window start and end
+        """
+        self.year = year
+        self.min_altitude = min_altitude
+        self.twilight = twilight
+        self.min_illumination = min_illumination
+        self.max_illumination = max_illumination
+        # Altitudes are compared in radians
+        self._min_altitude = math.radians(min_altitude)
+        self._twilight = math.radians(twilight)
+        # Each bisection step halves the hour
+        self._steps = max(1, math.ceil(math.log2(3600 / tolerance)))
+        self._sample()
+
+# --------------------------- HOURLY SAMPLES ----------------------------- #
+    def _sample(self):
+        """
+        Geocentric positions once an hour. A day either side of the
+        year so nights at the ends of the year are complete.
+        """
+        start = ephem.Date(datetime.datetime(self.year, 1, 1)) - 1
+        end = ephem.Date(datetime.datetime(self.year + 1, 1, 1)) + 1
+        count = int(round((end - start) / ephem.hour)) + 1
+        self._start = float(start)
+
+        # Greenwich observer for the sidereal time
+        greenwich = ephem.Observer()
+        sun = ephem.Sun()
+        moon = ephem.Moon()
+
+        # Hour angle at Greenwich, declination, parallax, illumination
+        self._sun_h = sun_h = []
+        self._sun_dec = sun_dec = []
+        self._moon_h = moon_h = []
+        self._moon_dec = moon_dec = []
+        self._moon_hp = moon_hp = []
+        self._illumination = illumination = []
+        for i in range(count):
+            dte = start + i * ephem.hour
+            greenwich.date = dte
+            sidereal = float(greenwich.sidereal_time())
+            sun.compute(dte)
+            moon.compute(dte)
+            sun_h.append((sidereal - sun.g_ra) % TWO_PI)
+            sun_dec.append(float(sun.g_dec))
+            moon_h.append((sidereal - moon.g_ra) % TWO_PI)
+            moon_dec.append(float(moon.g_dec))
+            moon_hp.append(math.asin(EARTH_RADIUS_AU / moon.earth_distance))
+            illumination.append(moon.phase)
+
+# ------------------------------ ALTITUDES ------------------------------- #
+    def _conditions(self, i: int, f: float, sin_lat: float, cos_lat: float,
+                    lng: float) -> Tuple[bool, float]:
+        """
+        (window conditions met, moon altitude) at fraction f of the way
+        from hour i to hour i + 1, positions interpolated linearly
+        """
+        j = i + 1 if f else i
+        illumination = self._illumination[i] + f * (
+            self._illumination[j] - self._illumination[i])
+        if not (self.min_illumination <= illumination
+                <= self.max_illumination):
+            return False, None
+
+        # The hour angle grows about 15 degrees an hour, unwrap it
+        h = self._sun_h[i] + \
+            f * ((self._sun_h[j] - self._sun_h[i]) % TWO_PI)
+        dec = self._sun_dec[i] + f * (self._sun_dec[j] - self._sun_dec[i])
+        if _altitude(sin_lat, cos_lat, h + lng, dec) >= self._twilight:
+            return False, None
+
+        h = self._moon_h[i] + \
+            f * ((self._moon_h[j] - self._moon_h[i]) % TWO_PI)
+        dec = self._moon_dec[i] + \
+            f * (self._moon_dec[j] - self._moon_dec[i])
+        hp = self._moon_hp[i] + f * (self._moon_hp[j] - self._moon_hp[i])
+        altitude = _moon_altitude(sin_lat, cos_lat, h + lng, dec, hp)
+        return altitude > self._min_altitude, altitude
+
+    def _crossing(self, i: int, rising: bool, sin_lat, cos_lat,
+                  lng) -> float:
+        """Fraction of hour i where the conditions change, by bisection"""
+        low, high = 0.0, 1.0
+        for _ in range(self._steps):
+            middle = (low + high) / 2
+            ok = self._conditions(i, middle, sin_lat, cos_lat, lng)[0]
+            if ok == rising:
+                high = middle
+            else:
+                low = middle
+        return (low + high) / 2
+
+# ------------------------------ WINDOWS --------------------------------- #
+    def windows(self, site) -> List[ViewingWindow]:
+        """Viewing windows for one site, in time order"""
+        lat, lng = site_coordinates(site)
+        sin_lat = math.sin(math.radians(lat))
+        cos_lat = math.cos(math.radians(lat))
+        lng = math.radians(lng)
+        # Local mean time offset in days, to find the night
+        offset = math.degrees(lng) / 360 - 0.5
+
+        windows = []
+        start = None
+        max_altitude = None
+        previous = False
+        for i in range(len(self._sun_h)):
+            ok, altitude = self._conditions(i, 0.0, sin_lat, cos_lat, lng)
+            if ok and not previous:
+                # Conditions became true during the hour before
+                start = i - 1 + self._crossing(
+                    i - 1, True, sin_lat, cos_lat, lng) if i else 0.0
+                max_altitude = altitude
+            elif ok:
+                max_altitude = max(max_altitude, altitude)
+            elif previous:
+                end = i - 1 + self._crossing(
+                    i - 1, False, sin_lat, cos_lat, lng)
+                windows.append(
+                    self._window(start, end, max_altitude, offset))
+            previous = ok
+        if previous:
+            windows.append(self._window(
+                start, len(self._sun_h) - 1, max_altitude, offset))
+
+        return [w for w in windows if w.night.year == self.year]
+
+    def _window(self, start: float, end: float, max_altitude: float,
+                offset: float) -> ViewingWindow:
+        """Window from sample positions (hours) to dates"""
+        middle = (start + end) / 2
+        i = min(int(middle), len(self._illumination) - 2)
+        illumination = self._illumination[i] + (middle - i) * (
+            self._illumination[i + 1] - self._illumination[i])
+        start_date = self._start + start * ephem.hour
+        return ViewingWindow(
+            night=ephem.Date(start_date + offset).datetime().date(),
+            start=ephem.Date(start_date).datetime(),
+            end=ephem.Date(self._start + end * ephem.hour).datetime(),
+            illumination=illumination,
+            max_altitude=math.degrees(max_altitude),
+        )
+
+    def plan(self, sites) -> Dict[object, List[ViewingWindow]]:
+        """Windows for each site, site -> windows"""
+        return {site: self.windows(site) for site in sites}
+
+
+def best_windows(windows: List[ViewingWindow],
+                 count: int = 10) -> List[ViewingWindow]:
+    """The longest windows, longest first"""
+    return sorted(windows, key=lambda w: w.hours, reverse=True)[:count]
+
+
+# ------------------------- ALTITUDE FORMULAS ---------------------------- #
+def _altitude(sin_lat: float, cos_lat: float, h: float,
+              dec: float) -> float:
+    """Altitude in radians from local hour angle and declination"""
+    return math.asin(sin_lat * math.sin(dec) +
+                     cos_lat * math.cos(dec) * math.cos(h))
+
+
+def _moon_altitude(sin_lat: float, cos_lat: float, h: float, dec: float,
+                   hp: float) -> float:
+    """
+    Apparent altitude of the moon in radians. The moon is close enough
+    that parallax lowers it by up to a degree, then refraction raises
+    it (Saemundsson's formula) like ephem's default atmosphere.
+    """
+    altitude = _altitude(sin_lat, cos_lat, h, dec)
+    altitude -= hp * math.cos(altitude)
+    degrees = math.degrees(altitude)
+    if degrees > -1:
+        degrees += 1.02 / math.tan(
+            math.radians(degrees + 10.3 / (degrees + 5.11))) / 60
+    return math.radians(degrees)
+
+
+# ------------------------------ MAIN ------------------------------------ #
+def main(site_count: int = 100):
+    """Plan a year for the default site and time a year for many sites"""
+    # Imported here so planning does not need tkinter
+    from moon_class import MoonClass
+    import gazetteer
+
+    year = datetime.date.today().year
+    t = time.perf_counter()
+    planner = ObservationPlanner(year, min_altitude=20,
+                                 min_illumination=25, max_illumination=90)
+    sample_time = time.perf_counter() - t
+
+    # MoonClass defaults to Scottsbluff, NE
+    home = MoonClass(gui_mode=False)
+    windows = planner.windows(home)
+    print(f"{len(windows)} windows in {year} at {home.lat}, {home.lng}")
+    print("Night       Start (UTC)   Hours  Illum  Max Alt")
+    for window in best_windows(windows, 10):
+        print(
+            f"{window.night}  {window.start:%m-%d %H:%M}  "
+            f"{window.hours:6.2f} {window.illumination:5.1f}%  "
+            f"{window.max_altitude:5.1f}°"
+        )
+
+    sites = gazetteer._gazetteer.cities[:site_count]
+    t = time.perf_counter()
+    plan = planner.plan(sites)
+    plan_time = time.perf_counter() - t
+    total = sum(len(w) for w in plan.values())
+    print(f"\nHourly samples: {sample_time:.2f} s")
+    print(f"{len(sites)} sites: {plan_time:.2f} s, {total} windows")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
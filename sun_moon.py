@@ -0,0 +1,178 @@
+"""
+    Name: sun_moon.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: Sun and moon geometry from one computation of each
+    Elongation, phase angle, illumination, position angle of the
+    bright limb and twilight all need the sun and the moon at the same
+    instant. SunMoon computes each body once per instant for an
+    observer and works everything else out from those two positions,
+    instead of every caller computing its own sun.
+"""
+import datetime
+import math
+import sys
+import time
+from typing import Iterable, List, NamedTuple
+# pip install ephem
+import ephem
+
+# Sun altitude in degrees where each twilight starts, day first
+TWILIGHT_LIMITS = (
+    (-0.833, "day"),
+    (-6.0, "civil twilight"),
+    (-12.0, "nautical twilight"),
+    (-18.0, "astronomical twilight"),
+)
+
+
+class Geometry(NamedTuple):
+    """Angles in degrees, seen from the observer"""
+    date: datetime.datetime
+    # Angle between the sun and the moon in the sky
+    elongation: float
+    # Sun - moon - earth angle, 0 full, 180 new
+    phase_angle: float
+    # Percent, worked out from the phase angle. As seen from the
+    # observer, so up to about 1% off ephem's geocentric moon.phase
+    illumination: float
+    # Position angle of the moon's bright limb, from north through east
+    bright_limb: float
+    # True from new moon to full moon
+    waxing: bool
+    sun_altitude: float
+    moon_altitude: float
+    moon_azimuth: float
+    # "day", "civil twilight", ... "night"
+    twilight: str
+
+
+def twilight_state(sun_altitude: float) -> str:
+    """Twilight name for a sun altitude in degrees"""
+    for limit, name in TWILIGHT_LIMITS:
+        if sun_altitude > limit:
+            return name
+    return "night"
+
+
+class SunMoon:
+    """
+    Example Usage:
+        sun_moon = SunMoon(lat="41.862302", lng="-103.6627088")
+        geometry = sun_moon.at(datetime.datetime.utcnow())
+        print(geometry.elongation, geometry.twilight)
+        for geometry in sun_moon.batch(dates):
+            ...
+    """
+
+    def __init__(self, lat: str = '41.862302',
+                 lng: str = '-103.6627088') -> None:
+        """
+        Args:
+            lat, lng: observer, defaults to Scottsbluff, NE, US like
+                MoonClass
+        """
+        self._observer = ephem.Observer()
+        self._observer.lat = str(lat)
+        self._observer.lon = str(lng)
+        # One of each body, recomputed for every instant
+        self._sun = ephem.Sun()
+        self._moon = ephem.Moon()
+
+# ------------------------------- AT ------------------------------------- #
+    def at(self, dte) -> Geometry:
+        """Geometry at dte, datetime (UTC) or ephem.Date"""
+        observer = self._observer
+        observer.date = dte
+        sun = self._sun
+        moon = self._moon
+        sun.compute(observer)
+        moon.compute(observer)
+
+        # Elongation from the two apparent positions
+        elongation = float(ephem.separation(sun, moon))
+
+        # Phase angle from the elongation and the two distances
+        # (Meeus, Astronomical Algorithms 48.3)
+        sun_distance = sun.earth_distance
+        moon_distance = moon.earth_distance
+        phase_angle = math.atan2(
+            sun_distance * math.sin(elongation),
+            moon_distance - sun_distance * math.cos(elongation)
+        )
+
+        # Position angle of the bright limb (Meeus 48.5), it points
+        # from the moon toward the sun
+        sun_ra, sun_dec = float(sun.ra), float(sun.dec)
+        moon_ra, moon_dec = float(moon.ra), float(moon.dec)
+        bright_limb = math.atan2(
+            math.cos(sun_dec) * math.sin(sun_ra - moon_ra),
+            math.sin(sun_dec) * math.cos(moon_dec)
+            - math.cos(sun_dec) * math.sin(moon_dec)
+            * math.cos(sun_ra - moon_ra)
+        )
+
+        sun_altitude = math.degrees(sun.alt)
+        return Geometry(
+            date=ephem.Date(observer.date).datetime(),
+            elongation=math.degrees(elongation),
+            phase_angle=math.degrees(phase_angle),
+            illumination=50 * (1 + math.cos(phase_angle)),
+            bright_limb=math.degrees(bright_limb) % 360,
+            # ephem's geocentric elongation is signed, east of the sun
+            # (waxing) is positive. The observer's parallax would blur
+            # the sign for an hour or two around new and full moon.
+            waxing=moon.elong > 0,
+            sun_altitude=sun_altitude,
+            moon_altitude=math.degrees(moon.alt),
+            moon_azimuth=math.degrees(moon.az),
+            twilight=twilight_state(sun_altitude),
+        )
+
+# ------------------------------ BATCH ----------------------------------- #
+    def batch(self, dates: Iterable) -> List[Geometry]:
+        """Geometry for many instants, reusing the observer and bodies"""
+        return [self.at(dte) for dte in dates]
+
+
+# ------------------------------ MAIN ------------------------------------ #
+def main(count: int = 2000):
+    """Combined geometry vs computing the sun separately per value"""
+    start = ephem.now()
+    dates = [ephem.Date(start + i * ephem.hour) for i in range(count)]
+
+    sun_moon = SunMoon()
+    t = time.perf_counter()
+    sun_moon.batch(dates)
+    combined = time.perf_counter() - t
+
+    # What callers did before: the moon for illumination, then a sun
+    # for twilight, then both again for elongation
+    observer = ephem.Observer()
+    observer.lat = '41.862302'
+    observer.lon = '-103.6627088'
+    t = time.perf_counter()
+    for dte in dates:
+        observer.date = dte
+        ephem.Moon(observer).phase
+        ephem.Sun(observer).alt
+        ephem.separation(ephem.Sun(observer), ephem.Moon(observer))
+    separate = time.perf_counter() - t
+
+    print(f"{count} instants")
+    print(f"combined  {combined / count * 1e6:7.1f} us/instant")
+    print(f"separate  {separate / count * 1e6:7.1f} us/instant")
+
+    now = sun_moon.at(start)
+    print(f"\nNow at {now.date:%Y-%m-%d %H:%M} UTC, {now.twilight}")
+    print(f"    elongation   {now.elongation:7.2f}°"
+          f" ({'waxing' if now.waxing else 'waning'})")
+    print(f"    illumination {now.illumination:7.2f}%"
+          f" (ephem {ephem.Moon(start).phase:.2f}%)")
+    print(f"    bright limb  {now.bright_limb:7.2f}°")
+    print(f"    moon         {now.moon_altitude:7.2f}° altitude, "
+          f"{now.moon_azimuth:.2f}° azimuth")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
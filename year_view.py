@@ -0,0 +1,152 @@
+"""
+    Name: year_view.py
+    Author: William A Loring
+    Created: 10-19-26
+    Purpose: Moon phase for every day of a year on one canvas
+    One row per month, one column per day. The year is computed in
+    one batch, every day shows one of 8 shared images, and changing
+    the year only reconfigures the canvas items that already exist.
+"""
+import calendar
+import datetime
+import tkinter as tk
+from typing import Callable, Optional
+import moon_class
+from month_phases import year_phase_bins
+
+# Cell size and margins in pixels
+CELL = 22
+LEFT = 40
+TOP = 48
+# Shrink the 57 pixel phase images to 19 pixels
+SUBSAMPLE = 3
+
+
+class YearView(tk.Toplevel):
+    def __init__(
+        self,
+        master,
+        year: Optional[int] = None,
+        on_select: Optional[Callable[[datetime.date], None]] = None
+    ) -> None:
+        """
+        Args:
+            master: parent window
+            year (optional): year to show, defaults to this year
+            on_select (optional): called with the date that was clicked
+        """
+        super().__init__(master)
+        self.title("Moon Phase Year")
+        self.resizable(False, False)
+        self._on_select = on_select
+        self._year = year or datetime.date.today().year
+
+        # Decoded once, shared by all 372 day cells
+        self._images = [
+            moon_class.get_phase_image(i, SUBSAMPLE, self) for i in range(8)
+        ]
+
+        self.create_widgets()
+        self.show_year(self._year)
+
+# ----------------------- CREATE WIDGETS --------------------------------- #
+    def create_widgets(self):
+        width = LEFT + 31 * CELL + 10
+        height = TOP + 12 * CELL + 10
+        self.canvas = tk.Canvas(
+            self, width=width, height=height,
+            background="black", highlightthickness=0
+        )
+        self.canvas.pack()
+
+        # Year title with previous and next arrows
+        self._title = self.canvas.create_text(
+            width // 2, 14, fill="white", font=("TkDefaultFont", 12, "bold")
+        )
+        self.canvas.create_text(
+            width // 2 - 60, 14, text="◀", fill="white", tags="previous")
+        self.canvas.create_text(
+            width // 2 + 60, 14, text="▶", fill="white", tags="next")
+
+        # Day numbers and month names never change
+        for day in range(31):
+            self.canvas.create_text(
+                LEFT + day * CELL + CELL // 2, TOP - 10,
+                text=str(day + 1), fill="gray70", font=("TkDefaultFont", 7)
+            )
+        for month in range(12):
+            self.canvas.create_text(
+                LEFT - 6, TOP + month * CELL + CELL // 2, anchor=tk.E,
+                text=calendar.month_abbr[month + 1], fill="gray70"
+            )
+
+        # One image item per cell, reused for every year
+        self._cells = [
+            [
+                self.canvas.create_image(
+                    LEFT + day * CELL + CELL // 2,
+                    TOP + month * CELL + CELL // 2
+                )
+                for day in range(31)
+            ]
+            for month in range(12)
+        ]
+
+        # Outline of the selected day
+        self._selection = self.canvas.create_rectangle(
+            0, 0, 0, 0, outline="gold", state=tk.HIDDEN)
+
+        # One binding for the whole grid
+        self.canvas.bind("<Button-1>", self.click)
+        self.canvas.tag_bind("previous", "<Button-1>",
+                             lambda e: self.show_year(self._year - 1))
+        self.canvas.tag_bind("next", "<Button-1>",
+                             lambda e: self.show_year(self._year + 1))
+        self.bind("<Left>", lambda e: self.show_year(self._year - 1))
+        self.bind("<Right>", lambda e: self.show_year(self._year + 1))
+        self.bind("<MouseWheel>", self.wheel)
+        self.bind("<Button-4>", lambda e: self.show_year(self._year - 1))
+        self.bind("<Button-5>", lambda e: self.show_year(self._year + 1))
+        self.bind("<Escape>", lambda e: self.destroy())
+
+# --------------------------- SHOW YEAR ---------------------------------- #
+    def show_year(self, year: int):
+        """Point the existing cells at the images for year"""
+        self._year = year
+        self.canvas.itemconfigure(self._title, text=str(year))
+        self.canvas.itemconfigure(self._selection, state=tk.HIDDEN)
+
+        for month, bins in year_phase_bins(year).items():
+            row = self._cells[month - 1]
+            for day, cell in enumerate(row, 1):
+                phase_index = bins.get(datetime.date(year, month, day)) \
+                    if day <= len(bins) else None
+                if phase_index is None:
+                    self.canvas.itemconfigure(cell, state=tk.HIDDEN)
+                else:
+                    self.canvas.itemconfigure(
+                        cell, image=self._images[phase_index],
+                        state=tk.NORMAL
+                    )
+
+# ----------------------------- EVENTS ----------------------------------- #
+    def click(self, event):
+        """Find the day under the pointer from its coordinates"""
+        day = (event.x - LEFT) // CELL + 1
+        month = (event.y - TOP) // CELL + 1
+        if not (1 <= month <= 12 and 1 <= day <= 31):
+            return
+        if day > calendar.monthrange(self._year, month)[1]:
+            return
+
+        x = LEFT + (day - 1) * CELL
+        y = TOP + (month - 1) * CELL
+        self.canvas.coords(self._selection, x, y, x + CELL, y + CELL)
+        self.canvas.itemconfigure(self._selection, state=tk.NORMAL)
+
+        if self._on_select is not None:
+            self._on_select(datetime.date(self._year, month, day))
+
+    def wheel(self, event):
+        # Windows and macOS report the wheel through event.delta
+        self.show_year(self._year + (-1 if event.delta > 0 else 1))